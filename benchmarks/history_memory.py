@@ -0,0 +1,139 @@
+"""
+History memory benchmark
+Measures memory held per history item with tracemalloc: the previous dict
+items versus HistoryRecord (slots, interned names, blob handles)
+
+Usage:
+    python benchmarks/history_memory.py [--items 10000] [--image-share 0.2] [--sensitive-share 0.1] [--json]
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Repository root (importable packages live here)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from services.blob_store import BlobStore
+from services.history_record import HistoryRecord
+
+PROCESSES = ("notepad.exe", "chrome.exe", "code.exe", "slack.exe", "outlook.exe")
+
+
+class StubImage:
+    """Image stand-in (pixel memory is outside the measurement either way)"""
+    width = 1920
+    height = 1080
+    
+    def getbands(self):
+        return ("R", "G", "B")
+
+
+def make_inputs(count: int, image_share: float, sensitive_share: float):
+    """Captured pastes as (type, process, content, preview, thumbnail, is_sensitive)"""
+    image = StubImage()
+    image_every = int(1 / image_share) if image_share else 0
+    sensitive_every = int(1 / sensitive_share) if sensitive_share else 0
+    inputs = []
+    for index in range(count):
+        # Process names arrive as fresh strings from the hook
+        process = PROCESSES[index % len(PROCESSES)].encode().decode()
+        if image_every and index % image_every == 0:
+            inputs.append(("image", process, image, image, image, False))
+            continue
+        content = f"paste {index}: " + "lorem ipsum dolor sit amet " * 10
+        preview = content[:200] + ("..." if len(content) > 200 else "")
+        is_sensitive = bool(sensitive_every) and index % sensitive_every == 1
+        inputs.append(("text", process, content, preview, None, is_sensitive))
+    return inputs
+
+
+def build_dicts(inputs):
+    """Previous representation (see PasteGuardianApp.record_history before HistoryRecord)"""
+    items = []
+    for index, (content_type, process, content, preview, thumbnail, is_sensitive) in enumerate(inputs):
+        items.append({
+            "timestamp": time.time(),
+            "type": content_type,
+            "preview": preview,
+            "content": content,
+            "full_content": preview if content_type == "image" else content,
+            "thumbnail": thumbnail,
+            "process": process,
+            "app_name": process.replace('.exe', '').title(),
+            "is_sensitive": is_sensitive,
+            "id": index + 1
+        })
+    return items
+
+
+def build_records(inputs):
+    """HistoryRecord representation"""
+    items = []
+    for index, (content_type, process, content, preview, thumbnail, is_sensitive) in enumerate(inputs):
+        record = HistoryRecord.from_capture(content_type, process, content, preview=preview,
+                                            thumbnail=thumbnail, is_sensitive=is_sensitive)
+        record.id = index + 1
+        items.append(record)
+    return items
+
+
+def measure(build, inputs) -> int:
+    """Bytes still allocated by build(inputs) (captured text excluded)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build(inputs)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return after - before
+
+
+def main():
+    """Run the benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description="Paste Guardian history memory benchmark")
+    parser.add_argument("--items", type=int, default=10000, help="History items to build")
+    parser.add_argument("--image-share", type=float, default=0.2, help="Fraction of image items")
+    parser.add_argument("--sensitive-share", type=float, default=0.1, help="Fraction of sensitive text items")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable summary")
+    args = parser.parse_args()
+    
+    # Records share one blob store; start from an empty, unbounded one
+    # (stub images cannot be spilled, and pixel memory is not measured anyway)
+    HistoryRecord.blobs = BlobStore(max_bytes=sys.maxsize)
+    
+    # Text is allocated up front: both forms keep the captured strings (sensitive records re-encode theirs)
+    inputs = make_inputs(args.items, args.image_share, args.sensitive_share)
+    dict_bytes = measure(build_dicts, inputs)
+    record_bytes = measure(build_records, inputs)
+    
+    summary = {
+        "items": args.items,
+        "image_share": args.image_share,
+        "sensitive_share": args.sensitive_share,
+        "dict_bytes": dict_bytes,
+        "record_bytes": record_bytes,
+        "dict_bytes_per_item": dict_bytes / args.items,
+        "record_bytes_per_item": record_bytes / args.items,
+        "saved_percent": 100 * (1 - record_bytes / dict_bytes)
+    }
+    
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    
+    print("=" * 50)
+    print(f"History memory ({args.items} items, {args.image_share:.0%} images, "
+          f"{args.sensitive_share:.0%} sensitive text)")
+    print("=" * 50)
+    print(f"Dict items:     {dict_bytes / 1024:8.1f} KiB ({summary['dict_bytes_per_item']:.0f} B/item)")
+    print(f"HistoryRecord:  {record_bytes / 1024:8.1f} KiB ({summary['record_bytes_per_item']:.0f} B/item)")
+    print(f"Saved:          {summary['saved_percent']:.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
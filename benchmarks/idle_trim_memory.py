@@ -0,0 +1,139 @@
+"""
+Idle trim memory benchmark
+Measures process RSS for the headless part of the idle trim: a full history of
+pasted screenshots, then blob spilling and gc.collect() as in PasteGuardian._idle_trim
+
+The popup and settings window are not built (no customtkinter here), so the
+numbers cover the engine, history and blob store only.
+
+Usage:
+    python benchmarks/idle_trim_memory.py [--items 10] [--width 1920] [--height 1080] [--json]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Repository root (importable packages live here)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from PIL import Image
+
+from config.config_manager import ConfigManager
+from core.app import PasteGuardianApp
+from services.blob_store import BlobStore
+from services.grant_service import GrantService
+from services.history_record import HistoryRecord
+from utils.image_utils import create_thumbnails, PREVIEW_SIZE, HISTORY_THUMBNAIL_SIZE
+
+MB = 1024 * 1024
+
+
+class InlineExecutor:
+    """Runs over-budget spills at once instead of on the background lane (measurements see the settled state)"""
+    
+    def submit(self, lane, func, *args, **kwargs):
+        func(*args, **kwargs)
+        return True
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process (psutil, or /proc on Linux; 0 if unavailable)"""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def make_screenshot(index: int, width: int, height: int):
+    """Captured clipboard image with the previews the monitor creates at capture time"""
+    image = Image.new("RGB", (width, height), (index * 20 % 256, 64, 128))
+    # Some detail so spilled PNGs are not trivially small
+    image.paste((255, 255, 255), (0, 0, width // 3, height // 4))
+    thumbnails = create_thumbnails(image, (PREVIEW_SIZE, HISTORY_THUMBNAIL_SIZE))
+    return {
+        "type": "image",
+        "content": image,
+        "preview": thumbnails[PREVIEW_SIZE],
+        "thumbnail": thumbnails[HISTORY_THUMBNAIL_SIZE]
+    }
+
+
+def main():
+    """Run the benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description="Paste Guardian idle trim memory benchmark")
+    parser.add_argument("--items", type=int, default=10, help="Image pastes in history (history_limit)")
+    parser.add_argument("--width", type=int, default=1920, help="Screenshot width")
+    parser.add_argument("--height", type=int, default=1080, help="Screenshot height")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable summary")
+    args = parser.parse_args()
+    
+    work_dir = tempfile.mkdtemp(prefix="paste_guardian_bench_")
+    config = ConfigManager(os.path.join(work_dir, "config.json"), os.path.join(work_dir, "history.json"))
+    config.config["history_limit"] = args.items
+    # Own blob store (default 64 MB budget) so spilled files land in the work directory
+    HistoryRecord.blobs = BlobStore(spill_dir=Path(work_dir) / "blobs", executor=InlineExecutor())
+    engine = PasteGuardianApp(
+        config=config,
+        grants=GrantService(grants_file=Path(work_dir) / "session_grants.json"),
+        persist_history=False
+    )
+    
+    gc.collect()
+    rss_start = rss_bytes()
+    
+    for index in range(args.items):
+        engine.record_history(make_screenshot(index, args.width, args.height), "mspaint.exe")
+    
+    gc.collect()
+    rss_before = rss_bytes()
+    images_before = engine.blobs.stats()["bytes"]
+    
+    # Same steps as PasteGuardian._idle_trim, minus the UI caches
+    started = time.perf_counter()
+    collected = gc.collect()
+    released = engine.blobs.trim()
+    trim_seconds = time.perf_counter() - started
+    rss_after = rss_bytes()
+    
+    engine.blobs.close()
+    
+    summary = {
+        "items": args.items,
+        "image_size": [args.width, args.height],
+        "rss_start": rss_start,
+        "rss_before_trim": rss_before,
+        "rss_after_trim": rss_after,
+        "images_in_memory_before": images_before,
+        "images_released": released,
+        "objects_collected": collected,
+        "trim_ms": trim_seconds * 1000
+    }
+    
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    
+    print("=" * 50)
+    print(f"Idle trim memory ({args.items} screenshots, {args.width}x{args.height})")
+    print("=" * 50)
+    print(f"RSS after startup:   {rss_start / MB:6.1f} MB")
+    print(f"RSS before trim:     {rss_before / MB:6.1f} MB ({images_before / MB:.1f} MB of decoded images)")
+    print(f"RSS after trim:      {rss_after / MB:6.1f} MB ({released / MB:.1f} MB spilled)")
+    print(f"Trim time:           {summary['trim_ms']:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+Popup latency benchmark
+Measures hook-to-popup latency (simulated Ctrl+V until the confirmation popup
+is shown) through the paste pipeline, the Tk wakeup queue and the pooled popup
+
+Needs a display (use xvfb-run on a headless Linux box). The real popup needs
+customtkinter; --popup tk shows a plain Toplevel instead, which isolates the
+pipeline and wakeup cost from popup rendering.
+
+Usage:
+    python benchmarks/popup_latency.py [--presses 50] [--interval-ms 100] [--popup real|tk] [--json]
+"""
+import argparse
+import json
+import os
+import queue
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Repository root (importable packages live here)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from config.config_manager import ConfigManager
+from core.app import PasteGuardianApp
+from core.pipeline import PastePipeline, TkBridge
+from services.grant_service import GrantService
+from services.metrics_service import metrics_service
+from services.task_executor import task_executor
+
+# Same wakeup scheme as PasteGuardian.post_to_ui
+UI_QUEUE_EVENT = "<<PasteGuardianUIQueue>>"
+
+
+def percentile(values, fraction: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class TkPopup:
+    """Plain Tk stand-in for ConfirmationPopup (pooled Toplevel with a label)"""
+    
+    def __init__(self, root):
+        import tkinter
+        self.window = tkinter.Toplevel(root)
+        self.window.withdraw()
+        self.label = tkinter.Label(self.window, width=60, height=8, anchor="nw", justify="left")
+        self.label.pack()
+    
+    def prepare(self):
+        self.window.update_idletasks()
+    
+    def present(self, clipboard_data: dict, process_name: str, **callbacks):
+        self.label.configure(text=f"{process_name}\n{clipboard_data.get('content', '')[:200]}")
+        self.window.deiconify()
+        self.window.lift()
+        self.window.update_idletasks()
+    
+    def close(self):
+        self.window.withdraw()
+
+
+class PopupHost:
+    """Tk side of the app reduced to what a prompt needs: wakeup queue and pooled popup"""
+    
+    def __init__(self, root, popup):
+        self.root = root
+        self.popup = popup
+        self.ui_queue = queue.Queue()
+        self._wakeup_lock = threading.Lock()
+        self._wakeup_pending = False
+        self.answered = threading.Event()
+        self.latencies = []
+        root.bind(UI_QUEUE_EVENT, self._process_ui_queue)
+    
+    def post_to_ui(self, callback):
+        """Queue a callback for the Tk thread and wake the main loop"""
+        self.ui_queue.put(callback)
+        with self._wakeup_lock:
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+        self.root.event_generate(UI_QUEUE_EVENT, when="tail")
+    
+    def _process_ui_queue(self, event=None):
+        """Drain the UI queue (Tk thread)"""
+        with self._wakeup_lock:
+            self._wakeup_pending = False
+        while True:
+            try:
+                callback = self.ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            callback()
+    
+    def present(self, clipboard_data: dict, process_name: str, resolve):
+        """Show the popup, record hook-to-visible latency and answer shortly after (Tk thread)"""
+        self.popup.present(
+            clipboard_data=clipboard_data,
+            process_name=process_name,
+            on_confirm=lambda data: None,
+            on_always_allow=lambda data: None,
+            on_cancel=lambda: None
+        )
+        latency = time.perf_counter() - clipboard_data["requested_at"]
+        metrics_service.record_latency("popup.hook_to_visible", latency)
+        self.latencies.append(latency * 1000)
+        
+        def answer():
+            self.popup.close()
+            resolve("cancel")
+            self.answered.set()
+        
+        self.root.after(1, answer)
+    
+    def dismiss(self, clipboard_data: dict):
+        self.popup.close()
+
+
+def build_popup(kind: str):
+    """Create the Tk root and the pooled popup"""
+    if kind == "real":
+        import customtkinter as ctk
+        from ui.confirmation_popup import ConfirmationPopup
+        ctk.set_appearance_mode("dark")
+        root = ctk.CTk()
+        root.withdraw()
+        return root, ConfirmationPopup(parent=root)
+    
+    import tkinter
+    root = tkinter.Tk()
+    root.withdraw()
+    return root, TkPopup(root)
+
+
+def main():
+    """Run the benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description="Paste Guardian hook-to-popup latency benchmark")
+    parser.add_argument("--presses", type=int, default=50, help="Simulated Ctrl+V presses")
+    parser.add_argument("--interval-ms", type=float, default=100.0, help="Delay after each answered prompt")
+    parser.add_argument("--popup", choices=("real", "tk"), default="real", help="Popup implementation")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable summary")
+    args = parser.parse_args()
+    
+    work_dir = tempfile.mkdtemp(prefix="paste_guardian_bench_")
+    engine = PasteGuardianApp(
+        config=ConfigManager(os.path.join(work_dir, "config.json"), os.path.join(work_dir, "history.json")),
+        grants=GrantService(grants_file=Path(work_dir) / "session_grants.json"),
+        persist_history=False
+    )
+    
+    root, popup = build_popup(args.popup)
+    host = PopupHost(root, popup)
+    # Pre-built like PasteGuardian._prewarm_popup, so every press measures the warm path
+    popup.prepare()
+    
+    pipeline = PastePipeline(
+        engine, TkBridge(host.post_to_ui),
+        present=host.present,
+        dismiss=host.dismiss,
+        paste=lambda clipboard_data, requested_at, answer: None,
+        reject=lambda clipboard_data: None
+    )
+    pipeline.start()
+    
+    missed = []
+    
+    def press_keys():
+        # Hook thread stand-in: one press at a time, each prompt answered before the next
+        for index in range(args.presses):
+            host.answered.clear()
+            clipboard_data = {
+                "type": "text",
+                "content": f"payload {index} user{index}@example.com",
+                "requested_at": time.perf_counter()
+            }
+            pipeline.submit(clipboard_data, "bench.exe")
+            if not host.answered.wait(5):
+                missed.append(index)
+            time.sleep(args.interval_ms / 1000)
+        host.post_to_ui(root.quit)
+    
+    root.after_idle(lambda: threading.Thread(target=press_keys, name="FakeHook", daemon=True).start())
+    root.mainloop()
+    
+    pipeline.stop()
+    task_executor.shutdown()
+    root.destroy()
+    
+    latencies = host.latencies
+    if not latencies:
+        print("✗ No popup was shown")
+        return 1
+    warm = latencies[1:] or latencies
+    summary = {
+        "popup": args.popup,
+        "presses": args.presses,
+        "shown": len(latencies),
+        "missed": len(missed),
+        "hook_to_visible_ms": {
+            "first": latencies[0],
+            "median": statistics.median(warm),
+            "p95": percentile(warm, 0.95),
+            "max": max(warm)
+        }
+    }
+    
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    
+    print("=" * 50)
+    print(f"Hook-to-popup latency ({args.popup} popup, {args.presses} presses)")
+    print("=" * 50)
+    print(f"First popup:  {summary['hook_to_visible_ms']['first']:.2f} ms")
+    print(f"Median:       {summary['hook_to_visible_ms']['median']:.2f} ms")
+    print(f"p95:          {summary['hook_to_visible_ms']['p95']:.2f} ms")
+    print(f"Max:          {summary['hook_to_visible_ms']['max']:.2f} ms")
+    print(f"Shown:        {summary['shown']} ({summary['missed']} missed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Split-UI benchmark
+Measures hook callback latency while the UI side is busy, with the UI in a
+child process (split) or in a thread of the hook process (thread)
+
+Usage:
+    python benchmarks/split_benchmark.py [--mode split|thread] [--requests 200] [--ui-work-ms 20] [--interval-ms 5] [--wait-for-answer]
+
+Presses faster than the UI answers replace the prompt on screen (like a user
+pressing Ctrl+V again), so most prompts end up replaced rather than answered;
+--wait-for-answer sends each press only after the previous paste went through.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Repository root (importable packages live here)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from config.config_manager import ConfigManager
+from core.app import PasteGuardianApp
+from core.ipc import IPCChannel, MessageType
+from core.split import FakeInjector, FakeMonitor, HookHost, run_fake_ui
+from services.grant_service import GrantService
+from services.metrics_service import metrics_service
+
+
+def percentile(values, fraction: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    """Run the benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description="Paste Guardian split-UI benchmark")
+    parser.add_argument("--mode", choices=("split", "thread"), default="split", help="Where the UI side runs")
+    parser.add_argument("--requests", type=int, default=200, help="Simulated Ctrl+V presses")
+    parser.add_argument("--ui-work-ms", type=float, default=20.0, help="CPU time the UI burns per prompt")
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="Delay between presses")
+    parser.add_argument("--wait-for-answer", action="store_true",
+                        help="Send each press after the previous prompt was answered and pasted")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable summary")
+    args = parser.parse_args()
+    
+    work_dir = tempfile.mkdtemp(prefix="paste_guardian_bench_")
+    engine = PasteGuardianApp(
+        config=ConfigManager(os.path.join(work_dir, "config.json"), os.path.join(work_dir, "history.json")),
+        grants=GrantService(grants_file=Path(work_dir) / "session_grants.json"),
+        persist_history=False
+    )
+    
+    hook_connection, ui_connection = multiprocessing.Pipe(duplex=True)
+    if args.mode == "split":
+        ui = multiprocessing.Process(target=run_fake_ui, args=(ui_connection, "confirm", args.ui_work_ms), daemon=True)
+    else:
+        ui = threading.Thread(target=run_fake_ui, args=(ui_connection, "confirm", args.ui_work_ms), daemon=True)
+    ui.start()
+    
+    pasted = threading.Event()
+    host = HookHost(IPCChannel(hook_connection), engine=engine, monitor_factory=FakeMonitor,
+                    injector_factory=lambda monitor: FakeInjector(monitor, on_inject=lambda data: pasted.set()))
+    server = threading.Thread(target=host.run, daemon=True)
+    server.start()
+    
+    # Time spent inside the hook callback for each press
+    latencies = []
+    unanswered = 0
+    for index in range(args.requests):
+        pasted.clear()
+        started = time.perf_counter()
+        host.monitor.trigger({"type": "text", "content": f"payload {index} user{index}@example.com"}, "bench.exe")
+        latencies.append((time.perf_counter() - started) * 1000)
+        if args.wait_for_answer and not pasted.wait(max(2.0, 50 * args.ui_work_ms / 1000)):
+            unanswered += 1
+        time.sleep(args.interval_ms / 1000)
+    
+    # Let the last decision arrive, then shut down (the UI closing its end stops the host)
+    time.sleep(max(0.5, 3 * args.ui_work_ms / 1000))
+    host.channel.send(MessageType.SHUTDOWN)
+    ui.join(timeout=2)
+    server.join(timeout=2)
+    
+    counters = metrics_service.snapshot()["counters"]
+    summary = {
+        "mode": args.mode,
+        "wait_for_answer": args.wait_for_answer,
+        "requests": args.requests,
+        "ui_work_ms": args.ui_work_ms,
+        "hook_latency_ms": {
+            "median": statistics.median(latencies),
+            "p95": percentile(latencies, 0.95),
+            "max": max(latencies)
+        },
+        "prompts_sent": counters.get("split.prompts_sent", 0),
+        "prompts_answered": counters.get("split.decisions_applied", 0),
+        "prompts_replaced": counters.get("split.prompts_replaced", 0),
+        "pastes_injected": len(host.injector.injected)
+    }
+    if args.wait_for_answer:
+        summary["unanswered"] = unanswered
+    
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    
+    print("=" * 50)
+    pacing = "each answered first" if args.wait_for_answer else f"every {args.interval_ms:g} ms"
+    print(f"Split-UI benchmark ({args.mode}, {args.requests} presses {pacing}, UI work {args.ui_work_ms:g} ms)")
+    print("=" * 50)
+    print(f"Hook latency median: {summary['hook_latency_ms']['median']:.3f} ms")
+    print(f"Hook latency p95:    {summary['hook_latency_ms']['p95']:.3f} ms")
+    print(f"Hook latency max:    {summary['hook_latency_ms']['max']:.3f} ms")
+    print(f"Prompts sent:        {summary['prompts_sent']}")
+    print(f"  answered:          {summary['prompts_answered']}")
+    print(f"  replaced by newer: {summary['prompts_replaced']}")
+    print(f"Pastes injected:     {summary['pastes_injected']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
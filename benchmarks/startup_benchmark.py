@@ -0,0 +1,130 @@
+"""
+Startup benchmark
+Measures time-to-hook-active and eager import cost using `python -X importtime`
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--top 15] [--json]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Repository root (main.py lives here)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Modules that must not be imported before the hook is active
+DEFERRED_MODULES = (
+    "customtkinter",
+    "pystray",
+    "PIL",
+    "win10toast",
+    "ui.confirmation_popup",
+    "ui.settings_window",
+)
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+HOOK_LINE = re.compile(r"Hook active in ([\d.]+) ms")
+
+
+def parse_importtime(stderr: str):
+    """Parse -X importtime output into (module, self_us, cumulative_us, depth) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def run_once(script: Path):
+    """Start the app in benchmark mode once and collect its timings"""
+    env = dict(os.environ)
+    env["PASTE_GUARDIAN_STARTUP_BENCHMARK"] = "1"
+    env["PASTE_GUARDIAN_DEV_MODE"] = "1"
+    env["PYTHONIOENCODING"] = "utf-8"
+    
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(script)],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        timeout=120
+    )
+    
+    hook_match = HOOK_LINE.search(result.stdout)
+    rows = parse_importtime(result.stderr)
+    return {
+        "returncode": result.returncode,
+        "hook_ms": float(hook_match.group(1)) if hook_match else None,
+        "import_ms": sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000,
+        "rows": rows,
+        "stderr_tail": [line for line in result.stderr.splitlines() if not line.startswith("import time:")][-5:]
+    }
+
+
+def main():
+    """Run the benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description="Paste Guardian startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--script", default=str(ROOT_DIR / "main.py"), help="Entry point")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable summary")
+    args = parser.parse_args()
+    
+    runs = [run_once(Path(args.script)) for _ in range(args.runs)]
+    ok_runs = [run for run in runs if run["hook_ms"] is not None]
+    
+    if not ok_runs:
+        print("✗ Hook never became active")
+        for line in runs[-1]["stderr_tail"]:
+            print(f"  {line}")
+        return 1
+    
+    # Slowest top-level imports (from the last successful run)
+    rows = ok_runs[-1]["rows"]
+    slowest = sorted((row for row in rows if row[3] == 0), key=lambda row: row[2], reverse=True)[:args.top]
+    imported = {row[0] for row in rows}
+    eager_heavy = sorted(
+        module for module in imported
+        if any(module == name or module.startswith(name + ".") for name in DEFERRED_MODULES)
+    )
+    
+    summary = {
+        "runs": len(ok_runs),
+        "time_to_hook_active_ms": statistics.median(run["hook_ms"] for run in ok_runs),
+        "eager_import_ms": statistics.median(run["import_ms"] for run in ok_runs),
+        "slowest_imports": [{"module": row[0], "cumulative_ms": row[2] / 1000} for row in slowest],
+        "eager_heavy_imports": eager_heavy
+    }
+    
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+    
+    print("=" * 50)
+    print(f"Startup benchmark ({summary['runs']} runs, median)")
+    print("=" * 50)
+    print(f"Time to hook active: {summary['time_to_hook_active_ms']:.1f} ms")
+    print(f"Eager import time:   {summary['eager_import_ms']:.1f} ms")
+    print("\nSlowest top-level imports:")
+    for entry in summary["slowest_imports"]:
+        print(f"  {entry['cumulative_ms']:8.1f} ms  {entry['module']}")
+    
+    if eager_heavy:
+        print(f"\n⚠️ Deferred modules imported before the hook: {', '.join(eager_heavy)}")
+    else:
+        print("\n✓ No deferred UI modules on the startup path")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,8 @@ Provides functionality to save and load user settings
 import json
 import os
 import base64
-from typing import Dict, List, Any
+import threading
+from typing import Dict, List, Any, Optional
 from io import BytesIO
 
 
@@ -18,11 +19,21 @@ class ConfigManager:
         self.default_config = {
             "monitor_text": True,
             "monitor_image": True,
+            "mask_sensitive_data": False,
             "whitelist": [],
             "popup_opacity": 0.95,
             "theme": "dark",
-            "accent_color": "#3B82F6"
+            "accent_color": "#3B82F6",
+            "history_limit": 10,
+            "history_memory_mb": 64,
+            "idle_trim_seconds": 30,
+            "session_grant_minutes": 10,
+            "persist_session_grants": False
         }
+        self.generation = 0  # Bumped on every change so views can skip stale refreshes
+        self._listeners = []  # Called with the key once a set() is saved
+        self._unsaved_keys = set()  # Keys set with save=False, announced by the next save_config()
+        self._unsaved_lock = threading.Lock()
         self.config = self.load_config()
     
     def load_config(self) -> Dict[str, Any]:
@@ -38,35 +49,61 @@ class ConfigManager:
                 return self.default_config.copy()
         return self.default_config.copy()
     
+    def reload(self) -> None:
+        """Re-read settings changed on disk by another process"""
+        self.config = self.load_config()
+        self.generation += 1
+    
+    def add_listener(self, callback) -> None:
+        """Register callback(key) run once a set() is saved"""
+        self._listeners.append(callback)
+    
     def save_config(self) -> bool:
-        """Save current settings to file"""
+        """Save current settings to file (then notify listeners of keys set without saving)"""
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self.config, f, indent=4, ensure_ascii=False)
-            return True
         except Exception as e:
             print(f"Failed to save configuration file: {e}")
             return False
+        
+        with self._unsaved_lock:
+            keys, self._unsaved_keys = self._unsaved_keys, set()
+        for key in keys:
+            self._notify(key)
+        return True
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
         return self.config.get(key, default)
     
-    def set(self, key: str, value: Any) -> None:
-        """Set configuration value"""
+    def set(self, key: str, value: Any, save: bool = True) -> None:
+        """Set configuration value (save=False: in memory only until the next save_config())"""
         self.config[key] = value
-        self.save_config()
+        self.generation += 1
+        with self._unsaved_lock:
+            self._unsaved_keys.add(key)
+        if save:
+            self.save_config()
+    
+    def _notify(self, key: str) -> None:
+        """Run change listeners (other processes re-read the saved file)"""
+        for callback in self._listeners:
+            try:
+                callback(key)
+            except Exception as e:
+                print(f"Config listener error: {e}")
     
     def get_whitelist(self) -> List[str]:
         """Get whitelist"""
         return self.config.get("whitelist", [])
     
-    def add_to_whitelist(self, process_name: str) -> None:
+    def add_to_whitelist(self, process_name: str, save: bool = True) -> None:
         """Add process to whitelist"""
         whitelist = self.get_whitelist()
         if process_name not in whitelist:
             whitelist.append(process_name)
-            self.set("whitelist", whitelist)
+            self.set("whitelist", whitelist, save)
     
     def remove_from_whitelist(self, process_name: str) -> None:
         """Remove process from whitelist"""
@@ -134,6 +171,20 @@ class ConfigManager:
                         except Exception as e:
                             print(f"content encoding failed: {e}")
                             history_item["content"] = None
+                    
+                    # Encode thumbnail (40x40 history list image)
+                    if history_item.get("thumbnail"):
+                        try:
+                            from PIL import Image
+                            img = history_item["thumbnail"]
+                            if isinstance(img, Image.Image):
+                                buffer = BytesIO()
+                                img.save(buffer, format="PNG")
+                                img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+                                history_item["thumbnail"] = img_base64
+                        except Exception as e:
+                            print(f"thumbnail encoding failed: {e}")
+                            history_item["thumbnail"] = None
                 
                 serializable_history.append(history_item)
             
@@ -148,8 +199,13 @@ class ConfigManager:
             print(f"Detailed error: {traceback.format_exc()}")
             return False
     
-    def load_history(self) -> List[Dict[str, Any]]:
-        """Load saved clipboard history"""
+    def load_history(self, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Load saved clipboard history
+        
+        Args:
+            since: Only return items saved after this timestamp (older images are not decoded)
+        """
         if not os.path.exists(self.history_file):
             return []
         
@@ -157,6 +213,9 @@ class ConfigManager:
             with open(self.history_file, 'r', encoding='utf-8') as f:
                 history_data = json.load(f)
             
+            if since is not None:
+                history_data = [item for item in history_data if item.get("timestamp", 0) > since]
+            
             # Restore Base64 encoded images
             restored_history = []
             for item in history_data:
@@ -195,6 +254,17 @@ class ConfigManager:
                         except Exception as e:
                             print(f"content decoding failed: {e}")
                             history_item["content"] = None
+                    
+                    # Decode thumbnail
+                    if history_item.get("thumbnail") and isinstance(history_item["thumbnail"], str):
+                        try:
+                            from PIL import Image
+                            img_data = base64.b64decode(history_item["thumbnail"])
+                            img = Image.open(BytesIO(img_data))
+                            history_item["thumbnail"] = img
+                        except Exception as e:
+                            print(f"thumbnail decoding failed: {e}")
+                            history_item["thumbnail"] = None
                 
                 restored_history.append(history_item)
             
@@ -0,0 +1,316 @@
+"""
+Paste Guardian core engine
+UI-free decision engine: policy evaluation, history recording, scanning and events
+"""
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from config.config_manager import ConfigManager
+from services.grant_service import GrantService
+from services.history_record import HistoryRecord
+from services.history_store import HistoryStore
+from services.notification_service import NotificationService
+from services.scan_service import ScanService, SensitiveSpan, scan_service
+from services.task_executor import task_executor
+from utils.image_utils import create_thumbnails, PREVIEW_SIZE, HISTORY_THUMBNAIL_SIZE
+
+
+class PasteDecision(NamedTuple):
+    """Outcome of evaluating a paste request"""
+    allowed: bool
+    reason: str
+
+
+class PasteGuardianApp:
+    """Headless engine shared by the Tk app, the tray and any other front-end"""
+    
+    # Decision reasons
+    REASON_WHITELIST = "whitelist"
+    REASON_GRANT = "session_grant"
+    REASON_UNMONITORED = "monitoring_disabled"
+    REASON_CONFIRM = "confirm"
+    
+    # Events emitted in addition to the NotificationService defaults
+    HISTORY_CHANGED = "history_changed"
+    HISTORY_SAVED = "history_saved"
+    
+    def __init__(self, config: Optional[ConfigManager] = None,
+                 grants: Optional[GrantService] = None,
+                 history: Optional[HistoryStore] = None,
+                 scanner: Optional[ScanService] = None,
+                 events: Optional[NotificationService] = None,
+                 persist_history: bool = True):
+        """
+        Initialize PasteGuardianApp
+        
+        Args:
+            config: Configuration manager
+            grants: Session grant table
+            history: History store (sized from config by default)
+            scanner: Sensitive data scanner
+            events: Event bus front-ends subscribe to
+            persist_history: Whether history is loaded from and saved to disk
+        """
+        self.config = config or ConfigManager()
+        self.grants = grants or GrantService(persist=self.config.get("persist_session_grants", False))
+        self.history = history or HistoryStore(limit=self.config.get("history_limit", 10))
+        self.scanner = scanner or scan_service
+        self.events = events or NotificationService()
+        self.persist_history = persist_history
+        
+        # History images beyond the byte budget spill to disk
+        self.blobs = HistoryRecord.blobs
+        self.blobs.set_budget(int(self.config.get("history_memory_mb", 64) * 1024 * 1024))
+        
+        # Protects whitelist reads and updates
+        self.config_lock = threading.Lock()
+        
+        # History saves run on the background lane, coalesced to one in flight
+        self._save_lock = threading.Lock()
+        self._save_pending = False
+        self._file_lock = threading.Lock()
+        
+        if self.persist_history:
+            self.load_history()
+    
+    def evaluate(self, clipboard_data: Dict[str, Any], process_name: str) -> PasteDecision:
+        """
+        Decide whether a paste may proceed without asking the user
+        
+        Args:
+            clipboard_data: Captured clipboard data
+            process_name: Process receiving the paste
+        
+        Returns:
+            PasteDecision (allowed=False means the user must confirm)
+        """
+        with self.config_lock:
+            if process_name in self.config.get_whitelist():
+                return PasteDecision(True, self.REASON_WHITELIST)
+        
+        content_type = clipboard_data.get("type")
+        if self.grants.is_granted(process_name, content_type):
+            return PasteDecision(True, self.REASON_GRANT)
+        
+        if not self.config.is_monitoring_enabled(content_type):
+            return PasteDecision(True, self.REASON_UNMONITORED)
+        
+        return PasteDecision(False, self.REASON_CONFIRM)
+    
+    def handle_paste_request(self, clipboard_data: Dict[str, Any], process_name: str) -> PasteDecision:
+        """
+        Evaluate a paste request, recording auto-approved pastes to history
+        
+        Args:
+            clipboard_data: Captured clipboard data
+            process_name: Process receiving the paste
+        
+        Returns:
+            PasteDecision; the caller pastes if allowed, otherwise asks the user
+        """
+        self.ensure_scanned(clipboard_data)
+        decision = self.evaluate(clipboard_data, process_name)
+        
+        self.events.notify("paste_request", {
+            "clipboard_data": clipboard_data,
+            "process_name": process_name,
+            "auto_approved": decision.allowed,
+            "reason": decision.reason,
+            "timestamp": time.time()
+        })
+        
+        if decision.allowed:
+            self.record_history(clipboard_data, process_name)
+        return decision
+    
+    def approve(self, clipboard_data: Dict[str, Any], process_name: str,
+                always: bool = False, grant_minutes: Optional[float] = None) -> None:
+        """
+        Record a user-approved paste
+        
+        Args:
+            clipboard_data: Captured clipboard data
+            process_name: Process receiving the paste
+            always: Add the process to the whitelist
+            grant_minutes: Allow this process and content type for N minutes
+        """
+        self.apply_approval(clipboard_data, process_name, always, grant_minutes)
+        self.record_approval(clipboard_data, process_name, added_to_whitelist=always)
+    
+    def apply_approval(self, clipboard_data: Dict[str, Any], process_name: str,
+                       always: bool = False, grant_minutes: Optional[float] = None) -> None:
+        """
+        Apply the policy part of an approval (whitelist or session grant) in memory
+        The config file is written by record_approval, off the paste path.
+        
+        Args:
+            clipboard_data: Captured clipboard data
+            process_name: Process receiving the paste
+            always: Add the process to the whitelist
+            grant_minutes: Allow this process and content type for N minutes
+        """
+        if always:
+            with self.config_lock:
+                self.config.add_to_whitelist(process_name, save=False)
+            self.events.notify_whitelist_added(process_name)
+        elif grant_minutes:
+            self.grants.grant(process_name, clipboard_data.get("type"), grant_minutes)
+    
+    def record_approval(self, clipboard_data: Dict[str, Any], process_name: str,
+                        added_to_whitelist: bool = False) -> None:
+        """
+        Persist an approval (config and history) and notify listeners
+        
+        Args:
+            clipboard_data: Captured clipboard data
+            process_name: Process receiving the paste
+            added_to_whitelist: Whether the approval whitelisted the process
+        """
+        if added_to_whitelist:
+            with self.config_lock:
+                self.config.save_config()
+        self.record_history(clipboard_data, process_name)
+        self.events.notify_paste_approved(clipboard_data, process_name, added_to_whitelist=added_to_whitelist)
+    
+    def deny(self, clipboard_data: Optional[Dict[str, Any]], process_name: str) -> None:
+        """
+        Record a denied paste
+        
+        Args:
+            clipboard_data: Captured clipboard data
+            process_name: Process that requested the paste
+        """
+        self.events.notify_paste_denied(process_name)
+    
+    def scan(self, text: str) -> List[SensitiveSpan]:
+        """Find sensitive data spans in text"""
+        return self.scanner.scan(text)
+    
+    def ensure_scanned(self, clipboard_data: Dict[str, Any]) -> None:
+        """Scan text content that was not scanned at capture time"""
+        if clipboard_data.get("type") != "text" or "sensitive_spans" in clipboard_data:
+            return
+        spans = self.scan(clipboard_data.get("content") or "")
+        clipboard_data["sensitive_spans"] = spans
+        clipboard_data["is_sensitive"] = bool(spans)
+    
+    def record_history(self, clipboard_data: Dict[str, Any], process_name: str) -> int:
+        """
+        Add a paste to history (keeps recent history_limit items)
+        
+        Args:
+            clipboard_data: Captured clipboard data
+            process_name: Process receiving the paste
+        
+        Returns:
+            History item id
+        """
+        content_type = clipboard_data.get("type")
+        content = clipboard_data.get("content")
+        
+        # Full images go to the blob store (spilled to disk beyond the byte budget); previews are reused
+        thumbnail = None
+        if content_type == "image" and content:
+            try:
+                # Reuse previews generated at capture time (150x150 and 40x40)
+                preview = clipboard_data.get("preview")
+                thumbnail = clipboard_data.get("thumbnail")
+                if not preview or not thumbnail:
+                    thumbnails = create_thumbnails(content, (PREVIEW_SIZE, HISTORY_THUMBNAIL_SIZE))
+                    preview = preview or thumbnails[PREVIEW_SIZE]
+                    thumbnail = thumbnail or thumbnails[HISTORY_THUMBNAIL_SIZE]
+            except Exception:
+                preview = None
+        else:
+            preview = clipboard_data.get("preview", "")
+        
+        # Compact record: images go to the blob store, sensitive text stays encrypted
+        history_item = HistoryRecord.from_capture(
+            content_type,
+            process_name,
+            content,
+            preview=preview,
+            thumbnail=thumbnail,
+            is_sensitive=clipboard_data.get("is_sensitive", False)
+        )
+        
+        # Oldest items beyond history_limit are evicted by the store
+        item_id, evicted = self.history.add(history_item)
+        for old_item in evicted:
+            # Free image memory
+            old_item.release()
+        
+        if self.persist_history:
+            self._schedule_save()
+        
+        self.events.notify(self.HISTORY_CHANGED, {"item_id": item_id})
+        return item_id
+    
+    def get_history(self) -> List[HistoryRecord]:
+        """Return clipboard history, latest first"""
+        return self.history.page(0, self.history.count())
+    
+    def save_history(self) -> None:
+        """Save history to file"""
+        try:
+            with self._file_lock:
+                self.config.save_history([item.to_dict() for item in self.history.get_items()])
+        except Exception as e:
+            print(f"History save failed: {e}")
+    
+    def _schedule_save(self) -> None:
+        """Save history on the background lane (saves requested meanwhile are merged)"""
+        with self._save_lock:
+            if self._save_pending:
+                return
+            self._save_pending = True
+        
+        if not task_executor.submit(task_executor.BACKGROUND, self._flush_save):
+            self._flush_save()
+    
+    def _flush_save(self) -> None:
+        """Write pending history changes"""
+        with self._save_lock:
+            self._save_pending = False
+        self.save_history()
+        self.events.notify(self.HISTORY_SAVED, {"count": self.history.count()})
+    
+    def load_history(self) -> None:
+        """Load saved history"""
+        try:
+            dropped = self.history.load([HistoryRecord.from_dict(item) for item in self.config.load_history()])
+            for old_item in dropped:
+                old_item.release()
+            print(f"✓ {self.history.count()} history items loaded")
+        except Exception as e:
+            print(f"History load failed: {e}")
+            for old_item in self.history.load([]):
+                old_item.release()
+    
+    def sync_history(self) -> int:
+        """
+        Add items another process saved after the newest item held here (split-UI mode)
+        Only the new items are decoded; the store evicts beyond history_limit as usual.
+        
+        Returns:
+            Number of items added
+        """
+        items = self.history.get_items()
+        since = items[-1].timestamp if items else None
+        
+        added = 0
+        for data in self.config.load_history(since=since):
+            item_id, evicted = self.history.add(HistoryRecord.from_dict(data))
+            for old_item in evicted:
+                old_item.release()
+            self.events.notify(self.HISTORY_CHANGED, {"item_id": item_id})
+            added += 1
+        return added
+    
+    def shutdown(self) -> None:
+        """Persist configuration and history, then delete spilled history images"""
+        self.config.save_config()
+        if self.persist_history:
+            self.save_history()
+        self.blobs.close()
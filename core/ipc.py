@@ -0,0 +1,206 @@
+"""
+IPC message format
+Compact framed messages between the hook/decision process and the UI process
+"""
+import io
+import json
+import struct
+import threading
+from enum import IntEnum
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from services.scan_service import SensitiveSpan
+
+
+class MessageType(IntEnum):
+    """Message types (one byte on the wire)"""
+    PROMPT = 1            # hook -> ui: paste needs confirmation
+    DECISION = 2          # ui -> hook: user's answer to a prompt
+    HISTORY_CHANGED = 3   # hook -> ui: history file was updated
+    CONFIG_CHANGED = 4    # both ways: reload config from disk
+    SHUTDOWN = 5          # both ways: quit the application
+
+
+class Message(NamedTuple):
+    """Decoded IPC message"""
+    type: MessageType
+    request_id: int
+    payload: Dict[str, Any]
+    blob: bytes
+
+
+class RemoteImage(NamedTuple):
+    """Dimensions of an image that stayed in the hook process"""
+    width: int
+    height: int
+
+
+# type (B), request id (I), JSON length (I), blob length (I)
+HEADER = struct.Struct("<BIII")
+
+
+def encode_message(message_type: MessageType, request_id: int = 0,
+                   payload: Optional[Dict[str, Any]] = None, blob: bytes = b"") -> bytes:
+    """
+    Encode a message as header + compact JSON + optional binary blob
+    
+    Args:
+        message_type: Message type
+        request_id: Prompt/decision correlation id (0 if unused)
+        payload: JSON-serializable fields
+        blob: Binary attachment (e.g. PNG preview)
+    
+    Returns:
+        Framed message bytes
+    """
+    body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8") if payload else b""
+    return HEADER.pack(message_type, request_id, len(body), len(blob)) + body + blob
+
+
+def decode_message(data: bytes) -> Message:
+    """
+    Decode a framed message
+    
+    Args:
+        data: Bytes produced by encode_message
+    
+    Returns:
+        Message
+    """
+    message_type, request_id, body_length, blob_length = HEADER.unpack_from(data)
+    body_end = HEADER.size + body_length
+    payload = json.loads(data[HEADER.size:body_end].decode("utf-8")) if body_length else {}
+    blob = bytes(data[body_end:body_end + blob_length])
+    return Message(MessageType(message_type), request_id, payload, blob)
+
+
+def encode_prompt(clipboard_data: Dict[str, Any], process_name: str) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Build a PROMPT payload from captured clipboard data
+    Images are sent as their PNG preview only - the original never leaves the hook process.
+    
+    Args:
+        clipboard_data: Captured clipboard data
+        process_name: Process receiving the paste
+    
+    Returns:
+        (payload, blob)
+    """
+    content_type = clipboard_data.get("type")
+    payload = {
+        "process": process_name,
+        "type": content_type,
+        "is_sensitive": clipboard_data.get("is_sensitive", False)
+    }
+    blob = b""
+    
+    if content_type == "text":
+        payload["content"] = clipboard_data.get("content", "")
+        payload["spans"] = [list(span) for span in clipboard_data.get("sensitive_spans") or []]
+    elif content_type == "image":
+        content = clipboard_data.get("content")
+        preview = clipboard_data.get("preview") or content
+        if content is not None:
+            payload["size"] = [content.width, content.height]
+        if preview is not None:
+            buffer = io.BytesIO()
+            preview.save(buffer, format="PNG")
+            blob = buffer.getvalue()
+    
+    return payload, blob
+
+
+def decode_prompt(message: Message) -> Tuple[Dict[str, Any], str]:
+    """
+    Rebuild popup clipboard data from a PROMPT message
+    
+    Args:
+        message: PROMPT message
+    
+    Returns:
+        (clipboard_data, process_name)
+    """
+    payload = message.payload
+    clipboard_data = {
+        "type": payload.get("type"),
+        "is_sensitive": payload.get("is_sensitive", False),
+        "request_id": message.request_id
+    }
+    
+    if clipboard_data["type"] == "text":
+        content = payload.get("content", "")
+        clipboard_data["content"] = content
+        clipboard_data["preview"] = content[:200] + ("..." if len(content) > 200 else "")
+        clipboard_data["sensitive_spans"] = [SensitiveSpan(*span) for span in payload.get("spans", [])]
+    elif clipboard_data["type"] == "image":
+        preview = None
+        if message.blob:
+            from PIL import Image
+            preview = Image.open(io.BytesIO(message.blob))
+            preview.load()
+        width, height = payload.get("size") or (preview.size if preview else (0, 0))
+        clipboard_data["preview"] = preview
+        clipboard_data["content"] = RemoteImage(width, height)
+    
+    return clipboard_data, payload.get("process", "")
+
+
+class IPCChannel:
+    """Thread-safe message channel over a multiprocessing Connection (pipe / named pipe)"""
+    
+    def __init__(self, connection):
+        """
+        Initialize IPCChannel
+        
+        Args:
+            connection: multiprocessing.connection.Connection
+        """
+        self.connection = connection
+        self._send_lock = threading.Lock()
+        self.closed = False
+    
+    def send(self, message_type: MessageType, request_id: int = 0,
+             payload: Optional[Dict[str, Any]] = None, blob: bytes = b"") -> bool:
+        """
+        Send a message
+        
+        Returns:
+            False if the other process is gone
+        """
+        data = encode_message(message_type, request_id, payload, blob)
+        try:
+            with self._send_lock:
+                self.connection.send_bytes(data)
+            return True
+        except (OSError, EOFError, ValueError):
+            self.closed = True
+            return False
+    
+    def recv(self, timeout: Optional[float] = None) -> Optional[Message]:
+        """
+        Receive the next message
+        
+        Args:
+            timeout: Seconds to wait (None = block)
+        
+        Returns:
+            Message, or None on timeout
+        
+        Raises:
+            EOFError: The other process closed the channel
+        """
+        if timeout is not None and not self.connection.poll(timeout):
+            return None
+        try:
+            return decode_message(self.connection.recv_bytes())
+        except (OSError, EOFError):
+            self.closed = True
+            raise EOFError("IPC channel closed")
+    
+    def close(self) -> None:
+        """Close the connection"""
+        self.closed = True
+        try:
+            self.connection.close()
+        except OSError:
+            pass
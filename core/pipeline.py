@@ -0,0 +1,308 @@
+"""
+Paste pipeline
+asyncio pipeline for paste requests: scan -> decide -> confirm -> approve -> paste -> persist -> notify
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from core.app import PasteGuardianApp
+from services.metrics_service import metrics_service
+from services.task_executor import TaskExecutor, task_executor
+
+
+class StageTimeouts(NamedTuple):
+    """Per-stage time limits in seconds"""
+    scan: float = 2.0
+    confirm: float = 300.0
+    paste: float = 5.0
+    persist: float = 10.0
+
+
+class StageTimeout(Exception):
+    """A pipeline stage did not finish within its time limit"""
+
+
+def _settle(future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Complete a future unless it was cancelled meanwhile (loop thread)"""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class TkBridge:
+    """Runs callables on the Tk thread and hands their results back to the asyncio loop"""
+    
+    def __init__(self, post_to_ui: Callable[[Callable], None]):
+        """
+        Initialize TkBridge
+        
+        Args:
+            post_to_ui: Thread-safe function queueing a callback on the Tk thread
+        """
+        self.post_to_ui = post_to_ui
+    
+    def call(self, func: Callable, *args) -> asyncio.Future:
+        """
+        Run func(*args) on the Tk thread (call from the loop)
+        
+        Returns:
+            Future resolved with the result on the asyncio loop
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def run():
+            try:
+                result = func(*args)
+            except Exception as e:
+                loop.call_soon_threadsafe(_settle, future, None, e)
+            else:
+                loop.call_soon_threadsafe(_settle, future, result)
+        
+        self.post_to_ui(run)
+        return future
+
+
+def run_on_lane(lane: str, func: Callable, *args, executor: Optional[TaskExecutor] = None, **kwargs) -> asyncio.Future:
+    """
+    Run a blocking call on a task executor lane (call from the loop)
+    
+    Args:
+        lane: TaskExecutor lane
+        func: Blocking callable
+        executor: Executor to use (shared task_executor by default)
+    
+    Returns:
+        Future resolved with the result on the asyncio loop
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def run():
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            loop.call_soon_threadsafe(_settle, future, None, e)
+        else:
+            loop.call_soon_threadsafe(_settle, future, result)
+    
+    if not (executor or task_executor).submit(lane, run):
+        future.set_exception(RuntimeError(f"{lane} lane rejected the task"))
+    return future
+
+
+class PastePipeline:
+    """
+    Processes paste requests in arrival order on a dedicated asyncio loop
+    
+    Front-end callbacks:
+        present(clipboard_data, process_name, resolve) - show the prompt (Tk thread);
+            resolve(action, **fields) may be called from any thread
+        dismiss(clipboard_data) - hide a prompt that was replaced or timed out (Tk thread)
+        paste(clipboard_data, requested_at, answer) - deliver the paste (blocking, paste lane);
+            answer holds the fields passed to resolve (None if auto-approved)
+        reject(clipboard_data) - drop presses held for a denied paste (blocking)
+    """
+    
+    def __init__(self, engine: PasteGuardianApp, bridge: TkBridge,
+                 present: Callable, dismiss: Callable, paste: Callable, reject: Callable,
+                 timeouts: Optional[StageTimeouts] = None,
+                 executor: Optional[TaskExecutor] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Initialize PastePipeline
+        
+        Args:
+            engine: Decision engine
+            bridge: Tk thread bridge
+            present, dismiss, paste, reject: Front-end callbacks (see class docstring)
+            timeouts: Per-stage time limits
+            executor: Executor whose lanes run blocking calls
+            loop: Event loop driven by the caller (tests); None = own loop thread
+        """
+        self.engine = engine
+        self.bridge = bridge
+        self.present = present
+        self.dismiss = dismiss
+        self.paste = paste
+        self.reject = reject
+        self.timeouts = timeouts or StageTimeouts()
+        self.executor = executor or task_executor
+        self.loop = loop
+        self._owns_loop = loop is None
+        self._thread: Optional[threading.Thread] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._prompt: Optional[asyncio.Task] = None  # Request waiting for the user
+        self._started = threading.Event()
+    
+    def start(self) -> None:
+        """Start the loop thread (or schedule the consumer on the caller's loop)"""
+        if self._started.is_set():
+            return
+        if self._owns_loop:
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run_loop, name="PastePipeline", daemon=True)
+            self._thread.start()
+            asyncio.run_coroutine_threadsafe(self._open(), self.loop).result()
+        else:
+            self.loop.run_until_complete(self._open())
+        self._started.set()
+    
+    def submit(self, clipboard_data: Dict[str, Any], process_name: str) -> None:
+        """Queue a paste request (thread-safe, returns immediately)"""
+        self.loop.call_soon_threadsafe(self._queue.put_nowait, (clipboard_data, process_name))
+    
+    def stop(self, timeout: float = 2.0) -> None:
+        """Cancel in-flight requests and stop the loop"""
+        if not self._started.is_set():
+            return
+        self._started.clear()
+        if self._owns_loop:
+            asyncio.run_coroutine_threadsafe(self._close(), self.loop).result(timeout)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+        else:
+            self.loop.run_until_complete(self._close())
+    
+    def _run_loop(self) -> None:
+        """Loop thread"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        self.loop.close()
+    
+    async def _open(self) -> None:
+        """Create the request queue and consumer on the loop"""
+        self._queue = asyncio.Queue()
+        self._consumer = asyncio.ensure_future(self._consume())
+    
+    async def _close(self) -> None:
+        """Cancel the consumer and any open prompt, then wait for them to unwind"""
+        tasks = [task for task in (self._consumer, self._prompt) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _consume(self) -> None:
+        """Handle requests one at a time, in arrival order"""
+        while True:
+            clipboard_data, process_name = await self._queue.get()
+            try:
+                await self._handle(clipboard_data, process_name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                metrics_service.increment("pipeline.errors")
+                print(f"Paste pipeline error: {e}")
+    
+    async def _stage(self, name: str, awaitable, timeout: float):
+        """Await one stage with a time limit and record its duration"""
+        started = self.loop.time()
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            metrics_service.increment(f"pipeline.{name}.timeout")
+            raise StageTimeout(f"{name} stage exceeded {timeout:g} s")
+        finally:
+            metrics_service.record_latency(f"pipeline.{name}", self.loop.time() - started)
+    
+    async def _handle(self, clipboard_data: Dict[str, Any], process_name: str) -> None:
+        """scan -> decide -> paste/persist or hand over to a prompt"""
+        # Usually a no-op: the monitor scans at capture time
+        await self._stage("scan", run_on_lane(
+            TaskExecutor.PASTE, self.engine.ensure_scanned, clipboard_data, executor=self.executor
+        ), self.timeouts.scan)
+        
+        decision = self.engine.evaluate(clipboard_data, process_name)
+        self.engine.events.notify("paste_request", {
+            "clipboard_data": clipboard_data,
+            "process_name": process_name,
+            "auto_approved": decision.allowed,
+            "reason": decision.reason,
+            "timestamp": time.time()
+        })
+        
+        if decision.allowed:
+            print(f"✓ {process_name} ({decision.reason}) - Auto allowed")
+            await self._paste(clipboard_data, clipboard_data.get("requested_at"), None)
+            await self._stage("persist", run_on_lane(
+                TaskExecutor.BACKGROUND, self.engine.record_history, clipboard_data, process_name,
+                executor=self.executor
+            ), self.timeouts.persist)
+            return
+        
+        # A new prompt replaces the open one (its paste counts as denied)
+        if self._prompt is not None and not self._prompt.done():
+            self._prompt.cancel()
+            await asyncio.gather(self._prompt, return_exceptions=True)
+        self._prompt = asyncio.ensure_future(self._confirm(clipboard_data, process_name))
+    
+    async def _confirm(self, clipboard_data: Dict[str, Any], process_name: str) -> None:
+        """Ask the user, then apply the answer"""
+        answer = self.loop.create_future()
+        
+        def resolve(action: str, **fields):
+            decided_at = time.perf_counter()
+            self.loop.call_soon_threadsafe(_settle, answer, (action, fields, decided_at))
+        
+        try:
+            await self.bridge.call(self.present, clipboard_data, process_name, resolve)
+            action, fields, decided_at = await self._stage("confirm", answer, self.timeouts.confirm)
+        except asyncio.CancelledError:
+            # Replaced by a newer prompt or shutting down
+            self._abandon(clipboard_data, process_name)
+            raise
+        except StageTimeout:
+            print("⚠️ Confirmation timed out - paste denied")
+            self._abandon(clipboard_data, process_name)
+            return
+        
+        if action == "cancel":
+            self.reject(clipboard_data)
+            self.engine.deny(clipboard_data, process_name)
+            return
+        
+        always = action == "always_allow"
+        try:
+            # Whitelist/grant before the keystroke, so the next press is not prompted again
+            # while the background lane is busy
+            await self._stage("approve", run_on_lane(
+                TaskExecutor.PASTE,
+                self.engine.apply_approval,
+                clipboard_data,
+                process_name,
+                always=always,
+                grant_minutes=fields.get("minutes") if action == "allow_for" else None,
+                executor=self.executor
+            ), self.timeouts.paste)
+            await self._paste(clipboard_data, decided_at, fields)
+            await self._stage("persist", run_on_lane(
+                TaskExecutor.BACKGROUND,
+                self.engine.record_approval,
+                clipboard_data,
+                process_name,
+                added_to_whitelist=always,
+                executor=self.executor
+            ), self.timeouts.persist)
+        except Exception as e:
+            # Nobody awaits prompt tasks - report here
+            metrics_service.increment("pipeline.errors")
+            print(f"Paste pipeline error: {e}")
+    
+    def _abandon(self, clipboard_data: Dict[str, Any], process_name: str) -> None:
+        """Deny an unanswered prompt and take it down"""
+        self.bridge.post_to_ui(lambda: self.dismiss(clipboard_data))
+        self.reject(clipboard_data)
+        self.engine.deny(clipboard_data, process_name)
+    
+    async def _paste(self, clipboard_data: Dict[str, Any], requested_at: Optional[float],
+                     answer: Optional[Dict[str, Any]]) -> None:
+        """Deliver the paste on the paste lane"""
+        await self._stage("paste", run_on_lane(
+            TaskExecutor.PASTE, self.paste, clipboard_data, requested_at, answer, executor=self.executor
+        ), self.timeouts.paste)
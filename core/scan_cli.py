@@ -0,0 +1,149 @@
+"""
+Batch sensitive-data scanner
+Runs the clipboard detection rules over files, directories or stdin and prints JSON-lines findings
+
+Usage:
+    python -m core.scan_cli [PATH ...] [--workers N] [--chunk-mb 8] [--show-match]
+
+Reads stdin when no path (or "-") is given. Throughput is reported on stderr.
+Exit status: 0 = no findings, 1 = findings, 2 = errors only.
+"""
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterator, List, Optional, Tuple
+
+from services.scan_service import scan_service
+
+# Inputs larger than this are split into chunks scanned in parallel
+DEFAULT_CHUNK_MB = 8
+
+# Bytes read on both sides of a chunk so matches crossing a boundary are found whole,
+# and only by the chunk they start in
+CHUNK_OVERLAP = 4096
+
+# (path, start, end) - byte range owned by one task
+ScanTask = Tuple[str, int, int]
+
+
+def iter_files(paths: List[str]) -> Iterator[str]:
+    """Expand directories into the regular files below them"""
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+                for name in sorted(file_names):
+                    yield os.path.join(dir_path, name)
+        else:
+            yield path
+
+
+def plan_tasks(files: Iterator[str], chunk_size: int, errors: List[dict]) -> Iterator[ScanTask]:
+    """Split every file into chunk_size byte ranges"""
+    for path in files:
+        try:
+            size = os.path.getsize(path)
+        except OSError as e:
+            errors.append({"path": path, "error": str(e)})
+            continue
+        for start in range(0, size, chunk_size):
+            yield (path, start, min(start + chunk_size, size))
+
+
+def scan_range(data, start: int, end: int, show_match: bool) -> List[dict]:
+    """Scan one byte range, keeping only matches that start inside it"""
+    findings = []
+    # Start early so a match running in from the previous chunk is consumed (and skipped) whole
+    scan_from = max(0, start - CHUNK_OVERLAP)
+    for span in scan_service.scan_bytes(data, scan_from, min(end + CHUNK_OVERLAP, len(data))):
+        if span.offset < start:
+            continue
+        if span.offset >= end:
+            break
+        finding = {"offset": span.offset, "length": span.length, "category": span.category}
+        if show_match:
+            finding["match"] = bytes(data[span.offset:span.offset + span.length]).decode("utf-8", "replace")
+        findings.append(finding)
+    return findings
+
+
+def scan_task(task: ScanTask, show_match: bool = False) -> Tuple[str, int, List[dict], Optional[str]]:
+    """
+    Scan one chunk of a file through a read-only memory map (worker process)
+    
+    Args:
+        task: (path, start, end) byte range
+        show_match: Include the matched text in findings
+    
+    Returns:
+        (path, bytes scanned, findings, error message)
+    """
+    path, start, end = task
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return path, end - start, scan_range(data, start, end, show_match), None
+    except (OSError, ValueError) as e:
+        return path, 0, [], str(e)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the scanner and print findings as JSON lines"""
+    parser = argparse.ArgumentParser(description="Paste Guardian sensitive-data scanner")
+    parser.add_argument("paths", nargs="*", default=["-"], help="Files or directories ('-' = stdin)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--chunk-mb", type=float, default=DEFAULT_CHUNK_MB, help="Chunk size per task in MB")
+    parser.add_argument("--show-match", action="store_true", help="Include matched text in findings")
+    args = parser.parse_args(argv)
+    
+    chunk_size = max(CHUNK_OVERLAP, int(args.chunk_mb * 1024 * 1024))
+    out = sys.stdout
+    errors: List[dict] = []
+    total_bytes = 0
+    total_findings = 0
+    started = time.perf_counter()
+    
+    def emit(path: str, findings: List[dict]) -> None:
+        nonlocal total_findings
+        for finding in findings:
+            out.write(json.dumps({"path": path, **finding}, ensure_ascii=False) + "\n")
+        total_findings += len(findings)
+    
+    paths = [path for path in args.paths if path != "-"]
+    if len(paths) != len(args.paths):
+        # stdin is not mappable - scan it in this process
+        data = sys.stdin.buffer.read()
+        total_bytes += len(data)
+        emit("-", scan_range(data, 0, len(data), args.show_match))
+    
+    if paths:
+        tasks = plan_tasks(iter_files(paths), chunk_size, errors)
+        with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            # map() keeps file/offset order in the output
+            for path, scanned, findings, error in executor.map(
+                    scan_task, tasks, repeat(args.show_match), chunksize=4):
+                if error:
+                    errors.append({"path": path, "error": error})
+                total_bytes += scanned
+                emit(path, findings)
+    
+    out.flush()
+    elapsed = time.perf_counter() - started
+    megabytes = total_bytes / (1024 * 1024)
+    for error in errors:
+        print(f"✗ {error['path']}: {error['error']}", file=sys.stderr)
+    print(f"✓ Scanned {megabytes:.1f} MB in {elapsed:.2f} s "
+          f"({megabytes / elapsed if elapsed > 0 else 0:.1f} MB/s), {total_findings} findings",
+          file=sys.stderr)
+    
+    if total_findings:
+        return 1
+    return 2 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+Two-process mode
+Hook/decision half of the split architecture plus fake backends for running it headless
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.app import PasteGuardianApp
+from core.ipc import IPCChannel, MessageType, decode_prompt, encode_prompt
+from services.metrics_service import metrics_service
+from services.task_executor import TaskExecutor, task_executor
+
+
+def _clipboard_monitor(on_paste_request: Callable):
+    """Default monitor backend (Windows keyboard hook)"""
+    from monitors.clipboard_monitor import ClipboardMonitor
+    return ClipboardMonitor(on_paste_request)
+
+
+def _paste_injector(monitor):
+    """Default injector backend (Windows SendInput)"""
+    from monitors.paste_injector import PasteInjector
+    return PasteInjector(send_paste=monitor.send_paste, coalescer=monitor.coalescer)
+
+
+class HookHost:
+    """Hook and decision process: keyboard hook, engine and paste injection - no UI"""
+    
+    def __init__(self, channel: IPCChannel, engine: Optional[PasteGuardianApp] = None,
+                 monitor_factory: Optional[Callable] = None,
+                 injector_factory: Optional[Callable] = None,
+                 executor: Optional[TaskExecutor] = None):
+        """
+        Initialize HookHost
+        
+        Args:
+            channel: IPC channel to the UI process
+            engine: Decision engine
+            monitor_factory: Builds the monitor from the paste request callback
+            injector_factory: Builds the injector from the monitor
+            executor: Executor whose paste lane handles requests and injection
+        """
+        self.channel = channel
+        self.engine = engine or PasteGuardianApp()
+        self.executor = executor or task_executor
+        self.monitor = (monitor_factory or _clipboard_monitor)(self.on_paste_request)
+        self.injector = (injector_factory or _paste_injector)(self.monitor)
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()  # Keeps prompts on the wire in request id order
+        self._pending: Dict[int, Tuple[dict, str]] = {}  # request id -> (clipboard data, process)
+        self._next_id = 0
+        self.stopped = threading.Event()
+        
+        # Keep the UI process in sync with state changed here (history once it is on disk)
+        self.engine.events.subscribe(PasteGuardianApp.HISTORY_SAVED,
+                                     lambda data: self.channel.send(MessageType.HISTORY_CHANGED))
+        self.engine.config.add_listener(
+            lambda key: self.channel.send(MessageType.CONFIG_CHANGED, payload={"key": key}))
+    
+    def run(self) -> None:
+        """Start the hook and serve UI messages until shutdown"""
+        self.monitor.start()
+        print("✓ Hook process ready")
+        
+        try:
+            while True:
+                try:
+                    message = self.channel.recv()
+                except EOFError:
+                    print("✗ UI process disconnected")
+                    break
+                
+                if message.type == MessageType.DECISION:
+                    self._on_decision(message.request_id, message.payload)
+                elif message.type == MessageType.CONFIG_CHANGED:
+                    self.engine.config.reload()
+                elif message.type == MessageType.SHUTDOWN:
+                    break
+        finally:
+            self.stop()
+    
+    def stop(self) -> None:
+        """Stop the hook, deny open prompts and persist state"""
+        if self.stopped.is_set():
+            return
+        self.monitor.stop()
+        
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for clipboard_data, _ in pending:
+            self.monitor.coalescer.resolve(clipboard_data.get("burst_key"), False)
+        
+        self.executor.shutdown()
+        self.engine.shutdown()
+        self.channel.close()
+        self.stopped.set()
+    
+    def on_paste_request(self, clipboard_data: dict, process_name: str) -> None:
+        """Paste request callback (hook thread) - hand off to the paste lane and return"""
+        if not self.executor.submit(TaskExecutor.PASTE, self._handle_paste_request, clipboard_data, process_name):
+            # Lane full or shut down - fail closed rather than block the hook
+            self.engine.deny(clipboard_data, process_name)
+            self.monitor.coalescer.resolve(clipboard_data.get("burst_key"), False)
+    
+    def _handle_paste_request(self, clipboard_data: dict, process_name: str) -> None:
+        """Decide locally and prompt through the UI process (paste lane)"""
+        decision = self.engine.handle_paste_request(clipboard_data, process_name)
+        if decision.allowed:
+            self._inject(clipboard_data, clipboard_data.get("requested_at"), "paste.auto_latency")
+            return
+        
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            # A new prompt replaces the one on screen; the replaced burst counts as denied
+            replaced = list(self._pending.values())
+            self._pending = {request_id: (clipboard_data, process_name)}
+        for old_data, _ in replaced:
+            self.monitor.coalescer.resolve(old_data.get("burst_key"), False)
+        if replaced:
+            metrics_service.increment("split.prompts_replaced", len(replaced))
+        
+        payload, blob = encode_prompt(clipboard_data, process_name)
+        with self._send_lock:
+            with self._lock:
+                if request_id not in self._pending:
+                    return  # Replaced by a newer prompt while encoding
+            sent = self.channel.send(MessageType.PROMPT, request_id, payload, blob)
+        if not sent:
+            # No UI to ask - fail closed
+            print("✗ UI process unavailable - paste denied")
+            self._on_decision(request_id, {"action": "cancel"})
+            return
+        metrics_service.increment("split.prompts_sent")
+        
+        requested_at = clipboard_data.get("requested_at")
+        if requested_at is not None:
+            metrics_service.record_latency("ipc.hook_to_prompt_sent", time.perf_counter() - requested_at)
+    
+    def _on_decision(self, request_id: int, payload: Dict[str, Any]) -> None:
+        """Apply the user's answer to a prompt"""
+        with self._lock:
+            entry = self._pending.pop(request_id, None)
+        if entry is None:
+            metrics_service.increment("split.decisions_stale")
+            return  # Replaced or already answered
+        metrics_service.increment("split.decisions_applied")
+        
+        clipboard_data, process_name = entry
+        action = payload.get("action")
+        if action == "cancel":
+            self.engine.deny(clipboard_data, process_name)
+            self.monitor.coalescer.resolve(clipboard_data.get("burst_key"), False)
+            return
+        
+        self.engine.approve(
+            clipboard_data,
+            process_name,
+            always=action == "always_allow",
+            grant_minutes=payload.get("minutes") if action == "allow_for" else None
+        )
+        self._inject(clipboard_data, time.perf_counter(), "paste.approved_latency")
+    
+    def _inject(self, clipboard_data: dict, requested_at: Optional[float], metric_name: str) -> None:
+        """Paste on the paste lane (decisions arrive on the channel thread)"""
+        self.executor.submit(
+            TaskExecutor.PASTE,
+            self.injector.inject,
+            clipboard_data,
+            target_hwnd=clipboard_data.get("target_hwnd"),
+            requested_at=requested_at,
+            metric_name=metric_name
+        )
+
+
+class NullCoalescer:
+    """Coalescer stand-in for fake monitors (every press is its own burst)"""
+    
+    def resolve(self, key, approved: bool) -> int:
+        return 0
+    
+    def discard(self, key) -> None:
+        pass
+
+
+class FakeMonitor:
+    """Monitor backend driven by trigger() instead of a keyboard hook"""
+    
+    def __init__(self, on_paste_request: Callable):
+        self.on_paste_request = on_paste_request
+        self.coalescer = NullCoalescer()
+        self.running = False
+    
+    def start(self) -> None:
+        self.running = True
+    
+    def stop(self) -> None:
+        self.running = False
+    
+    def trigger(self, clipboard_data: dict, process_name: str) -> None:
+        """Simulate Ctrl+V with the given clipboard content"""
+        clipboard_data.setdefault("requested_at", time.perf_counter())
+        self.on_paste_request(clipboard_data, process_name)
+
+
+class FakeInjector:
+    """Injector backend that records pastes instead of sending keys"""
+    
+    def __init__(self, monitor=None, on_inject: Optional[Callable[[dict], None]] = None):
+        self.injected: List[dict] = []
+        self.on_inject = on_inject
+    
+    def inject(self, clipboard_data: dict, target_hwnd: Optional[int] = None,
+               ready_event: Optional[threading.Event] = None,
+               requested_at: Optional[float] = None,
+               metric_name: str = "paste.approved_latency") -> None:
+        if requested_at is not None:
+            metrics_service.record_latency(metric_name, time.perf_counter() - requested_at)
+        self.injected.append(clipboard_data)
+        if self.on_inject:
+            self.on_inject(clipboard_data)
+
+
+def run_fake_ui(connection, action: str = "confirm", work_ms: float = 0.0) -> None:
+    """
+    UI process stand-in: answers every prompt after simulated UI work
+    
+    Args:
+        connection: multiprocessing Connection to the hook process
+        action: Decision sent for every prompt
+        work_ms: CPU time burned per prompt (popup build, image resize...)
+    """
+    channel = IPCChannel(connection)
+    try:
+        while True:
+            try:
+                message = channel.recv()
+                # Like the pooled popup, only the newest queued prompt is shown
+                while message.type == MessageType.PROMPT and channel.connection.poll(0):
+                    message = channel.recv()
+            except EOFError:
+                return
+            if message.type == MessageType.SHUTDOWN:
+                return
+            if message.type != MessageType.PROMPT:
+                continue
+            
+            decode_prompt(message)
+            deadline = time.perf_counter() + work_ms / 1000
+            while time.perf_counter() < deadline:
+                pass
+            channel.send(MessageType.DECISION, message.request_id, {"action": action})
+    finally:
+        channel.close()
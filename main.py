@@ -2,36 +2,87 @@
 Paste Guardian - Main Application
 Clipboard paste security program
 """
-import customtkinter as ctk
+import gc
 import threading
+import time
 import sys
 import os
 import win32event
 import win32api
 import winerror
-from pystray import Icon, Menu, MenuItem
-from PIL import Image, ImageDraw
 import queue
-from win10toast import ToastNotifier
-from config.config_manager import ConfigManager
+import psutil
+from typing import TYPE_CHECKING
+from core.app import PasteGuardianApp
+from core.ipc import IPCChannel, MessageType, decode_prompt
 from monitors.clipboard_monitor import ClipboardMonitor
-from ui.confirmation_popup import ConfirmationPopup
-from ui.settings_window import SettingsWindow
-from utils.icon_utils import get_icon_path, get_icon_image
+from monitors.paste_injector import PasteInjector
+from services.executable_index import executable_index
+from services.metrics_service import metrics_service
+from services.task_executor import task_executor
+
+if TYPE_CHECKING:
+    from core.pipeline import PastePipeline
+    from ui.confirmation_popup import ConfirmationPopup
 
 
 class PasteGuardian:
     """Main application class"""
     
-    def __init__(self):
-        # Configuration manager
-        self.config = ConfigManager()
-        
-        # Clipboard monitor
-        self.monitor = ClipboardMonitor(self.on_paste_request)
+    # Virtual event used to wake the Tk loop when UI work is queued
+    UI_QUEUE_EVENT = "<<PasteGuardianUIQueue>>"
+    
+    # Maximum callbacks run per drain before yielding to Tk
+    UI_QUEUE_BATCH_SIZE = 32
+    
+    # Minimum delay between history view updates (one frame at ~60 Hz)
+    HISTORY_REFRESH_INTERVAL_MS = 16
+    
+    # Heavy modules imported in the background once the tray is live
+    PRELOAD_MODULES = (
+        "customtkinter",
+        "PIL.Image",
+        "ui.confirmation_popup",
+        "ui.settings_window",
+        "win10toast",
+        "utils.icon_utils",
+    )
+    
+    def __init__(self, channel: IPCChannel = None):
+        # IPC channel to the hook process (split-UI mode only)
+        self.channel = channel
+        
+        # Headless decision engine (policy, history, scanning, events)
+        # In split-UI mode the hook process owns the history file; this copy is synced from it
+        self.engine = PasteGuardianApp(persist_history=self.channel is None)
+        self.engine.events.subscribe(PasteGuardianApp.HISTORY_CHANGED, lambda data: self._refresh_settings_history())
+        self.engine.events.subscribe("whitelist_added", lambda data: self._update_tray_menu())
+        
+        # Shared with the settings window
+        self.config = self.engine.config
+        self.history = self.engine.history
+        
+        if self.channel:
+            # Settings changed here must reach the hook process
+            self.config.add_listener(
+                lambda key: self.channel.send(MessageType.CONFIG_CHANGED, payload={"key": key}))
+        
+        # Clipboard monitor and paste injector (the hook process owns both in split-UI mode)
+        self.monitor = None
+        self.injector = None
+        if not self.channel:
+            self.monitor = ClipboardMonitor(self.on_paste_request)
+            
+            # Paste injector (waits on readiness signals instead of fixed sleeps)
+            self.injector = PasteInjector(
+                send_paste=self.monitor.send_paste,
+                coalescer=self.monitor.coalescer
+            )
         
         # UI queue (for UI updates from background threads)
         self.ui_queue = queue.Queue()
+        self._ui_wakeup_lock = threading.Lock()
+        self._ui_wakeup_pending = False
         
         # System tray icon
         self.tray_icon = None
@@ -39,24 +90,30 @@ class PasteGuardian:
         # Settings window
         self.settings_window = None
         
+        # Pooled confirmation popup (built once, reused for every request)
+        self.popup = None
+        
         # Currently displayed confirmation popup
         self.current_popup = None
         
+        # Paste pipeline (asyncio loop thread, started once the hook is live) and its open prompt's answer callback
+        self.pipeline = None
+        self._pipeline_lock = threading.Lock()
+        self._prompt_resolve = None
+        
         # Main event loop (hidden window)
         self.root = None
         
-        # Clipboard history (stores recent 10 items)
-        self.clipboard_history = []
+        # Coalesces history view refreshes to one per frame
+        self._history_refresh_lock = threading.Lock()
+        self._history_refresh_pending = False
         
-        # Thread synchronization locks
-        self.history_lock = threading.Lock()
-        self.config_lock = threading.Lock()
+        # Toast notifier for Windows notifications (created on first use)
+        self.toast = None
         
-        # Toast notifier for Windows notifications
-        self.toast = ToastNotifier()
-        
-        # Load saved history
-        self._load_history()
+        # Idle trim: pending after() job, last RSS report
+        self._idle_trim_job = None
+        self.last_idle_trim = None
         
     def start(self):
         """Start the application"""
@@ -71,22 +128,50 @@ class PasteGuardian:
         print("- Press Ctrl+V to see confirmation popup")
         print("=" * 50)
         
+        if self.channel:
+            # Split-UI mode: the hook runs in the parent process
+            threading.Thread(target=self._run_remote_channel, name="HookChannel", daemon=True).start()
+        else:
+            # Start clipboard monitoring first - only the hook path is imported so far
+            self.monitor.start()
+            self._record_hook_active()
+            self._get_pipeline()
+        
+        if os.environ.get('PASTE_GUARDIAN_STARTUP_BENCHMARK', '').lower() in ('1', 'true', 'yes'):
+            # Startup benchmark: stop once the hook is live
+            if self.monitor:
+                self.monitor.stop()
+            return
+        
+        # Start system tray icon (in separate thread; preloads UI modules when live)
+        tray_thread = threading.Thread(target=self._start_tray_icon, daemon=True)
+        tray_thread.start()
+        
+        # Index executable locations in the background (low priority)
+        executable_index.start()
+        
         # Create hidden customtkinter root window
+        import customtkinter as ctk
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
         self.root = ctk.CTk()
         self.root.withdraw()  # Hide the window
         
-        # Set window icon with delayed application for Windows 11 stability
-        self.root.after(200, self._apply_window_icon)
+        # Set window icon before customtkinter installs its default one
+        self._apply_window_icon()
+        
+        # Process UI queue on wakeup (no polling) and drain anything queued before start
+        self.root.bind(self.UI_QUEUE_EVENT, self._process_ui_queue)
+        self._process_ui_queue()
         
-        # Start clipboard monitoring
-        self.monitor.start()
+        # Pre-build confirmation popup once the main loop is idle
+        self.root.after_idle(self._prewarm_popup)
         
-        # Start system tray icon (in separate thread)
-        tray_thread = threading.Thread(target=self._start_tray_icon, daemon=True)
-        tray_thread.start()
+        # Then take what startup built out of the collector's generations
+        self.root.after_idle(self._freeze_startup_objects)
         
-        # Process UI queue
-        self._process_ui_queue()
+        # Trim once nothing has been shown for a while (cancelled by any window)
+        self.root.after_idle(self._schedule_idle_trim)
         
         # Auto-show settings window on first run (after slight delay)
         self.root.after(500, lambda: self._show_settings())
@@ -94,23 +179,48 @@ class PasteGuardian:
         # Main loop
         self.root.mainloop()
     
+    def _record_hook_active(self):
+        """Record time from process start until the paste hook is active"""
+        try:
+            elapsed = time.time() - psutil.Process(os.getpid()).create_time()
+        except Exception:
+            return
+        metrics_service.record_latency("startup.time_to_hook_active", elapsed)
+        print(f"✓ Hook active in {elapsed * 1000:.1f} ms")
+    
+    def _preload_ui_modules(self):
+        """Import heavy UI modules in the background so first use is fast"""
+        import importlib
+        
+        started_at = time.perf_counter()
+        for module_name in self.PRELOAD_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                print(f"Preload failed ({module_name}): {e}")
+        elapsed = time.perf_counter() - started_at
+        metrics_service.record_latency("startup.ui_preload", elapsed)
+        print(f"✓ UI modules preloaded in {elapsed * 1000:.1f} ms")
+    
+    def _on_tray_ready(self, icon):
+        """Called by pystray in a background thread once the tray icon exists"""
+        icon.visible = True
+        self._preload_ui_modules()
+    
     def _start_tray_icon(self):
         """Start system tray icon"""
-        # Load icon from embedded data
-        icon_image = get_icon_image()
+        from pystray import Icon
+        from utils.icon_utils import get_icon_image, TRAY_ICON_SIZE
+        
+        # Load icon from embedded data (decoded once, pre-rendered at tray size)
+        icon_image = get_icon_image(TRAY_ICON_SIZE)
         
         # Use embedded icon if available, otherwise create default
         if icon_image is None:
             print("[Tray] Using fallback icon")
             icon_image = self._create_tray_icon()
         else:
-            # Resize to 64x64 for tray icon
-            try:
-                icon_image = icon_image.resize((64, 64), Image.Resampling.LANCZOS)
-                print("[Tray] ✓ Embedded icon loaded successfully")
-            except Exception as e:
-                print(f"[Tray] Resize failed: {e}, using fallback")
-                icon_image = self._create_tray_icon()
+            print("[Tray] ✓ Embedded icon loaded successfully")
         
         # Create dynamic menu with whitelist count
         menu = self._create_tray_menu()
@@ -124,11 +234,13 @@ class PasteGuardian:
         )
         
         # Run tray icon
-        self.tray_icon.run()
+        self.tray_icon.run(setup=self._on_tray_ready)
     
     def _create_tray_menu(self):
         """Create dynamic tray menu with whitelist count"""
-        with self.config_lock:
+        from pystray import Menu, MenuItem
+        
+        with self.engine.config_lock:
             whitelist_count = len(self.config.get_whitelist())
         
         return Menu(
@@ -146,6 +258,8 @@ class PasteGuardian:
     
     def _create_tray_icon(self):
         """Create tray icon image (fallback)"""
+        from PIL import Image, ImageDraw
+        
         # Create simple icon (64x64)
         img = Image.new('RGB', (64, 64), color='#3B82F6')
         draw = ImageDraw.Draw(img)
@@ -157,49 +271,51 @@ class PasteGuardian:
         return img
     
     def _apply_window_icon(self):
-        """Apply icon to window with error handling (Windows 11 compatible)"""
-        try:
-            # Get icon path from embedded data
-            icon_path = get_icon_path()
-            
-            if not icon_path:
-                print("[Icon] ✗ Failed to get icon path")
-                return
-            
-            # Verify file existence
-            if not os.path.exists(icon_path):
-                print(f"[Icon] ✗ Temporary icon file not found: {icon_path}")
-                return
-            
-            # Check file size
-            file_size = os.path.getsize(icon_path)
-            if file_size == 0:
-                print(f"[Icon] ✗ Empty icon file: {icon_path}")
-                return
-            
-            print(f"[Icon] ✓ Icon file verified ({file_size} bytes)")
-            
-            # Apply icon to root window
-            self.root.iconbitmap(icon_path)
+        """Apply icon to main window (cached icon file, no delay needed)"""
+        from utils.icon_utils import apply_window_icon
+        
+        if apply_window_icon(self.root):
             print(f"[Icon] ✓ Successfully applied to main window")
-            
-        except Exception as e:
-            print(f"[Icon] ✗ Failed to apply icon: {e}")
-            import traceback
-            traceback.print_exc()
     
-    def _process_ui_queue(self):
-        """Process UI queue (check periodically)"""
+    def post_to_ui(self, callback):
+        """Queue a callback for the Tk thread and wake the main loop to run it"""
+        self.ui_queue.put(callback)
+        
+        # Only one wakeup is needed per drain
+        with self._ui_wakeup_lock:
+            if self._ui_wakeup_pending or not self.root:
+                return
+            self._ui_wakeup_pending = True
+        
         try:
-            while not self.ui_queue.empty():
+            self.root.event_generate(self.UI_QUEUE_EVENT, when="tail")
+        except Exception as e:
+            # Main loop not running (yet or anymore) - drained on start
+            print(f"UI wakeup failed: {e}")
+            with self._ui_wakeup_lock:
+                self._ui_wakeup_pending = False
+    
+    def _process_ui_queue(self, event=None):
+        """Drain UI queue in batches (runs on the Tk thread when woken up)"""
+        with self._ui_wakeup_lock:
+            self._ui_wakeup_pending = False
+        
+        for _ in range(self.UI_QUEUE_BATCH_SIZE):
+            try:
                 callback = self.ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            
+            try:
                 callback()
-        except queue.Empty:
-            pass
+            except Exception as e:
+                print(f"UI callback error: {e}")
+                import traceback
+                traceback.print_exc()
         
-        # Check again every 100ms
-        if self.root:
-            self.root.after(100, self._process_ui_queue)
+        # Batch limit reached - yield to Tk and continue when idle
+        if self.root and not self.ui_queue.empty():
+            self.root.after_idle(self._process_ui_queue)
     
     def on_paste_request(self, clipboard_data: dict, process_name: str):
         """Paste request callback"""
@@ -207,44 +323,67 @@ class PasteGuardian:
         print(f"- Process: {process_name}")
         print(f"- Data Type: {clipboard_data.get('type')}")
         
-        # Check whitelist
-        with self.config_lock:
-            is_whitelisted = process_name in self.config.get_whitelist()
-        
-        if is_whitelisted:
-            print(f"✓ Whitelisted process: {process_name} - Auto allowed")
-            # Record whitelisted paste to history
-            self._add_to_history(clipboard_data, process_name)
-            self._allow_paste(clipboard_data)
-            return
-        
-        # Check monitoring status by content type
-        content_type = clipboard_data.get("type")
-        if not self.config.is_monitoring_enabled(content_type):
-            print(f"✓ {content_type} monitoring disabled - Auto allowed")
-            # Record to history even when monitoring is disabled
-            self._add_to_history(clipboard_data, process_name)
-            self._allow_paste(clipboard_data)
-            return
-        
+        # Decide, prompt, paste and persist on the pipeline loop - the hook returns immediately
+        self._get_pipeline().submit(clipboard_data, process_name)
+    
+    def _get_pipeline(self) -> "PastePipeline":
+        """Get the paste pipeline (created and started on first use)"""
+        with self._pipeline_lock:
+            if self.pipeline is None:
+                from core.pipeline import PastePipeline, TkBridge
+                self.pipeline = PastePipeline(
+                    self.engine,
+                    TkBridge(self.post_to_ui),
+                    present=self._present_prompt,
+                    dismiss=self._dismiss_prompt,
+                    paste=self._deliver_paste,
+                    reject=self._reject_paste
+                )
+                self.pipeline.start()
+            return self.pipeline
+    
+    def _present_prompt(self, clipboard_data: dict, process_name: str, resolve):
+        """Show the confirmation prompt for a pipeline request (Tk thread)"""
         print("→ Showing confirmation popup...")
+        self._prompt_resolve = resolve
         
         # Show toast notification for blocked paste attempt
-        self._show_toast_notification(process_name, content_type)
-        
-        # Show confirmation popup (add to UI queue)
-        def show_popup():
-            self._show_confirmation_popup(clipboard_data, process_name)
-        
-        self.ui_queue.put(show_popup)
+        self._show_toast_notification(process_name, clipboard_data.get("type"))
+        self._show_confirmation_popup(clipboard_data, process_name)
+    
+    def _dismiss_prompt(self, clipboard_data: dict):
+        """Take down a prompt the pipeline replaced or timed out (Tk thread)"""
+        if self.current_popup and self.current_popup.clipboard_data is clipboard_data:
+            self.current_popup.close()
+            self.current_popup = None
+            self._schedule_idle_trim()
+    
+    def _deliver_paste(self, clipboard_data: dict, requested_at: float = None, answer: dict = None):
+        """Send the paste keystroke (paste lane) - after a prompt, once the popup is gone"""
+        self.injector.inject(
+            clipboard_data,
+            target_hwnd=clipboard_data.get("target_hwnd"),
+            ready_event=answer.get("ready_event") if answer else None,
+            requested_at=requested_at,
+            metric_name="paste.approved_latency" if answer is not None else "paste.auto_latency"
+        )
+    
+    def _reject_paste(self, clipboard_data: dict):
+        """Drop the Ctrl+V presses held for a denied paste"""
+        self.monitor.coalescer.resolve(clipboard_data.get("burst_key"), False)
     
     def _show_toast_notification(self, process_name: str, content_type: str):
         """Show Windows toast notification for paste detection"""
         def show_toast():
             try:
+                from win10toast import ToastNotifier
+                from utils.icon_utils import get_icon_path
+                
                 app_name = process_name.replace('.exe', '').title()
                 icon_path = get_icon_path()
                 
+                if self.toast is None:
+                    self.toast = ToastNotifier()
                 self.toast.show_toast(
                     "Paste Guardian",
                     f"Paste detected in {app_name}\nType: {content_type}",
@@ -255,8 +394,8 @@ class PasteGuardian:
             except Exception as e:
                 print(f"Toast notification error: {e}")
         
-        # Run in separate thread to avoid blocking
-        threading.Thread(target=show_toast, daemon=True).start()
+        # Run on the UI-support lane to avoid blocking
+        task_executor.submit(task_executor.UI, show_toast)
     
     def _show_confirmation_popup(self, clipboard_data: dict, process_name: str):
         """Show confirmation popup (must run in main thread)"""
@@ -265,204 +404,171 @@ class PasteGuardian:
         # Add to UI queue if not in main thread
         if threading.current_thread() != threading.main_thread():
             print("Called from background thread - forwarding to UI queue")
-            self.ui_queue.put(lambda: self._show_confirmation_popup(clipboard_data, process_name))
+            self.post_to_ui(lambda: self._show_confirmation_popup(clipboard_data, process_name))
             return
         
+        self._cancel_idle_trim()
         if self.current_popup:
+            # Replaced prompts are denied by the pipeline (or the hook process in split-UI mode)
             self.current_popup.close()
         
         opacity = self.config.get("popup_opacity", 0.95)
         
         try:
-            self.current_popup = ConfirmationPopup(
+            # Reuse the pre-built popup window (re-populated in place)
+            self.current_popup = self._get_popup()
+            self.current_popup.present(
                 clipboard_data=clipboard_data,
                 process_name=process_name,
                 on_confirm=lambda data: self._on_popup_confirm(data, process_name),
                 on_always_allow=lambda data: self._on_popup_always_allow(data, process_name),
-                on_cancel=self._on_popup_cancel,
-                opacity=opacity
+                on_cancel=lambda: self._on_popup_cancel(clipboard_data, process_name),
+                on_allow_for=lambda data: self._on_popup_allow_for(data, process_name),
+                opacity=opacity,
+                grant_minutes=self.config.get("session_grant_minutes", 10),
+                mask_sensitive=self.config.get("mask_sensitive_data", False)
             )
             
-            self.current_popup.show()
-            print("✓ Confirmation popup displayed")
+            # Hook-to-popup latency (Ctrl+V press until popup is visible)
+            requested_at = clipboard_data.get("requested_at")
+            if requested_at is not None:
+                latency = time.perf_counter() - requested_at
+                metrics_service.record_latency("popup.hook_to_visible", latency)
+                print(f"✓ Confirmation popup displayed ({latency * 1000:.1f} ms after Ctrl+V)")
+            else:
+                print("✓ Confirmation popup displayed")
         except Exception as e:
             print(f"✗ Popup display error: {e}")
             import traceback
             traceback.print_exc()
     
+    def _get_popup(self) -> "ConfirmationPopup":
+        """Get the pooled confirmation popup (created on first use)"""
+        if self.popup is None:
+            from ui.confirmation_popup import ConfirmationPopup
+            self.popup = ConfirmationPopup(parent=self.root)
+        return self.popup
+    
+    def _prewarm_popup(self):
+        """Build the confirmation popup while idle so the first paste shows instantly"""
+        try:
+            self._get_popup().prepare()
+            print("✓ Confirmation popup pre-built")
+        except Exception as e:
+            print(f"Popup pre-build failed: {e}")
+    
+    def _freeze_startup_objects(self):
+        """Freeze objects alive at the end of startup (modules, root window, pooled popup, config) so later collections skip them"""
+        gc.collect()
+        gc.freeze()
+    
     def _on_popup_confirm(self, clipboard_data: dict, process_name: str):
         """Popup confirm button clicked"""
-        print("Paste approved")
-        
-        # Add to history (at actual paste time)
-        self._add_to_history(clipboard_data, process_name)
-        
-        # Close popup and perform paste
-        self._allow_paste_with_focus(clipboard_data)
-        self.current_popup = None
+        self._answer_prompt(clipboard_data, "confirm")
     
     def _on_popup_always_allow(self, clipboard_data: dict, process_name: str):
         """Popup 'Always Allow' button clicked - add to whitelist"""
-        print(f"Added to whitelist: {process_name}")
-        
-        # Add to whitelist (thread-safe)
-        with self.config_lock:
-            self.config.add_to_whitelist(process_name)
-        
-        # Update tray menu to reflect new whitelist count
-        self._update_tray_menu()
-        
-        # Add to history
-        self._add_to_history(clipboard_data, process_name)
-        
-        # Perform paste
-        self._allow_paste_with_focus(clipboard_data)
-        self.current_popup = None
+        # Whitelisted on approval (tray menu updates on the whitelist_added event)
+        self._answer_prompt(clipboard_data, "always_allow")
     
-    def _on_popup_cancel(self):
+    def _on_popup_allow_for(self, clipboard_data: dict, process_name: str):
+        """Popup 'Allow for N min' button clicked - add session grant"""
+        minutes = self.config.get("session_grant_minutes", 10)
+        self._answer_prompt(clipboard_data, "allow_for", minutes=minutes)
+    
+    def _on_popup_cancel(self, clipboard_data: dict = None, process_name: str = None):
         """Popup cancel button clicked"""
-        print("Paste denied")
+        if clipboard_data:
+            self._answer_prompt(clipboard_data, "cancel")
+        else:
+            self.current_popup = None
+            self._schedule_idle_trim()
+    
+    def _answer_prompt(self, clipboard_data: dict, action: str, **fields):
+        """Hand the user's answer to the hook process (split-UI mode) or the paste pipeline"""
+        if not self._send_decision(clipboard_data, action, **fields):
+            # Paste once this popup is gone and the target window has focus again
+            resolve, self._prompt_resolve = self._prompt_resolve, None
+            if resolve:
+                resolve(action, ready_event=self.current_popup.closed if self.current_popup else None, **fields)
         self.current_popup = None
+        self._schedule_idle_trim()
     
-    def _allow_paste(self, clipboard_data: dict, process_name: str = None):
-        """Allow paste (for whitelisted processes)"""
-        # Already added to history in on_paste_request, so don't add here
-        
-        if clipboard_data["type"] == "text":
-            # Perform text paste
-            threading.Thread(
-                target=ClipboardMonitor.perform_paste,
-                args=(clipboard_data["content"],),
-                daemon=True
-            ).start()
-        elif clipboard_data["type"] == "image":
-            # Perform image paste
-            image_data = clipboard_data.get("content")
-            if image_data:
-                threading.Thread(
-                    target=ClipboardMonitor.perform_paste_with_focus,
-                    args=("", "image", image_data),
-                    daemon=True
-                ).start()
-    
-    def _allow_paste_with_focus(self, clipboard_data: dict):
-        """Allow paste with focus restoration (for popup approval)"""
-        content_type = clipboard_data.get("type")
-        
-        if content_type == "text":
-            # Text paste
-            threading.Thread(
-                target=ClipboardMonitor.perform_paste_with_focus,
-                args=(clipboard_data["content"], "text", None),
-                daemon=True
-            ).start()
-        elif content_type == "image":
-            # Image paste
-            threading.Thread(
-                target=ClipboardMonitor.perform_paste_with_focus,
-                args=("", "image", clipboard_data.get("content")),
-                daemon=True
-            ).start()
-    
-    def _add_to_history(self, clipboard_data: dict, process_name: str):
-        """Add to clipboard history (keep recent 10 items, memory management optimized)"""
-        import time
-        
-        with self.history_lock:  # Thread-safe access
-            content_type = clipboard_data.get("type")
-            content = clipboard_data.get("content")
-            
-            # For images, save only thumbnails for memory management
-            if content_type == "image" and content:
-                try:
-                    # Create thumbnail (150x150 or use preview)
-                    thumbnail = clipboard_data.get("preview")
-                    if not thumbnail and content:
-                        from PIL import Image
-                        thumbnail = content.copy()
-                        thumbnail.thumbnail((150, 150), Image.Resampling.LANCZOS)
-                    
-                    full_content = thumbnail  # Replace with thumbnail
-                except:
-                    full_content = None
-            else:
-                full_content = content
-            
-            history_item = {
-                "timestamp": time.time(),
-                "type": content_type,
-                "preview": clipboard_data.get("preview", ""),
-                "content": content,  # Original content (text) or thumbnail (image)
-                "full_content": full_content,  # Full content
-                "process": process_name,
-                "app_name": process_name.replace('.exe', '').title(),  # Program name
-                "is_sensitive": clipboard_data.get("is_sensitive", False)
-            }
-            
-            # Keep maximum 10 items
-            if len(self.clipboard_history) >= 10:
-                # Remove oldest item
-                old_item = self.clipboard_history.pop(0)
-                # Free image memory
-                if old_item.get("type") == "image" and old_item.get("full_content"):
-                    try:
-                        del old_item["full_content"]
-                        del old_item["content"]
-                    except:
-                        pass
-            
-            self.clipboard_history.append(history_item)
-        
-        # Save history
-        self._save_history()
+    def _send_decision(self, clipboard_data: dict, action: str, **fields) -> bool:
+        """Forward a popup answer to the hook process (split-UI mode only)"""
+        if not self.channel:
+            return False
+        
+        request_id = clipboard_data.get("request_id", 0)
+        payload = {"action": action, **fields}
+        # Send once the popup has been withdrawn so the paste lands in the target window
+        self.root.after_idle(lambda: self.channel.send(MessageType.DECISION, request_id, payload))
+        self.current_popup = None
+        return True
+    
+    def _run_remote_channel(self):
+        """Receive prompts and state changes from the hook process (background thread)"""
+        # History saved by the hook process before this one connected
+        self.engine.sync_history()
         
-        # Refresh settings history if settings window is open and history tab is active
-        self._refresh_settings_history()
+        while True:
+            try:
+                message = self.channel.recv()
+            except EOFError:
+                print("✗ Hook process disconnected")
+                self.post_to_ui(self._quit_application)
+                return
+            
+            if message.type == MessageType.PROMPT:
+                clipboard_data, process_name = decode_prompt(message)
+                self._show_toast_notification(process_name, clipboard_data.get("type"))
+                self.post_to_ui(lambda data=clipboard_data, name=process_name: self._show_confirmation_popup(data, name))
+            elif message.type == MessageType.HISTORY_CHANGED:
+                # History file was rewritten by the hook process - decode only the new items
+                # (each one notifies HISTORY_CHANGED, which refreshes the settings view)
+                self.engine.sync_history()
+            elif message.type == MessageType.CONFIG_CHANGED:
+                self.config.reload()
+                self._update_tray_menu()
+            elif message.type == MessageType.SHUTDOWN:
+                self.post_to_ui(self._quit_application)
+                return
     
     def get_clipboard_history(self):
         """Return clipboard history"""
-        with self.history_lock:  # Thread-safe access
-            return list(reversed(self.clipboard_history))  # Latest first
-    
-    def _save_history(self):
-        """Save history to file"""
-        try:
-            self.config.save_history(self.clipboard_history)
-        except Exception as e:
-            print(f"History save failed: {e}")
-    
-    def _load_history(self):
-        """Load saved history"""
-        try:
-            self.clipboard_history = self.config.load_history()
-            print(f"✓ {len(self.clipboard_history)} history items loaded")
-        except Exception as e:
-            print(f"History load failed: {e}")
-            self.clipboard_history = []
+        return self.engine.get_history()  # Latest first
     
     def _refresh_settings_history(self):
-        """Refresh history tab in settings window in real-time"""
-        def refresh():
-            if (self.settings_window and 
-                self.settings_window.window and 
-                self.settings_window.window.winfo_exists() and
-                hasattr(self.settings_window, 'current_tab') and
-                self.settings_window.current_tab == 'history'):
-                # Refresh if history tab is active
-                self.settings_window.show_history_settings()
-        
-        # Execute in main thread
-        if self.root:
-            try:
-                self.root.after(0, refresh)
-            except:
-                pass
+        """Schedule a history view update (coalesced to one per frame)"""
+        with self._history_refresh_lock:
+            if self._history_refresh_pending:
+                return
+            self._history_refresh_pending = True
+        
+        # Execute in main thread, after the current frame
+        self.post_to_ui(lambda: self.root.after(self.HISTORY_REFRESH_INTERVAL_MS, self._flush_history_refresh))
+    
+    def _flush_history_refresh(self):
+        """Apply pending history changes to the settings window"""
+        with self._history_refresh_lock:
+            self._history_refresh_pending = False
+        
+        if (self.settings_window and 
+            self.settings_window.window and 
+            self.settings_window.window.winfo_exists() and
+            hasattr(self.settings_window, 'current_tab') and
+            self.settings_window.current_tab == 'history'):
+            # Apply only the deltas if history tab is active
+            self.settings_window.sync_history()
     
     def _show_settings(self, icon=None, item=None):
         """Show settings window"""
         def show():
+            self._cancel_idle_trim()
             if not self.settings_window or not self.settings_window.window or not self.settings_window.window.winfo_exists():
-                self.settings_window = SettingsWindow(self.config, parent=self.root, app=self)
+                from ui.settings_window import SettingsWindow
+                self.settings_window = SettingsWindow(self.config, parent=self.root, app=self,
+                                                      on_close=self._on_settings_closed)
                 self.settings_window.show()
             else:
                 self.settings_window.window.focus()
@@ -472,22 +578,110 @@ class PasteGuardian:
         if self.root and threading.current_thread() == threading.main_thread():
             show()
         else:
-            self.ui_queue.put(show)
+            self.post_to_ui(show)
+    
+    def _on_settings_closed(self):
+        """Settings window closed - drop it and start the idle countdown (Tk thread)"""
+        self.settings_window = None
+        self._schedule_idle_trim()
+    
+    def _ui_open(self) -> bool:
+        """Whether a popup or the settings window is showing"""
+        if self.current_popup is not None:
+            return True
+        window = self.settings_window.window if self.settings_window else None
+        return bool(window and window.winfo_exists())
+    
+    def _schedule_idle_trim(self):
+        """(Re)start the idle countdown; the trim runs once no UI was shown for idle_trim_seconds (Tk thread)"""
+        self._cancel_idle_trim()
+        delay = self.config.get("idle_trim_seconds", 30)
+        if self.root and delay > 0:
+            self._idle_trim_job = self.root.after(int(delay * 1000), self._idle_trim)
+    
+    def _cancel_idle_trim(self):
+        """Cancel a pending idle trim (a window is being shown)"""
+        if self._idle_trim_job is not None:
+            self.root.after_cancel(self._idle_trim_job)
+            self._idle_trim_job = None
+    
+    def _idle_trim(self):
+        """Release UI caches and decoded images after a quiet period (Tk thread)"""
+        self._idle_trim_job = None
+        if self._ui_open():
+            return  # Rescheduled when it closes
+        
+        started = time.perf_counter()
+        rss_before = self._rss_bytes()
+        
+        # Last request's text and preview image held by the hidden popup
+        if self.popup:
+            self.popup.release_content()
+        
+        # Resized CTkImages of popup previews and history thumbnails
+        from ui.image_cache import image_cache
+        image_cache.clear()
+        
+        # Collect here, not on a worker: destroyed widgets hold Tcl variables that must be freed on the Tk thread
+        collected = gc.collect()
+        
+        def trim_images():
+            # Encoding PNGs can take a while - keep it off the Tk thread
+            released = self.engine.blobs.trim()
+            rss_after = self._rss_bytes()
+            self.last_idle_trim = {
+                "timestamp": time.time(),
+                "rss_before": rss_before,
+                "rss_after": rss_after,
+                "images_released": released,
+                "objects_collected": collected
+            }
+            metrics_service.increment("memory.idle_trim")
+            metrics_service.record_latency("memory.idle_trim", time.perf_counter() - started)
+            mb = 1024 * 1024
+            print(f"✓ Idle trim: RSS {rss_before / mb:.1f} → {rss_after / mb:.1f} MB "
+                  f"({released / mb:.1f} MB of images spilled, {collected} objects collected)")
+        
+        if not task_executor.submit(task_executor.BACKGROUND, trim_images):
+            trim_images()
+    
+    @staticmethod
+    def _rss_bytes() -> int:
+        """Resident set size of this process (0 if unavailable)"""
+        try:
+            return psutil.Process(os.getpid()).memory_info().rss
+        except Exception:
+            return 0
     
     def _quit_application(self, icon=None, item=None):
         """Quit application"""
         print("Quitting application...")
         
-        # Stop monitoring
-        self.monitor.stop()
+        if self.channel:
+            # The hook process owns the hook and persisted state - ask it to stop
+            self.channel.send(MessageType.SHUTDOWN)
+            self.channel.close()
+        else:
+            # Stop monitoring
+            self.monitor.stop()
         
         # Stop tray icon
         if self.tray_icon:
             self.tray_icon.stop()
         
+        # Deny any open prompt and stop the pipeline loop
+        if self.pipeline:
+            self.pipeline.stop()
+        
+        # Stop task lanes (drops queued work; history is saved below)
+        task_executor.shutdown()
+        
         # Save configuration and history
-        self.config.save_config()
-        self._save_history()
+        if not self.channel:
+            self.engine.shutdown()
+        else:
+            # History is saved by the hook process; only drop spilled images
+            self.engine.blobs.close()
         
         # Exit main loop
         if self.root:
@@ -514,6 +708,8 @@ def main():
             
             # Show toast notification
             try:
+                from win10toast import ToastNotifier
+                from utils.icon_utils import get_icon_path
                 toast = ToastNotifier()
                 icon_path = get_icon_path()
                 toast.show_toast(
@@ -531,11 +727,16 @@ def main():
         print("⚠ Development mode: Multiple instances allowed")
         mutex = None
     
-    # customtkinter default settings
-    ctk.set_appearance_mode("dark")
-    ctk.set_default_color_theme("blue")
+    if os.environ.get('PASTE_GUARDIAN_SPLIT_UI', '').lower() in ('1', 'true', 'yes'):
+        # Hook and decisions here, UI in a child process
+        try:
+            run_split()
+        finally:
+            if not dev_mode and mutex:
+                win32api.CloseHandle(mutex)
+        return
     
-    # Create and run application
+    # Create and run application (customtkinter is configured in start())
     app = PasteGuardian()
     
     try:
@@ -556,5 +757,41 @@ def main():
                 pass
 
 
+def run_split():
+    """Run the hook process and start the UI in a child process"""
+    import multiprocessing
+    from core.split import HookHost
+    
+    hook_connection, ui_connection = multiprocessing.Pipe(duplex=True)
+    ui_process = multiprocessing.Process(
+        target=run_ui_process,
+        args=(ui_connection,),
+        name="PasteGuardianUI",
+        daemon=True
+    )
+    ui_process.start()
+    ui_connection.close()
+    print(f"✓ UI process started (pid {ui_process.pid})")
+    
+    host = HookHost(IPCChannel(hook_connection))
+    try:
+        host.run()
+    except KeyboardInterrupt:
+        print("\nKeyboard interrupt detected")
+        host.stop()
+    ui_process.join(timeout=2)
+
+
+def run_ui_process(connection):
+    """UI process entry point (tray, popups, settings)"""
+    app = PasteGuardian(channel=IPCChannel(connection))
+    try:
+        app.start()
+    except KeyboardInterrupt:
+        pass
+
+
 if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -1,4 +1,6 @@
 """Monitors module"""
 from .clipboard_monitor import ClipboardMonitor
+from .paste_injector import PasteInjector
+from .paste_coalescer import PasteCoalescer
 
-__all__ = ['ClipboardMonitor']
+__all__ = ['ClipboardMonitor', 'PasteInjector', 'PasteCoalescer']
@@ -7,13 +7,18 @@ import time
 import pyperclip
 import win32clipboard
 import win32con
-from PIL import Image, ImageGrab
 from io import BytesIO
-from typing import Callable, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
 import keyboard  # Use keyboard instead of pynput
 import psutil
 import win32gui
 import win32process
+from monitors.paste_coalescer import PasteCoalescer
+from services.scan_service import scan_service
+from utils.image_utils import create_thumbnails, PREVIEW_SIZE, HISTORY_THUMBNAIL_SIZE
+
+if TYPE_CHECKING:
+    from PIL import Image  # Imported lazily at runtime (startup cost)
 
 
 class ClipboardMonitor:
@@ -26,8 +31,8 @@ class ClipboardMonitor:
         self.last_clipboard_content = None
         self.paste_pending = False  # Waiting for paste
         self.pending_data = None    # Pending data
-        self._allow_next_paste = False  # Flag to allow next paste (prevent infinite loop)
-        self._processing = False  # Processing flag
+        self._own_paste_until = 0.0  # Presses before this time are our own injected pastes
+        self.coalescer = PasteCoalescer()  # Groups burst presses into one decision
         
     def start(self):
         """Start monitoring"""
@@ -52,42 +57,59 @@ class ClipboardMonitor:
         
         print("Clipboard Stop monitoring")
     
+    def send_paste(self, count: int = 1):
+        """Send Ctrl+V without it being intercepted again"""
+        for _ in range(count):
+            # Prevent infinite loop: mark the injected press as approved
+            self._own_paste_until = time.perf_counter() + 0.1
+            keyboard.press_and_release('ctrl+v')
+    
     def _on_paste_hotkey(self):
         """Ctrl+V hotkey callback - Block paste and request confirmation"""
         if not self.running:
             return
         
         # Prevent infinite loop: Allow approved paste
-        if self._allow_next_paste:
+        if time.perf_counter() < self._own_paste_until:
             print("✓ Approved paste passed")
-            self._allow_next_paste = False
-            # Already blocked despite suppress=True, so do nothing here
             return
         
-        # Prevent duplicate processing
-        if self._processing:
-            print("⚠️ Already processing...")
+        requested_at = time.perf_counter()
+        
+        # Burst key: target window + clipboard content fingerprint
+        target_hwnd = win32gui.GetForegroundWindow()
+        burst_key = (target_hwnd, win32clipboard.GetClipboardSequenceNumber())
+        
+        action = self.coalescer.register(burst_key)
+        if action == PasteCoalescer.COALESCED:
+            print("Ctrl+V coalesced into pending decision")
+            return
+        if action == PasteCoalescer.DROP:
+            print("Ctrl+V dropped (burst denied)")
+            return
+        if action == PasteCoalescer.REPLAY:
+            # Burst already approved - replay at full speed
+            self.send_paste()
             return
         
-        self._processing = True
         print("Ctrl+V detected! (Blocked)")
         
-        try:
-            # Handle paste attempt
-            self._handle_paste_attempt()
-        finally:
-            self._processing = False
+        # Handle paste attempt
+        self._handle_paste_attempt(requested_at, target_hwnd, burst_key)
     
-    def _handle_paste_attempt(self):
+    def _handle_paste_attempt(self, requested_at: float = None, target_hwnd: int = None, burst_key=None):
         """Handle paste attempt"""
         if not self.running:
             print("Monitoring is not running")
+            self.coalescer.discard(burst_key)
             return
         
         print("Paste attempt detected - Starting processing")
         
-        # Get currently active process
-        active_process = self._get_active_process()
+        # Get currently active window and process (paste target)
+        if target_hwnd is None:
+            target_hwnd = win32gui.GetForegroundWindow()
+        active_process = self._get_active_process(target_hwnd)
         print(f"Active process: {active_process}")
         
         # Get clipboard content
@@ -95,16 +117,21 @@ class ClipboardMonitor:
         
         if clipboard_data:
             print(f"Clipboard data type: {clipboard_data.get('type')}")
+            clipboard_data["target_hwnd"] = target_hwnd
+            clipboard_data["requested_at"] = requested_at or time.perf_counter()
+            clipboard_data["burst_key"] = burst_key
             # Call callback (Show confirmation popup)
             self.on_paste_request(clipboard_data, active_process)
         else:
             print("No data in clipboard")
+            self.coalescer.discard(burst_key)
     
-    def _get_active_process(self) -> str:
+    def _get_active_process(self, hwnd: int = None) -> str:
         """Get currently active process name"""
         try:
             # Get active window handle
-            hwnd = win32gui.GetForegroundWindow()
+            if hwnd is None:
+                hwnd = win32gui.GetForegroundWindow()
             # Get process ID
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
             # Get process name
@@ -117,25 +144,43 @@ class ClipboardMonitor:
     def _get_clipboard_data(self) -> Optional[dict]:
         """Get clipboard data"""
         try:
-            # Check image
-            image = ImageGrab.grabclipboard()
+            # Sequence number identifies this clipboard content
+            clipboard_seq = win32clipboard.GetClipboardSequenceNumber()
+            
+            # Check image (keep raw DIB bytes so approval can write them back as-is)
+            dib = self._read_clipboard_dib()
+            if dib is not None:
+                image = self._decode_dib(dib)
+            else:
+                from PIL import ImageGrab
+                image = ImageGrab.grabclipboard()
             if image:
+                preview, thumbnail = self._create_image_previews(image)
                 return {
                     "type": "image",
                     "content": image,
-                    "preview": self._create_image_preview(image),
-                    "is_sensitive": False
+                    "dib": dib,  # Unmodified clipboard bytes (None if unavailable)
+                    "preview": preview,
+                    "thumbnail": thumbnail,
+                    "is_sensitive": False,
+                    "clipboard_seq": clipboard_seq
                 }
             
             # Check text
             text = pyperclip.paste()
             if text:
-                is_sensitive = self._check_sensitive_data(text)
+                # Scan once here (off the Tk thread); the popup reuses the spans
+                sensitive_spans = scan_service.scan(text)
+                if sensitive_spans:
+                    categories = sorted({span.category for span in sensitive_spans})
+                    print(f"⚠️ Sensitive information detected: {', '.join(categories)}")
                 return {
                     "type": "text",
                     "content": text,
                     "preview": text[:200] + ("..." if len(text) > 200 else ""),
-                    "is_sensitive": is_sensitive
+                    "is_sensitive": bool(sensitive_spans),
+                    "sensitive_spans": sensitive_spans,  # (offset, length, category)
+                    "clipboard_seq": clipboard_seq
                 }
             
         except Exception as e:
@@ -143,110 +188,58 @@ class ClipboardMonitor:
         
         return None
     
-    def _check_sensitive_data(self, text: str) -> bool:
-        """Detect sensitive information patterns (email, phone, card number)"""
-        import re
-        
-        patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email
-            r'\b\d{2,4}[-.]?\d{3,4}[-.]?\d{4}\b',  # Phone number
-            r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b',  # Card number
-            r'\b\d{6}[-]?\d{7}\b',  # ID number
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text):
-                print(f"⚠️ Sensitive information detected: {pattern}")
-                return True
+    @staticmethod
+    def _read_clipboard_dib() -> Optional[memoryview]:
+        """Read raw CF_DIB clipboard bytes without decoding them"""
+        try:
+            win32clipboard.OpenClipboard()
+        except Exception:
+            return None
         
-        return False
-    
-    def _create_image_preview(self, image: Image.Image) -> Image.Image:
-        """Generate image preview (thumbnail)"""
         try:
-            thumbnail = image.copy()
-            thumbnail.thumbnail((150, 150), Image.Resampling.LANCZOS)
-            return thumbnail
+            if not win32clipboard.IsClipboardFormatAvailable(win32con.CF_DIB):
+                return None
+            return memoryview(win32clipboard.GetClipboardData(win32con.CF_DIB))
         except Exception as e:
-            print(f"Failed to generate image preview: {e}")
-            return image
+            print(f"Failed to read clipboard DIB: {e}")
+            return None
+        finally:
+            win32clipboard.CloseClipboard()
     
     @staticmethod
-    def perform_paste(content: str):
-        """Perform actual paste"""
+    def _decode_dib(dib: memoryview) -> Optional["Image.Image"]:
+        """Open DIB bytes as a lazily decoded PIL image"""
+        from PIL import BmpImagePlugin
+        
         try:
-            # Update clipboard with approved content
-            pyperclip.copy(content)
-            
-            # Short delay
-            time.sleep(0.1)
-            
-            # Simulate Ctrl+V with keyboard library
-            keyboard.press_and_release('ctrl+v')
-            
-            print("✓ Paste executed")
-            
+            # BytesIO shares the underlying bytes object instead of copying it
+            return BmpImagePlugin.DibImageFile(BytesIO(dib.obj))
         except Exception as e:
-            print(f"Failed to perform paste: {e}")
+            print(f"Failed to decode clipboard DIB: {e}")
+            return None
     
-    @staticmethod
-    def perform_paste_with_focus(content: str, content_type: str = "text", image_data=None):
-        """Perform actual paste through focus restoration (text and image support)"""
+    def _check_sensitive_data(self, text: str) -> bool:
+        """Detect sensitive information patterns (email, phone, card number)"""
+        return scan_service.contains_sensitive(text)
+    
+    def _create_image_previews(self, image: "Image.Image") -> Tuple["Image.Image", "Image.Image"]:
+        """Generate popup preview and history thumbnail in one downsampling pass"""
         try:
-            # 1. Set content to clipboard
-            if content_type == "text":
-                pyperclip.copy(content)
-            elif content_type == "image" and image_data:
-                # Process image using win32clipboard
-                ClipboardMonitor._set_clipboard_image(image_data)
-            
-            # 2. Get currently active window (paste target)
-            target_hwnd = win32gui.GetForegroundWindow()
-            
-            # 3. Wait for popup to close and focus to be restored
-            time.sleep(0.15)
-            
-            # 4. Force focus on target window
-            if target_hwnd:
-                try:
-                    win32gui.SetForegroundWindow(target_hwnd)
-                    time.sleep(0.05)  # Stabilize focus
-                except:
-                    pass
-            
-            # 5. Send actual paste command
-            keyboard.press_and_release('ctrl+v')
-            
-            print(f"✓ Focus restore paste executed ({content_type})")
-            
+            thumbnails = create_thumbnails(image, (PREVIEW_SIZE, HISTORY_THUMBNAIL_SIZE))
+            return thumbnails[PREVIEW_SIZE], thumbnails[HISTORY_THUMBNAIL_SIZE]
         except Exception as e:
-            print(f"Failed to perform focus restore paste: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"Failed to generate image preview: {e}")
+            return image, image
     
     @staticmethod
-    def _set_clipboard_image(image):
+    def _set_clipboard_image(image, dib: memoryview = None):
         """Reliably set image to clipboard using win32clipboard (DIB format)"""
         try:
-            from PIL import Image
-            import io
-            
-            # Convert PIL image to BMP format
-            output = io.BytesIO()
-            
-            # Convert RGBA to RGB (remove transparency)
-            if image.mode == 'RGBA':
-                # Composite with white background
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                background.paste(image, mask=image.split()[3])  # Use alpha channel
-                image = background
-            elif image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Save as BMP format
-            image.save(output, 'BMP')
-            data = output.getvalue()[14:]  # Remove BMP header (14 bytes)
-            output.close()
+            if dib is not None:
+                # Unmodified clipboard content - write original bytes back as-is
+                data = dib
+            else:
+                data = ClipboardMonitor._encode_dib(image)
             
             # Try to open clipboard (max 3 attempts)
             max_retries = 3
@@ -276,3 +269,27 @@ class ClipboardMonitor:
                 win32clipboard.CloseClipboard()
             except:
                 pass
+    
+    @staticmethod
+    def _encode_dib(image) -> bytes:
+        """Encode PIL image as DIB bytes (BMP without file header)"""
+        from PIL import Image
+        import io
+        
+        # Convert PIL image to BMP format
+        output = io.BytesIO()
+        
+        # Convert RGBA to RGB (remove transparency)
+        if image.mode == 'RGBA':
+            # Composite with white background
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.split()[3])  # Use alpha channel
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        
+        # Save as BMP format
+        image.save(output, 'BMP')
+        data = output.getvalue()[14:]  # Remove BMP header (14 bytes)
+        output.close()
+        return data
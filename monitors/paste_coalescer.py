@@ -0,0 +1,130 @@
+"""
+Paste burst coalescing module
+Groups repeated Ctrl+V presses into a single decision per target and content
+"""
+import threading
+import time
+from typing import Callable, Dict, Hashable
+
+from services.metrics_service import metrics_service
+
+
+class PasteBurst:
+    """Presses that share one target window and clipboard content"""
+    
+    PENDING = "pending"
+    APPROVED = "approved"
+    DENIED = "denied"
+    
+    def __init__(self, key: Hashable, now: float):
+        self.key = key
+        self.started_at = now
+        self.last_at = now
+        self.state = PasteBurst.PENDING
+        self.extra_presses = 0  # Presses received while the decision was pending
+
+
+class PasteCoalescer:
+    """Coalesces key-repeat and macro paste bursts into one decision"""
+    
+    # Results of register()
+    NEW = "new"              # First press - needs a decision
+    COALESCED = "coalesced"  # Decision pending - press queued for replay
+    REPLAY = "replay"        # Burst already approved - paste immediately
+    DROP = "drop"            # Burst denied - swallow press
+    
+    def __init__(self, window: float = 0.5, pending_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize PasteCoalescer
+        
+        Args:
+            window: Quiet time (seconds) after which a decided burst ends
+            pending_timeout: Maximum time (seconds) a burst may wait for a decision
+            clock: Monotonic time source
+        """
+        self.window = window
+        self.pending_timeout = pending_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._bursts: Dict[Hashable, PasteBurst] = {}
+    
+    def register(self, key: Hashable) -> str:
+        """
+        Register a paste press
+        
+        Args:
+            key: Burst key (target window and content fingerprint)
+        
+        Returns:
+            One of NEW, COALESCED, REPLAY or DROP
+        """
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            
+            burst = self._bursts.get(key)
+            if burst is None:
+                self._bursts[key] = PasteBurst(key, now)
+                metrics_service.increment("paste.bursts")
+                return PasteCoalescer.NEW
+            
+            burst.last_at = now
+            if burst.state == PasteBurst.PENDING:
+                burst.extra_presses += 1
+                metrics_service.increment("paste.coalesced")
+                return PasteCoalescer.COALESCED
+            if burst.state == PasteBurst.APPROVED:
+                metrics_service.increment("paste.replayed")
+                return PasteCoalescer.REPLAY
+            
+            metrics_service.increment("paste.coalesced_dropped")
+            return PasteCoalescer.DROP
+    
+    def resolve(self, key: Hashable, approved: bool) -> int:
+        """
+        Record the decision for a burst
+        
+        Args:
+            key: Burst key passed to register()
+            approved: Whether the paste was approved
+        
+        Returns:
+            Number of coalesced presses to replay in addition to the first one
+        """
+        if key is None:
+            return 0
+        
+        with self._lock:
+            burst = self._bursts.get(key)
+            if burst is None:
+                return 0
+            
+            burst.state = PasteBurst.APPROVED if approved else PasteBurst.DENIED
+            burst.last_at = self._clock()
+            extra = burst.extra_presses
+            burst.extra_presses = 0
+        
+        if approved and extra:
+            metrics_service.increment("paste.replayed", extra)
+        return extra if approved else 0
+    
+    def discard(self, key: Hashable) -> None:
+        """
+        Forget a burst without a decision (e.g. empty clipboard)
+        
+        Args:
+            key: Burst key passed to register()
+        """
+        with self._lock:
+            self._bursts.pop(key, None)
+    
+    def _expire(self, now: float) -> None:
+        """Drop bursts that have gone quiet"""
+        expired = [
+            key for key, burst in self._bursts.items()
+            if (burst.state != PasteBurst.PENDING and now - burst.last_at > self.window)
+            or (burst.state == PasteBurst.PENDING and now - burst.started_at > self.pending_timeout)
+        ]
+        for key in expired:
+            del self._bursts[key]
@@ -0,0 +1,128 @@
+"""
+Paste injection module
+Sends approved pastes as soon as the target window is ready to receive them
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+import keyboard
+import pyperclip
+import win32clipboard
+import win32gui
+
+from services.metrics_service import metrics_service
+
+
+class PasteInjector:
+    """Delivers approved clipboard content to the target window"""
+    
+    def __init__(self, send_paste: Callable[[int], None] = None, coalescer=None,
+                 timeout: float = 0.5, poll_interval: float = 0.005):
+        """
+        Initialize PasteInjector
+        
+        Args:
+            send_paste: Function sending Ctrl+V a given number of times
+            coalescer: PasteCoalescer holding presses made while deciding
+            timeout: Maximum time to wait for each readiness signal (seconds)
+            poll_interval: Interval between readiness checks (seconds)
+        """
+        self.send_paste = send_paste or self._press_paste
+        self.coalescer = coalescer
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+    
+    def inject(self, clipboard_data: dict, target_hwnd: Optional[int] = None,
+               ready_event: Optional[threading.Event] = None,
+               requested_at: Optional[float] = None,
+               metric_name: str = "paste.approved_latency"):
+        """
+        Paste approved content into the target window
+        
+        Args:
+            clipboard_data: Clipboard data captured by ClipboardMonitor
+            target_hwnd: Window that should receive the paste
+            ready_event: Event set once the confirmation popup is gone
+            requested_at: perf_counter() timestamp the latency is measured from
+            metric_name: Metric used to record the paste latency
+        """
+        try:
+            # 1. Wait until the popup has actually been closed
+            if ready_event is not None and not ready_event.wait(self.timeout):
+                print("⚠️ Popup close not confirmed, pasting anyway")
+            
+            # 2. Make sure the approved content owns the clipboard
+            self._prepare_clipboard(clipboard_data)
+            
+            # 3. Bring the target window back to the foreground
+            if target_hwnd:
+                self._restore_focus(target_hwnd)
+            
+            # 4. Send actual paste command (plus presses coalesced meanwhile)
+            extra = 0
+            if self.coalescer is not None:
+                extra = self.coalescer.resolve(clipboard_data.get("burst_key"), True)
+            self.send_paste(1 + extra)
+            
+            if requested_at is not None:
+                metrics_service.record_latency(metric_name, time.perf_counter() - requested_at)
+            metrics_service.increment("paste.injected")
+            
+            print(f"✓ Paste executed ({clipboard_data.get('type')})")
+        
+        except Exception as e:
+            metrics_service.increment("paste.injection_failed")
+            print(f"Failed to perform paste: {e}")
+            import traceback
+            traceback.print_exc()
+    
+    @staticmethod
+    def _press_paste(count: int = 1):
+        """Send Ctrl+V directly"""
+        for _ in range(count):
+            keyboard.press_and_release('ctrl+v')
+    
+    def _prepare_clipboard(self, clipboard_data: dict):
+        """Put approved content on the clipboard unless it is still there"""
+        captured_seq = clipboard_data.get("clipboard_seq")
+        current_seq = win32clipboard.GetClipboardSequenceNumber()
+        
+        # Clipboard unchanged since capture - nothing to write
+        if captured_seq is not None and captured_seq == current_seq:
+            return
+        
+        content_type = clipboard_data.get("type")
+        if content_type == "text":
+            pyperclip.copy(clipboard_data["content"])
+        elif content_type == "image" and clipboard_data.get("content"):
+            from monitors.clipboard_monitor import ClipboardMonitor
+            ClipboardMonitor._set_clipboard_image(clipboard_data["content"], clipboard_data.get("dib"))
+        else:
+            return
+        
+        if not self._wait_until(lambda: win32clipboard.GetClipboardSequenceNumber() != current_seq):
+            print("⚠️ Clipboard ownership not confirmed")
+    
+    def _restore_focus(self, target_hwnd: int):
+        """Return focus to the target window and wait until it is foreground"""
+        if win32gui.GetForegroundWindow() == target_hwnd:
+            return
+        
+        try:
+            win32gui.SetForegroundWindow(target_hwnd)
+        except Exception as e:
+            print(f"Failed to restore focus: {e}")
+        
+        if not self._wait_until(lambda: win32gui.GetForegroundWindow() == target_hwnd):
+            print("⚠️ Target window did not regain focus")
+    
+    def _wait_until(self, condition: Callable[[], bool]) -> bool:
+        """Wait until condition is true or the timeout expires"""
+        deadline = time.perf_counter() + self.timeout
+        while True:
+            if condition():
+                return True
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(self.poll_interval)
@@ -1,12 +1,39 @@
 """Services package initialization"""
 from .security_service import SecurityService, security_service
 from .history_service import HistoryService
+from .history_store import HistoryStore
+from .history_record import HistoryRecord
+from .blob_store import BlobHandle, BlobStore, blob_store
 from .notification_service import NotificationService, notification_service
+from .metrics_service import MetricsService, metrics_service
+from .grant_service import GrantService
+from .task_executor import TaskExecutor, task_executor
+from .executable_index import ExecutableIndex, executable_index
+from .icon_cache import IconCache, IconExtractor, icon_cache
+from .scan_service import ScanService, SensitiveSpan, scan_service
 
 __all__ = [
     'SecurityService',
     'security_service',
     'HistoryService',
+    'HistoryStore',
+    'HistoryRecord',
+    'BlobHandle',
+    'BlobStore',
+    'blob_store',
     'NotificationService',
-    'notification_service'
+    'notification_service',
+    'MetricsService',
+    'metrics_service',
+    'GrantService',
+    'TaskExecutor',
+    'task_executor',
+    'ExecutableIndex',
+    'executable_index',
+    'IconCache',
+    'IconExtractor',
+    'icon_cache',
+    'ScanService',
+    'SensitiveSpan',
+    'scan_service'
 ]
@@ -0,0 +1,276 @@
+"""
+Blob Store Module
+Holds history images behind small integer handles so records stay compact;
+decoded images are kept within a byte budget and the rest spill to disk
+"""
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from services.task_executor import TaskExecutor, task_executor
+
+# Default decoded-image budget for history
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Image modes PNG can store as-is (others are converted when spilled)
+PNG_MODES = ("1", "L", "LA", "I", "P", "RGB", "RGBA")
+
+
+class BlobHandle(int):
+    """Reference to an image held by the blob store (an int key, no per-handle fields)"""
+    __slots__ = ()
+
+
+def image_nbytes(image: Any) -> int:
+    """Approximate decoded size of a PIL image (0 for anything else)"""
+    try:
+        return image.width * image.height * len(image.getbands())
+    except Exception:
+        return 0
+
+
+class BlobStore:
+    """
+    Thread-safe handle -> image table shared by history records
+    
+    Decoded images are kept in memory up to max_bytes; beyond that the least
+    recently viewed ones are written to PNG files on the background lane and
+    read back transparently by get().
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 spill_dir: Optional[Path] = None,
+                 executor: Optional[TaskExecutor] = None):
+        """
+        Initialize BlobStore
+        
+        Args:
+            max_bytes: Decoded bytes kept in memory
+            spill_dir: Directory for spilled images (private temp dir by default)
+            executor: Executor whose background lane writes spilled images
+        """
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self._executor = executor or task_executor
+        self._lock = threading.Lock()
+        self._blobs: "OrderedDict[int, Any]" = OrderedDict()  # In memory, least recently viewed first
+        self._files: Dict[int, Path] = {}  # Spilled copies (kept while the blob lives)
+        self._keys = itertools.count(1)
+        self._spill_pending = False
+        self._spill_lock = threading.Lock()  # One spill pass at a time
+        self.total_bytes = 0  # Decoded bytes in memory
+        self.disk_bytes = 0  # PNG bytes on disk
+        self.spills = 0
+        self.reloads = 0
+    
+    def put(self, image: Any) -> Optional[BlobHandle]:
+        """
+        Store an image
+        
+        Args:
+            image: PIL image (empty values are passed through as None)
+        
+        Returns:
+            Handle for get()/release(), or None
+        """
+        if not image:
+            return None
+        handle = BlobHandle(next(self._keys))
+        with self._lock:
+            self._blobs[handle] = image
+            self.total_bytes += image_nbytes(image)
+        self._schedule_spill()
+        return handle
+    
+    def get(self, handle: Optional[BlobHandle], cache: bool = True) -> Any:
+        """
+        Get the image behind a handle, reading it back from disk if it was spilled
+        
+        Args:
+            handle: Blob handle
+            cache: Count as a view - refresh recency and keep a reloaded image in memory
+                (False for one-off reads such as saving)
+        
+        Returns:
+            PIL image, or None if the handle was released
+        """
+        if handle is None:
+            return None
+        with self._lock:
+            image = self._blobs.get(handle)
+            if image is not None:
+                if cache:
+                    # One-off reads (saving) must not make an image look recently viewed
+                    self._blobs.move_to_end(handle)
+                return image
+            path = self._files.get(handle)
+        if path is None:
+            return None
+        
+        image = self._read(path)
+        if image is None or not cache:
+            return image
+        
+        with self._lock:
+            if handle not in self._files:
+                return image  # Released meanwhile
+            existing = self._blobs.get(handle)
+            if existing is not None:
+                return existing  # Reloaded by another thread
+            self._blobs[handle] = image
+            self.total_bytes += image_nbytes(image)
+            self.reloads += 1
+        self._schedule_spill()
+        return image
+    
+    def release(self, handle: Optional[BlobHandle]) -> None:
+        """Drop the image behind a handle (memory and disk)"""
+        if handle is None:
+            return
+        with self._lock:
+            image = self._blobs.pop(handle, None)
+            if image is not None:
+                self.total_bytes -= image_nbytes(image)
+            path = self._files.pop(handle, None)
+        if path is not None:
+            self._remove_file(path)
+    
+    def set_budget(self, max_bytes: int) -> None:
+        """Change the in-memory byte budget (spills at once if now over it)"""
+        self.max_bytes = max_bytes
+        self._schedule_spill()
+    
+    def trim(self) -> int:
+        """
+        Move every in-memory image to disk (idle trim; blocks while writing)
+        
+        Returns:
+            Decoded bytes released
+        """
+        before = self.total_bytes
+        self._spill(0)
+        return max(0, before - self.total_bytes)
+    
+    def close(self) -> None:
+        """Delete spilled files (on exit)"""
+        with self._lock:
+            self._files.clear()
+            self.disk_bytes = 0
+            spill_dir, self.spill_dir = self.spill_dir, None
+        if spill_dir is not None:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get store usage for diagnostics
+        
+        Returns:
+            Blob counts, decoded bytes in memory, budget and disk usage
+        """
+        with self._lock:
+            return {
+                "blobs": len(self._blobs.keys() | self._files.keys()),
+                "in_memory": len(self._blobs),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "on_disk": len(self._files.keys() - self._blobs.keys()),
+                "disk_bytes": self.disk_bytes,
+                "spills": self.spills,
+                "reloads": self.reloads
+            }
+    
+    def _schedule_spill(self) -> None:
+        """Spill on the background lane once over budget (one pass in flight)"""
+        with self._lock:
+            if self._spill_pending or self.total_bytes <= self.max_bytes:
+                return
+            self._spill_pending = True
+        
+        if not self._executor.submit(TaskExecutor.BACKGROUND, self._spill):
+            self._spill()
+    
+    def _spill(self, target: Optional[int] = None) -> None:
+        """
+        Move least recently viewed images to disk
+        
+        Args:
+            target: Decoded bytes to keep in memory (budget by default)
+        """
+        with self._lock:
+            self._spill_pending = False
+        
+        with self._spill_lock:
+            while True:
+                with self._lock:
+                    limit = self.max_bytes if target is None else target
+                    if self.total_bytes <= limit or not self._blobs:
+                        return
+                    handle, image = next(iter(self._blobs.items()))
+                    path = self._files.get(handle)
+                
+                if path is None:
+                    path = self._write(handle, image)
+                    if path is None:
+                        return  # Disk unavailable - stay over budget rather than lose images
+                
+                with self._lock:
+                    released = self._blobs.get(handle) is not image
+                    if not released:
+                        self._files[handle] = path
+                        del self._blobs[handle]
+                        self.total_bytes -= image_nbytes(image)
+                        self.spills += 1
+                if released:
+                    self._remove_file(path)
+    
+    def _write(self, handle: BlobHandle, image: Any) -> Optional[Path]:
+        """Write an image to the spill directory"""
+        try:
+            with self._lock:
+                if self.spill_dir is None:
+                    self.spill_dir = Path(tempfile.mkdtemp(prefix="paste_guardian_blobs_"))
+                spill_dir = self.spill_dir
+            spill_dir.mkdir(parents=True, exist_ok=True)
+            
+            path = spill_dir / f"{int(handle)}.png"
+            tmp_path = path.with_suffix(".tmp")
+            if image.mode not in PNG_MODES:
+                image = image.convert("RGBA")
+            # Fast compression: files only live for this session
+            image.save(tmp_path, format="PNG", compress_level=1)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self.disk_bytes += path.stat().st_size
+            return path
+        except Exception as e:
+            print(f"Blob spill failed: {e}")
+            return None
+    
+    def _read(self, path: Path) -> Any:
+        """Read a spilled image back"""
+        try:
+            from PIL import Image
+            with Image.open(path) as spilled:
+                return spilled.copy()
+        except Exception as e:
+            print(f"Blob reload failed: {e}")
+            return None
+    
+    def _remove_file(self, path: Path) -> None:
+        """Delete a spilled file"""
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self.disk_bytes -= size
+
+
+# Global instance
+blob_store = BlobStore()
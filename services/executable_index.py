@@ -0,0 +1,215 @@
+"""
+Executable Index Module
+Background index mapping executable names to paths for O(1) resolution
+"""
+import json
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from services.task_executor import task_executor
+from utils.path_utils import path_manager
+
+
+def default_roots() -> List[str]:
+    """Program and system directories searched for executables"""
+    roots = [
+        os.environ.get('ProgramFiles', 'C:\\Program Files'),
+        os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)'),
+        os.environ.get('WINDIR', 'C:\\Windows'),
+    ]
+    local_app_data = os.environ.get('LOCALAPPDATA')
+    if local_app_data:
+        roots.append(os.path.join(local_app_data, 'Programs'))
+    return roots
+
+
+class ExecutableIndex:
+    """Name-to-path index built with os.scandir and refreshed using directory mtimes"""
+    
+    # Version of the persisted format
+    INDEX_VERSION = 1
+    
+    # Directory names never descended into (component store / installer caches)
+    EXCLUDED_DIRS = {"winsxs", "installer", "$recycle.bin", "servicing"}
+    
+    def __init__(self, roots: Optional[List[str]] = None, index_file: Optional[Path] = None,
+                 extensions=(".exe",)):
+        """
+        Initialize ExecutableIndex
+        
+        Args:
+            roots: Directories to index, in lookup priority order
+            index_file: File used to persist the directory table
+            extensions: File extensions to index (lower case)
+        """
+        self.roots = [os.path.normpath(root) for root in (roots or default_roots())]
+        self.index_file = Path(index_file or path_manager.get_data_path("executable_index.json"))
+        self.extensions = tuple(extensions)
+        self._lock = threading.Lock()  # Guards the table/index swap
+        self._refresh_lock = threading.Lock()
+        # Directory path -> {"mtime": ns, "files": [...], "dirs": [...]}
+        self._dirs: Dict[str, dict] = {}
+        self._index: Dict[str, str] = {}  # Lower-case name -> path (swapped atomically)
+        self._started = False
+        self.ready = threading.Event()
+        self.last_scanned = 0  # Directories read with scandir in the last refresh
+    
+    def resolve(self, process_name: str) -> Optional[str]:
+        """
+        Look up an executable path
+        
+        Args:
+            process_name: Executable file name (case-insensitive)
+        
+        Returns:
+            Full path, or None if not indexed
+        """
+        return self._index.get(process_name.lower())
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def start(self) -> None:
+        """Load the persisted index and refresh it on the low-priority background lane"""
+        if self._started:
+            return
+        self._started = task_executor.submit(task_executor.BACKGROUND, self._run)
+    
+    def refresh(self) -> int:
+        """
+        Walk the roots, re-reading only directories whose mtime changed
+        
+        Returns:
+            Number of directories read with scandir
+        """
+        # One walk at a time; lookups, load() and save() are not blocked while it runs
+        with self._refresh_lock:
+            with self._lock:
+                old_dirs = self._dirs
+            new_dirs: Dict[str, dict] = {}
+            scanned = 0
+            
+            # Breadth-first so shallower matches win, roots in priority order
+            queue = deque(root for root in self.roots if os.path.isdir(root))
+            while queue:
+                path = queue.popleft()
+                if path in new_dirs:
+                    continue
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                
+                entry = old_dirs.get(path)
+                if entry is None or entry["mtime"] != mtime:
+                    # Directory entries changed (or new) - read it
+                    entry = self._scan_dir(path, mtime)
+                    scanned += 1
+                    if entry is None:
+                        continue
+                new_dirs[path] = entry
+                queue.extend(os.path.join(path, name) for name in entry["dirs"])
+            
+            index = self._build_index(new_dirs)
+            with self._lock:
+                self._dirs = new_dirs
+                self._index = index
+                self.last_scanned = scanned
+        
+        return scanned
+    
+    def load(self) -> bool:
+        """
+        Restore the persisted directory table
+        
+        Returns:
+            True if a usable index was loaded
+        """
+        if not self.index_file.exists():
+            return False
+        
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != self.INDEX_VERSION or data.get("roots") != self.roots:
+                return False
+            
+            dirs = data["dirs"]
+            index = self._build_index(dirs)
+            with self._lock:
+                self._dirs = dirs
+                self._index = index
+            
+            print(f"✓ Loaded executable index ({len(index)} executables)")
+            return True
+        except Exception as e:
+            print(f"Executable index load error: {e}")
+            return False
+    
+    def save(self) -> None:
+        """Persist the directory table"""
+        # The table is replaced, never mutated, so the snapshot can be written without the lock
+        with self._lock:
+            data = {"version": self.INDEX_VERSION, "roots": self.roots, "dirs": self._dirs}
+        try:
+            tmp_file = self.index_file.with_suffix(".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            print(f"Executable index save error: {e}")
+    
+    def _build_index(self, dirs: Dict[str, dict]) -> Dict[str, str]:
+        """Name -> path for a directory table: roots in order, then breadth-first"""
+        index: Dict[str, str] = {}
+        queue = deque(root for root in self.roots if root in dirs)
+        seen = set()
+        while queue:
+            path = queue.popleft()
+            entry = dirs.get(path)
+            if entry is None or path in seen:
+                continue
+            seen.add(path)
+            for name in entry["files"]:
+                index.setdefault(name.lower(), os.path.join(path, name))
+            queue.extend(os.path.join(path, name) for name in entry["dirs"])
+        return index
+    
+    def _run(self) -> None:
+        """Background task: load, refresh, save"""
+        if self.load():
+            self.ready.set()  # Stale but usable while refreshing
+        
+        try:
+            scanned = self.refresh()
+            self.save()
+            print(f"✓ Executable index refreshed ({len(self._index)} executables, {scanned} directories read)")
+        except Exception as e:
+            print(f"Executable index refresh error: {e}")
+        finally:
+            self.ready.set()
+    
+    def _scan_dir(self, path: str, mtime: int) -> Optional[dict]:
+        """Read one directory with os.scandir"""
+        files, dirs = [], []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower() not in self.EXCLUDED_DIRS:
+                                dirs.append(entry.name)
+                        elif entry.name.lower().endswith(self.extensions):
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        return {"mtime": mtime, "files": files, "dirs": dirs}
+
+
+# Global instance
+executable_index = ExecutableIndex()
@@ -0,0 +1,168 @@
+"""
+Grant Service Module
+Manages time-boxed session approvals per process and content type
+"""
+import heapq
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.path_utils import path_manager
+
+
+class GrantService:
+    """Expiring approval table backed by a min-heap of expiry times"""
+    
+    def __init__(self, grants_file: Optional[Path] = None, persist: bool = False,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize GrantService
+        
+        Args:
+            grants_file: File used to persist grants across restarts
+            persist: Whether grants are saved and restored
+            clock: Wall-clock time source (wall clock so expiry survives restarts)
+        """
+        self.grants_file = grants_file or path_manager.get_data_path("session_grants.json")
+        self.persist = persist
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._grants: Dict[Tuple[str, str], float] = {}
+        self._heap: List[Tuple[float, Tuple[str, str]]] = []
+        
+        if self.persist:
+            self._load()
+    
+    def grant(self, process_name: str, content_type: str, minutes: float) -> float:
+        """
+        Allow pastes of a content type into a process for a limited time
+        
+        Args:
+            process_name: Process receiving the paste
+            content_type: Content type ('text' or 'image')
+            minutes: Grant duration in minutes
+        
+        Returns:
+            Expiry timestamp
+        """
+        key = (process_name, content_type)
+        expires_at = self._clock() + minutes * 60
+        
+        with self._lock:
+            self._grants[key] = expires_at
+            heapq.heappush(self._heap, (expires_at, key))
+        
+        self._save()
+        print(f"✓ Session grant: {process_name} ({content_type}) for {minutes:g} min")
+        return expires_at
+    
+    def is_granted(self, process_name: str, content_type: str) -> bool:
+        """
+        Check whether an unexpired grant exists
+        
+        Args:
+            process_name: Process receiving the paste
+            content_type: Content type ('text' or 'image')
+        
+        Returns:
+            True if the paste is covered by a session grant
+        """
+        with self._lock:
+            expired = self._purge_expired(self._clock())
+            granted = (process_name, content_type) in self._grants
+        
+        if expired:
+            self._save()
+        return granted
+    
+    def revoke(self, process_name: str, content_type: str) -> None:
+        """
+        Remove a grant before it expires
+        
+        Args:
+            process_name: Process name
+            content_type: Content type
+        """
+        with self._lock:
+            # Stale heap entry is skipped when it reaches the top
+            removed = self._grants.pop((process_name, content_type), None)
+        
+        if removed is not None:
+            self._save()
+    
+    def get_active_grants(self) -> List[Dict[str, object]]:
+        """
+        Get all unexpired grants
+        
+        Returns:
+            List of grants ordered by expiry
+        """
+        with self._lock:
+            self._purge_expired(self._clock())
+            grants = sorted(self._grants.items(), key=lambda item: item[1])
+        
+        return [
+            {"process": key[0], "type": key[1], "expires_at": expires_at}
+            for key, expires_at in grants
+        ]
+    
+    def clear(self) -> None:
+        """Remove all grants"""
+        with self._lock:
+            self._grants.clear()
+            self._heap.clear()
+        
+        self._save()
+    
+    def _purge_expired(self, now: float) -> bool:
+        """Pop expired heap entries (O(log n) each); caller holds the lock"""
+        expired = False
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._heap)
+            # Ignore entries superseded by a later grant for the same key
+            if self._grants.get(key) == expires_at:
+                del self._grants[key]
+                expired = True
+        return expired
+    
+    def _save(self) -> None:
+        """Persist active grants if configured"""
+        if not self.persist:
+            return
+        
+        with self._lock:
+            data = [
+                {"process": key[0], "type": key[1], "expires_at": expires_at}
+                for key, expires_at in self._grants.items()
+            ]
+        
+        try:
+            with open(self.grants_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"Session grant save error: {e}")
+    
+    def _load(self) -> None:
+        """Restore persisted grants, dropping expired ones"""
+        if not self.grants_file.exists():
+            return
+        
+        try:
+            with open(self.grants_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            now = self._clock()
+            with self._lock:
+                for entry in data:
+                    expires_at = float(entry["expires_at"])
+                    if expires_at > now:
+                        key = (entry["process"], entry["type"])
+                        self._grants[key] = expires_at
+                        self._heap.append((expires_at, key))
+                heapq.heapify(self._heap)
+            
+            print(f"✓ Loaded {len(self._grants)} session grants")
+        except Exception as e:
+            print(f"Session grant load error: {e}")
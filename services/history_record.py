@@ -0,0 +1,196 @@
+"""
+History Record Module
+Compact history item: interned names, image blob handles and lazily decrypted text
+"""
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from services.blob_store import BlobHandle, BlobStore, blob_store
+from services.security_service import SecurityService, security_service
+
+# process name -> interned display name (a handful of distinct apps)
+_app_names: Dict[str, str] = {}
+
+
+def app_name_for(process_name: str) -> str:
+    """Display name of a process ('notepad.exe' -> 'Notepad'), interned"""
+    name = _app_names.get(process_name)
+    if name is None:
+        name = _app_names[process_name] = sys.intern(process_name.replace('.exe', '').title())
+    return name
+
+
+class HistoryRecord:
+    """
+    One history entry
+    
+    Text fields of sensitive items stay encrypted in memory and are decrypted
+    on access; image fields are BlobHandles into the shared blob store.
+    """
+    
+    __slots__ = ("id", "timestamp", "type", "process", "app_name", "is_sensitive",
+                 "_preview", "_content", "_thumbnail", "_encrypted")
+    
+    # Shared by all records
+    blobs: BlobStore = blob_store
+    security: SecurityService = security_service
+    
+    # Not tracked per item yet (read by the history list)
+    auto_approved = False
+    
+    def __init__(self, content_type: str, process_name: str,
+                 timestamp: Optional[float] = None, is_sensitive: bool = False):
+        """
+        Initialize HistoryRecord (attach content with from_capture/from_dict)
+        
+        Args:
+            content_type: 'text' or 'image'
+            process_name: Process that received the paste
+            timestamp: Paste time (now by default)
+            is_sensitive: Whether the text contains sensitive data
+        """
+        process_name = process_name or ""
+        self.id = 0
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.type = sys.intern(content_type or "text")
+        self.process = sys.intern(process_name)
+        self.app_name = app_name_for(process_name)
+        self.is_sensitive = bool(is_sensitive)
+        self._preview = None
+        self._content = None
+        self._thumbnail = None
+        self._encrypted = False
+    
+    @classmethod
+    def from_capture(cls, content_type: str, process_name: str, content: Any,
+                     preview: Any = None, thumbnail: Any = None,
+                     is_sensitive: bool = False) -> "HistoryRecord":
+        """
+        Build a record from captured clipboard data
+        
+        Args:
+            content_type: 'text' or 'image'
+            process_name: Process that received the paste
+            content: Text or full image
+            preview: Preview text or popup-size image
+            thumbnail: History thumbnail (images only)
+            is_sensitive: Whether the text contains sensitive data
+        
+        Returns:
+            HistoryRecord
+        """
+        record = cls(content_type, process_name, is_sensitive=is_sensitive)
+        if record.type == "image":
+            record._attach_images(content, preview, thumbnail)
+        else:
+            record._attach_text(content, preview)
+        return record
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HistoryRecord":
+        """
+        Build a record from its saved form (see to_dict)
+        
+        Args:
+            data: Saved item (images already decoded)
+        
+        Returns:
+            HistoryRecord
+        """
+        record = cls(data.get("type"), data.get("process", ""),
+                     data.get("timestamp", 0), data.get("is_sensitive", False))
+        if record.type == "image":
+            # Older files kept the preview twice, as 'full_content'
+            record._attach_images(data.get("content"),
+                                  data.get("preview") or data.get("full_content"),
+                                  data.get("thumbnail"))
+        else:
+            record._attach_text(data.get("content"), data.get("preview"),
+                                data.get("_content_encrypted", False),
+                                data.get("_preview_encrypted", False))
+        return record
+    
+    def to_dict(self, plaintext: bool = False) -> Dict[str, Any]:
+        """
+        Get the saved form (images are PIL objects)
+        
+        Args:
+            plaintext: Decrypt sensitive text (exports) instead of keeping it encrypted
+        
+        Returns:
+            Dictionary for ConfigManager.save_history
+        """
+        data = {
+            "timestamp": self.timestamp,
+            "type": self.type,
+            "process": self.process,
+            "app_name": self.app_name,
+            "is_sensitive": self.is_sensitive
+        }
+        if self.type == "image":
+            # Spilled images are read for the save without being cached again
+            data["preview"] = self._read(self._preview, cache=False)
+            data["content"] = self._read(self._content, cache=False)
+            data["thumbnail"] = self._read(self._thumbnail, cache=False)
+        elif plaintext:
+            data["preview"] = self.preview
+            data["content"] = self.content
+        else:
+            data["preview"] = self._preview
+            data["content"] = self._content
+            if self._encrypted:
+                data["_preview_encrypted"] = True
+                data["_content_encrypted"] = True
+        return data
+    
+    @property
+    def content(self) -> Any:
+        """Pasted text (decrypted on access) or full image (read back from disk if spilled)"""
+        return self._read(self._content)
+    
+    @property
+    def preview(self) -> Any:
+        """Preview text (decrypted on access) or popup-size image"""
+        return self._read(self._preview)
+    
+    @property
+    def thumbnail(self) -> Any:
+        """History thumbnail (images only)"""
+        return self._read(self._thumbnail)
+    
+    def release(self) -> None:
+        """Free the images of an evicted record"""
+        for handle in (self._content, self._preview, self._thumbnail):
+            if isinstance(handle, BlobHandle):
+                self.blobs.release(handle)
+        self._content = self._preview = self._thumbnail = None
+    
+    def _read(self, value: Any, cache: bool = True) -> Any:
+        """Resolve a stored field"""
+        if isinstance(value, BlobHandle):
+            return self.blobs.get(value, cache)
+        if self._encrypted and value:
+            return self.security.decrypt_string(value)
+        return value
+    
+    def _attach_images(self, content: Any, preview: Any, thumbnail: Any) -> None:
+        """Move images into the blob store"""
+        self._content = self.blobs.put(content)
+        self._preview = self.blobs.put(preview)
+        self._thumbnail = self.blobs.put(thumbnail)
+    
+    def _attach_text(self, content: Optional[str], preview: Optional[str],
+                     content_encrypted: bool = False, preview_encrypted: bool = False) -> None:
+        """Store text, encrypted if the item is sensitive"""
+        self._encrypted = self.is_sensitive
+        self._content = self._seal(content, content_encrypted)
+        self._preview = self._seal(preview, preview_encrypted)
+    
+    def _seal(self, text: Optional[str], encrypted: bool) -> str:
+        """Bring text into the record's encryption state"""
+        if not text or encrypted == self._encrypted:
+            return text or ""
+        if self._encrypted:
+            return self.security.encrypt_string(text)
+        return self.security.decrypt_string(text)
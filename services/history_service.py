@@ -3,10 +3,10 @@ History Service Module
 Manages clipboard history with encryption support
 """
 import json
-import time
-from typing import Dict, List, Any
+from typing import List, Any
 from pathlib import Path
 
+from services.history_record import HistoryRecord
 from services.security_service import SecurityService
 from utils.path_utils import path_manager
 
@@ -24,14 +24,14 @@ class HistoryService:
         self.security = security_service
         self.history_file = path_manager.get_data_path("history.json")
         self.max_history_items = 10
-        self._history_cache: List[Dict[str, Any]] = []
+        self._history_cache: List[HistoryRecord] = []
     
-    def load_history(self) -> List[Dict[str, Any]]:
+    def load_history(self) -> List[HistoryRecord]:
         """
-        Load clipboard history from file with decryption
+        Load clipboard history from file (sensitive text is decrypted on access)
         
         Returns:
-            List of history items
+            List of history records
         """
         if not self.history_file.exists():
             return []
@@ -40,36 +40,30 @@ class HistoryService:
             with open(self.history_file, 'r', encoding='utf-8') as f:
                 encrypted_history = json.load(f)
             
-            # Decrypt sensitive fields
-            decrypted_history = []
-            for item in encrypted_history:
-                decrypted_item = self._decrypt_history_item(item)
-                decrypted_history.append(decrypted_item)
+            # Encrypted fields are kept as-is until read
+            history = [HistoryRecord.from_dict(item) for item in encrypted_history]
             
-            self._history_cache = decrypted_history
-            print(f"✓ Loaded {len(decrypted_history)} history items")
-            return decrypted_history
+            self._history_cache = history
+            print(f"✓ Loaded {len(history)} history items")
+            return history
             
         except Exception as e:
             print(f"History load error: {e}")
             return []
     
-    def save_history(self, history_items: List[Dict[str, Any]]) -> bool:
+    def save_history(self, history_items: List[HistoryRecord]) -> bool:
         """
         Save clipboard history to file with encryption
         
         Args:
-            history_items: List of history items to save
+            history_items: List of history records to save
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Encrypt sensitive fields before saving
-            encrypted_history = []
-            for item in history_items:
-                encrypted_item = self._encrypt_history_item(item)
-                encrypted_history.append(encrypted_item)
+            # Sensitive fields are already encrypted in the records
+            encrypted_history = [item.to_dict() for item in history_items]
             
             # Save to file
             with open(self.history_file, 'w', encoding='utf-8') as f:
@@ -89,9 +83,8 @@ class HistoryService:
         content: Any,
         preview: str,
         process_name: str,
-        is_sensitive: bool = False,
-        metadata: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
+        is_sensitive: bool = False
+    ) -> HistoryRecord:
         """
         Add a new item to history
         
@@ -101,25 +94,14 @@ class HistoryService:
             preview: Preview text/thumbnail
             process_name: Name of the process
             is_sensitive: Whether content is sensitive
-            metadata: Additional metadata
             
         Returns:
-            Created history item
+            Created history record
         """
-        history_item = {
-            "timestamp": time.time(),
-            "type": content_type,
-            "preview": preview,
-            "content": content,
-            "process": process_name,
-            "app_name": process_name.replace('.exe', '').title(),
-            "is_sensitive": is_sensitive,
-            "metadata": metadata or {}
-        }
-        
-        return history_item
+        return HistoryRecord.from_capture(content_type, process_name, content,
+                                          preview=preview, is_sensitive=is_sensitive)
     
-    def cleanup_old_items(self, history_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def cleanup_old_items(self, history_items: List[HistoryRecord]) -> List[HistoryRecord]:
         """
         Keep only the most recent items
         
@@ -133,14 +115,14 @@ class HistoryService:
             # Sort by timestamp descending and keep only recent items
             sorted_items = sorted(
                 history_items,
-                key=lambda x: x.get("timestamp", 0),
+                key=lambda x: x.timestamp,
                 reverse=True
             )
             return sorted_items[:self.max_history_items]
         
         return history_items
     
-    def get_recent_items(self, count: int = None) -> List[Dict[str, Any]]:
+    def get_recent_items(self, count: int = None) -> List[HistoryRecord]:
         """
         Get recent history items
         
@@ -172,62 +154,6 @@ class HistoryService:
             print(f"History clear error: {e}")
             return False
     
-    def _encrypt_history_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Encrypt sensitive fields in a history item
-        
-        Args:
-            item: History item to encrypt
-            
-        Returns:
-            Encrypted history item
-        """
-        encrypted_item = item.copy()
-        
-        # Encrypt text content if marked as sensitive
-        if item.get("is_sensitive") and item.get("type") == "text":
-            content = item.get("content", "")
-            if isinstance(content, str) and content:
-                encrypted_item["content"] = self.security.encrypt_string(content)
-                encrypted_item["_content_encrypted"] = True
-            
-            preview = item.get("preview", "")
-            if isinstance(preview, str) and preview:
-                encrypted_item["preview"] = self.security.encrypt_string(preview)
-                encrypted_item["_preview_encrypted"] = True
-        
-        # Don't encrypt images, just encode as base64 (already handled elsewhere)
-        
-        return encrypted_item
-    
-    def _decrypt_history_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Decrypt sensitive fields in a history item
-        
-        Args:
-            item: Encrypted history item
-            
-        Returns:
-            Decrypted history item
-        """
-        decrypted_item = item.copy()
-        
-        # Decrypt content if it was encrypted
-        if item.get("_content_encrypted"):
-            encrypted_content = item.get("content", "")
-            if encrypted_content:
-                decrypted_item["content"] = self.security.decrypt_string(encrypted_content)
-            del decrypted_item["_content_encrypted"]
-        
-        # Decrypt preview if it was encrypted
-        if item.get("_preview_encrypted"):
-            encrypted_preview = item.get("preview", "")
-            if encrypted_preview:
-                decrypted_item["preview"] = self.security.decrypt_string(encrypted_preview)
-            del decrypted_item["_preview_encrypted"]
-        
-        return decrypted_item
-    
     def export_history(self, export_path: Path, include_sensitive: bool = False) -> bool:
         """
         Export history to a file
@@ -240,13 +166,11 @@ class HistoryService:
             True if successful
         """
         try:
-            items_to_export = self._history_cache
-            
-            if not include_sensitive:
-                items_to_export = [
-                    item for item in items_to_export
-                    if not item.get("is_sensitive", False)
-                ]
+            # Exports are plaintext
+            items_to_export = [
+                item.to_dict(plaintext=True) for item in self._history_cache
+                if include_sensitive or not item.is_sensitive
+            ]
             
             with open(export_path, 'w', encoding='utf-8') as f:
                 json.dump(items_to_export, f, indent=2, ensure_ascii=False)
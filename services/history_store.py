@@ -0,0 +1,213 @@
+"""
+History Store Module
+In-memory clipboard history with stable item IDs and a change feed
+"""
+import itertools
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.history_record import HistoryRecord
+
+# Change kinds recorded in the feed
+INSERTED = "inserted"
+EVICTED = "evicted"
+UPDATED = "updated"
+
+
+class HistoryStore:
+    """Bounded history list that records inserts, evictions and updates per generation"""
+    
+    def __init__(self, limit: int = 10, max_changes: int = 256):
+        """
+        Initialize HistoryStore
+        
+        Args:
+            limit: Maximum number of items kept (oldest evicted first)
+            max_changes: Number of change records retained for consumers
+        """
+        self._lock = threading.Lock()
+        self._items: List[HistoryRecord] = []  # Oldest first
+        self._ids = itertools.count(1)
+        self._changes: deque = deque()
+        self._max_changes = max_changes
+        self._feed_start = 0  # Oldest generation the feed can answer from
+        self.generation = 0
+        self.limit = max(1, limit)
+    
+    def add(self, item: HistoryRecord) -> Tuple[int, List[HistoryRecord]]:
+        """
+        Append an item, evicting the oldest items beyond the limit
+        
+        Args:
+            item: History record (its id is assigned)
+        
+        Returns:
+            Tuple of (item ID, evicted items)
+        """
+        with self._lock:
+            self.generation += 1
+            item.id = next(self._ids)
+            self._items.append(item)
+            self._record(INSERTED, item.id)
+            evicted = self._evict_overflow()
+            return item.id, evicted
+    
+    def update(self, item_id: int, **fields) -> bool:
+        """
+        Update fields of an existing item
+        
+        Args:
+            item_id: Item ID
+            **fields: Record attributes to set
+        
+        Returns:
+            True if the item exists
+        """
+        with self._lock:
+            for item in self._items:
+                if item.id == item_id:
+                    for name, value in fields.items():
+                        setattr(item, name, value)
+                    self.generation += 1
+                    self._record(UPDATED, item_id)
+                    return True
+        return False
+    
+    def set_limit(self, limit: int) -> List[HistoryRecord]:
+        """
+        Change the maximum item count
+        
+        Args:
+            limit: New limit
+        
+        Returns:
+            Items evicted by a smaller limit
+        """
+        with self._lock:
+            self.limit = max(1, limit)
+            if len(self._items) <= self.limit:
+                return []
+            self.generation += 1
+            return self._evict_overflow()
+    
+    def load(self, items: List[HistoryRecord]) -> List[HistoryRecord]:
+        """
+        Replace all items (consumers must do a full refresh)
+        
+        Args:
+            items: Items ordered oldest first
+        
+        Returns:
+            Dropped items (previous items and loaded items beyond the limit)
+        """
+        with self._lock:
+            dropped = self._items + list(items[:-self.limit])
+            self._items = list(items[-self.limit:])
+            for item in self._items:
+                item.id = next(self._ids)
+            self.generation += 1
+            self._changes.clear()
+            self._feed_start = self.generation
+            return dropped
+    
+    def get_state(self) -> Tuple[int, int]:
+        """
+        Get generation and item count atomically
+        
+        Returns:
+            Tuple of (generation, count)
+        """
+        with self._lock:
+            return self.generation, len(self._items)
+    
+    def count(self) -> int:
+        """Number of items"""
+        with self._lock:
+            return len(self._items)
+    
+    def page(self, start: int, count: int) -> List[HistoryRecord]:
+        """
+        Get a page of items, latest first
+        
+        Args:
+            start: Index from the newest item (0 = newest)
+            count: Maximum number of items
+        
+        Returns:
+            Items ordered newest first
+        """
+        with self._lock:
+            end = len(self._items) - start
+            if end <= 0 or count <= 0:
+                return []
+            return self._items[max(0, end - count):end][::-1]
+    
+    def get_items(self) -> List[HistoryRecord]:
+        """
+        Get a copy of all items, oldest first (for saving)
+        
+        Returns:
+            List of items
+        """
+        with self._lock:
+            return list(self._items)
+    
+    def changes_since(self, generation: int) -> Optional[Dict[str, Any]]:
+        """
+        Collapse the change feed after a generation
+        
+        Args:
+            generation: Generation the consumer last applied
+        
+        Returns:
+            Dictionary with generation, count and inserted/evicted/updated ID
+            lists, or None if the feed no longer covers the generation and
+            the consumer must reload
+        """
+        with self._lock:
+            if generation < self._feed_start or generation > self.generation:
+                return None
+            
+            inserted, evicted, updated = [], [], []
+            for change_generation, kind, item_id in self._changes:
+                if change_generation <= generation:
+                    continue
+                if kind == INSERTED:
+                    inserted.append(item_id)
+                elif kind == EVICTED:
+                    if item_id in inserted:
+                        # Inserted and evicted in the same window - never shown
+                        inserted.remove(item_id)
+                    else:
+                        evicted.append(item_id)
+                    if item_id in updated:
+                        updated.remove(item_id)
+                elif item_id not in inserted and item_id not in updated:
+                    updated.append(item_id)
+            
+            return {
+                "generation": self.generation,
+                "count": len(self._items),
+                "inserted": inserted,
+                "evicted": evicted,
+                "updated": updated
+            }
+    
+    def _evict_overflow(self) -> List[HistoryRecord]:
+        """Drop oldest items beyond the limit; caller holds the lock"""
+        overflow = len(self._items) - self.limit
+        if overflow <= 0:
+            return []
+        evicted = self._items[:overflow]
+        del self._items[:overflow]
+        for item in evicted:
+            self._record(EVICTED, item.id)
+        return evicted
+    
+    def _record(self, kind: str, item_id: int) -> None:
+        """Append to the change feed; caller holds the lock"""
+        self._changes.append((self.generation, kind, item_id))
+        while len(self._changes) > self._max_changes:
+            dropped_generation = self._changes.popleft()[0]
+            self._feed_start = max(self._feed_start, dropped_generation)
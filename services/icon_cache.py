@@ -0,0 +1,234 @@
+"""
+Icon Cache Module
+Persistent process-icon cache fed by the shared UI task lane
+"""
+import hashlib
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from services.executable_index import executable_index
+from services.task_executor import TaskExecutor, task_executor
+from utils.path_utils import path_manager
+
+
+class IconExtractor(ABC):
+    """Interface for extracting an icon image from an executable"""
+    
+    @abstractmethod
+    def extract(self, exe_path: str, size: int) -> Optional[Any]:
+        """
+        Extract an icon
+        
+        Args:
+            exe_path: Path to the executable
+            size: Requested edge length in pixels
+        
+        Returns:
+            PIL image of size x size, or None if the file has no icon
+        """
+
+
+class Win32IconExtractor(IconExtractor):
+    """Extracts the first icon resource of an executable via the Win32 API"""
+    
+    def extract(self, exe_path: str, size: int) -> Optional[Any]:
+        """Extract and resize the large icon of an executable"""
+        import win32api
+        import win32con
+        import win32gui
+        import win32ui
+        from PIL import Image
+        
+        large, small = win32gui.ExtractIconEx(exe_path, 0)
+        try:
+            # Use large icon (higher quality)
+            icon_handle = large[0] if large else (small[0] if small else None)
+            if not icon_handle:
+                return None
+            
+            ico_x = win32api.GetSystemMetrics(win32con.SM_CXICON)
+            ico_y = win32api.GetSystemMetrics(win32con.SM_CYICON)
+            
+            screen_dc = win32gui.GetDC(0)
+            hdc = win32ui.CreateDCFromHandle(screen_dc)
+            hdc_mem = hdc.CreateCompatibleDC()
+            hbmp = win32ui.CreateBitmap()
+            try:
+                hbmp.CreateCompatibleBitmap(hdc, ico_x, ico_y)
+                hdc_mem.SelectObject(hbmp)
+                hdc_mem.FillSolidRect((0, 0, ico_x, ico_y), win32api.RGB(0, 0, 0))
+                hdc_mem.DrawIcon((0, 0), icon_handle)
+                
+                bmpstr = hbmp.GetBitmapBits(True)
+                img = Image.frombuffer('RGB', (ico_x, ico_y), bmpstr, 'raw', 'BGRX', 0, 1)
+            finally:
+                hdc_mem.DeleteDC()
+                win32gui.DeleteObject(hbmp.GetHandle())
+                win32gui.ReleaseDC(0, screen_dc)
+            
+            # High-quality resizing with LANCZOS filter
+            return img.resize((size, size), Image.Resampling.LANCZOS)
+        finally:
+            for icon in list(large) + list(small):
+                win32gui.DestroyIcon(icon)
+
+
+def find_executable_simple(process_name: str) -> Optional[str]:
+    """Look for an executable in the main system locations only"""
+    windir = os.environ.get('WINDIR', 'C:\\Windows')
+    common_paths = [
+        os.path.join(windir, 'System32', process_name),
+        os.path.join(windir, 'SysWOW64', process_name),
+        os.path.join(os.environ.get('ProgramFiles', 'C:\\Program Files'), 'Common Files', process_name),
+    ]
+    for path in common_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def resolve_executable(process_name: str) -> Optional[str]:
+    """Resolve through the executable index, falling back to system locations"""
+    return executable_index.resolve(process_name) or find_executable_simple(process_name)
+
+
+class IconCache:
+    """Process icons cached in memory and on disk, keyed by executable path, size and mtime"""
+    
+    def __init__(self, extractor: Optional[IconExtractor] = None,
+                 cache_dir: Optional[Path] = None,
+                 resolver: Optional[Callable[[str], Optional[str]]] = None,
+                 executor: Optional[TaskExecutor] = None,
+                 resolver_ready: Optional[threading.Event] = None,
+                 max_entries: int = 512):
+        """
+        Initialize IconCache
+        
+        Args:
+            extractor: Icon extractor (Win32 by default)
+            cache_dir: Directory for cached PNG files
+            resolver: Maps a process name to an executable path
+            executor: Executor whose UI lane runs extractions
+            resolver_ready: Set once the resolver has seen every executable; unresolved
+                names are only cached from then on (executable index by default)
+            max_entries: Icons (and known misses) kept in memory, least recently used dropped first
+        """
+        self.extractor = extractor or Win32IconExtractor()
+        self.cache_dir = Path(cache_dir or path_manager.get_data_path("icon_cache"))
+        self.resolver = resolver or resolve_executable
+        self._executor = executor or task_executor
+        if resolver_ready is None and resolver is None:
+            resolver_ready = executable_index.ready
+        self._resolver_ready = resolver_ready
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        # (process, size) -> image or None, least recently used first
+        self._memory: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+        self._pending: Dict[Tuple[str, int], List[Callable]] = {}
+        self.extractions = 0  # Number of real extractor calls (diagnostics)
+    
+    def request(self, process_name: str, size: int, callback: Callable[[Any], None]) -> None:
+        """
+        Request an icon; callback receives a PIL image or None on a worker thread
+        (or immediately if already in memory)
+        
+        Args:
+            process_name: Process executable name
+            size: Icon edge length in pixels
+            callback: Called with the result
+        """
+        key = (process_name.lower(), size)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                image = self._memory[key]
+                hit = True
+            else:
+                hit = False
+                waiters = self._pending.get(key)
+                if waiters is not None:
+                    # Same icon already being loaded - just wait for it
+                    waiters.append(callback)
+                    return
+                self._pending[key] = [callback]
+        
+        if hit:
+            callback(image)
+            return
+        
+        if not self._executor.submit(TaskExecutor.UI, self._load, key, process_name):
+            # Lane full or shutting down - report "no icon" instead of waiting forever
+            with self._lock:
+                waiters = self._pending.pop(key, [])
+            for waiter in waiters:
+                waiter(None)
+    
+    def get_cached(self, process_name: str, size: int) -> Optional[Any]:
+        """Return an icon already held in memory (None if not loaded)"""
+        with self._lock:
+            return self._memory.get((process_name.lower(), size))
+    
+    def _load(self, key: Tuple[str, int], process_name: str) -> None:
+        """Resolve, read from disk or extract, then notify waiters (worker thread)"""
+        image = None
+        resolved = False
+        try:
+            exe_path = self.resolver(process_name)
+            if exe_path:
+                resolved = True
+                image = self._load_path(exe_path, key[1])
+        except Exception as e:
+            print(f"Icon load failed ({process_name}): {e}")
+        
+        # A name the index has not reached yet may resolve later - only remember final misses
+        final = resolved or self._resolver_ready is None or self._resolver_ready.is_set()
+        with self._lock:
+            if image is not None or final:
+                self._memory[key] = image
+                while len(self._memory) > self.max_entries:
+                    self._memory.popitem(last=False)
+            waiters = self._pending.pop(key, [])
+        
+        for callback in waiters:
+            try:
+                callback(image)
+            except Exception as e:
+                print(f"Icon callback error: {e}")
+    
+    def _load_path(self, exe_path: str, size: int) -> Optional[Any]:
+        """Get the icon for an executable from disk cache or the extractor"""
+        mtime = os.stat(exe_path).st_mtime_ns
+        cache_file = self._cache_file(exe_path, size, mtime)
+        
+        if cache_file.exists():
+            from PIL import Image
+            try:
+                with Image.open(cache_file) as cached:
+                    return cached.convert("RGBA") if cached.mode == "P" else cached.copy()
+            except Exception:
+                pass  # Corrupt cache entry - extract again
+        
+        self.extractions += 1
+        image = self.extractor.extract(exe_path, size)
+        if image is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(".tmp")
+                image.save(tmp_file, format="PNG")
+                os.replace(tmp_file, cache_file)
+            except Exception as e:
+                print(f"Icon cache write failed: {e}")
+        return image
+    
+    def _cache_file(self, exe_path: str, size: int, mtime: int) -> Path:
+        """Cache file name for (path, size, mtime); a changed exe gets a new file"""
+        key = f"{os.path.normcase(os.path.abspath(exe_path))}|{size}|{mtime}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.png"
+
+
+# Global instance
+icon_cache = IconCache()
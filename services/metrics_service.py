@@ -0,0 +1,105 @@
+"""
+Metrics Service Module
+Collects lightweight counters and latency samples for diagnostics
+"""
+import threading
+from collections import deque
+from typing import Dict, Any
+
+
+class MetricsService:
+    """Thread-safe store for counters and latency samples"""
+    
+    def __init__(self, max_samples: int = 200):
+        """
+        Initialize MetricsService
+        
+        Args:
+            max_samples: Number of recent samples kept per latency metric
+        """
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._latencies: Dict[str, deque] = {}
+        self._max_samples = max_samples
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        """
+        Increment a counter
+        
+        Args:
+            name: Counter name
+            amount: Value to add
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+    
+    def get_counter(self, name: str) -> int:
+        """
+        Get current counter value
+        
+        Args:
+            name: Counter name
+        
+        Returns:
+            Counter value (0 if never incremented)
+        """
+        with self._lock:
+            return self._counters.get(name, 0)
+    
+    def record_latency(self, name: str, seconds: float) -> None:
+        """
+        Record a latency sample
+        
+        Args:
+            name: Metric name
+            seconds: Measured duration in seconds
+        """
+        with self._lock:
+            samples = self._latencies.get(name)
+            if samples is None:
+                samples = deque(maxlen=self._max_samples)
+                self._latencies[name] = samples
+            samples.append(seconds)
+    
+    def get_latency_summary(self, name: str) -> Dict[str, Any]:
+        """
+        Summarize recorded latency samples
+        
+        Args:
+            name: Metric name
+        
+        Returns:
+            Dictionary with count, last, average and max in milliseconds
+        """
+        with self._lock:
+            samples = list(self._latencies.get(name, ()))
+        
+        if not samples:
+            return {"count": 0}
+        
+        return {
+            "count": len(samples),
+            "last_ms": samples[-1] * 1000,
+            "avg_ms": sum(samples) / len(samples) * 1000,
+            "max_ms": max(samples) * 1000
+        }
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of all metrics
+        
+        Returns:
+            Dictionary with counters and latency summaries
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            latency_names = list(self._latencies.keys())
+        
+        return {
+            "counters": counters,
+            "latencies": {name: self.get_latency_summary(name) for name in latency_names}
+        }
+
+
+# Global instance
+metrics_service = MetricsService()
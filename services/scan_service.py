@@ -0,0 +1,98 @@
+"""
+Scan Service Module
+Detects sensitive data in text and reports match spans
+"""
+import re
+from typing import Iterator, List, NamedTuple, Optional
+
+
+class SensitiveSpan(NamedTuple):
+    """A sensitive match inside scanned text"""
+    offset: int
+    length: int
+    category: str
+
+
+# Detection rules (category, pattern) - more specific patterns first
+SENSITIVE_RULES = [
+    ("email", r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    ("card", r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b'),
+    ("id", r'\b\d{6}[-]?\d{7}\b'),
+    ("phone", r'\b\d{2,4}[-.]?\d{3,4}[-.]?\d{4}\b'),
+]
+
+
+class ScanService:
+    """Finds sensitive data spans with a single combined regex pass"""
+    
+    def __init__(self, rules=None, max_spans: int = 10000):
+        """
+        Initialize ScanService
+        
+        Args:
+            rules: List of (category, pattern) pairs
+            max_spans: Maximum number of spans reported per scan
+        """
+        self.rules = list(rules or SENSITIVE_RULES)
+        self.max_spans = max_spans
+        # One alternation with a named group per rule scans the text once
+        self._combined = re.compile("|".join(
+            f"(?P<{category}>{pattern})" for category, pattern in self.rules
+        ))
+        self._combined_bytes = None  # Bytes version, compiled on first scan_bytes()
+    
+    def scan(self, text: str, max_spans: Optional[int] = None) -> List[SensitiveSpan]:
+        """
+        Scan text for sensitive data
+        
+        Args:
+            text: Text to scan
+            max_spans: Override for the span limit
+        
+        Returns:
+            Non-overlapping spans ordered by offset
+        """
+        limit = self.max_spans if max_spans is None else max_spans
+        spans = []
+        for match in self._combined.finditer(text):
+            start, end = match.span()
+            spans.append(SensitiveSpan(start, end - start, match.lastgroup))
+            if len(spans) >= limit:
+                break
+        return spans
+    
+    def scan_bytes(self, data, start: int = 0, end: Optional[int] = None) -> Iterator[SensitiveSpan]:
+        """
+        Scan a bytes-like buffer (bytes, mmap) for sensitive data
+        
+        Args:
+            data: Buffer to scan (ASCII-compatible encoding)
+            start: Byte offset to start at
+            end: Byte offset to stop at (None = end of buffer)
+        
+        Returns:
+            Iterator of spans with byte offsets
+        """
+        if self._combined_bytes is None:
+            self._combined_bytes = re.compile(self._combined.pattern.encode("ascii"))
+        if end is None:
+            end = len(data)
+        for match in self._combined_bytes.finditer(data, start, end):
+            offset, match_end = match.span()
+            yield SensitiveSpan(offset, match_end - offset, match.lastgroup)
+    
+    def contains_sensitive(self, text: str) -> bool:
+        """
+        Check whether text contains any sensitive data
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            True on the first match
+        """
+        return self._combined.search(text) is not None
+
+
+# Global instance
+scan_service = ScanService()
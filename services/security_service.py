@@ -35,7 +35,13 @@ class SecurityService:
         """
         # Use machine name and user name to create a unique key
         import platform
-        machine_id = f"{platform.node()}-{os.getlogin()}-PasteGuardian"
+        try:
+            user_name = os.getlogin()
+        except OSError:
+            # No controlling terminal (services, cron, CLI over pipes)
+            import getpass
+            user_name = getpass.getuser()
+        machine_id = f"{platform.node()}-{user_name}-PasteGuardian"
         return machine_id
     
     def _derive_key(self, password: str) -> bytes:
@@ -68,14 +74,10 @@ class SecurityService:
         plaintext_bytes = plaintext.encode('utf-8')
         
         # XOR encryption
-        encrypted_bytes = bytearray()
-        key_length = len(self._key)
-        
-        for i, byte in enumerate(plaintext_bytes):
-            encrypted_bytes.append(byte ^ self._key[i % key_length])
+        encrypted_bytes = self._xor(plaintext_bytes)
         
         # Encode to base64 for safe storage
-        return base64.b64encode(bytes(encrypted_bytes)).decode('utf-8')
+        return base64.b64encode(encrypted_bytes).decode('utf-8')
     
     def decrypt_string(self, ciphertext: str) -> str:
         """
@@ -95,17 +97,27 @@ class SecurityService:
             encrypted_bytes = base64.b64decode(ciphertext.encode('utf-8'))
             
             # XOR decryption (same as encryption for XOR)
-            decrypted_bytes = bytearray()
-            key_length = len(self._key)
-            
-            for i, byte in enumerate(encrypted_bytes):
-                decrypted_bytes.append(byte ^ self._key[i % key_length])
-            
-            return bytes(decrypted_bytes).decode('utf-8')
+            return self._xor(encrypted_bytes).decode('utf-8')
         except Exception as e:
             print(f"Decryption error: {e}")
             return ""
     
+    def _xor(self, data: bytes) -> bytes:
+        """
+        XOR data with the repeating key
+        History text is decrypted on every access, so the whole buffer is
+        XORed as one integer instead of byte by byte.
+        
+        Args:
+            data: Bytes to transform
+            
+        Returns:
+            Transformed bytes (same length)
+        """
+        repeats, remainder = divmod(len(data), len(self._key))
+        key_stream = self._key * repeats + self._key[:remainder]
+        return (int.from_bytes(data, "big") ^ int.from_bytes(key_stream, "big")).to_bytes(len(data), "big")
+    
     def encrypt_dict(self, data: Dict[str, Any], fields_to_encrypt: list = None) -> Dict[str, Any]:
         """
         Encrypt specific fields in a dictionary
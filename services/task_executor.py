@@ -0,0 +1,180 @@
+"""
+Task Executor Module
+Shared worker lanes (paste / ui / background) with bounded queues
+"""
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from services.metrics_service import MetricsService, metrics_service
+
+
+class LaneConfig(NamedTuple):
+    """Worker count, queue bound and priority of a lane"""
+    workers: int
+    max_queue: int
+    low_priority: bool = False
+
+
+class TaskExecutor:
+    """Prioritized executor: each lane has its own named workers so slow work never delays pastes"""
+    
+    # Lanes, highest priority first
+    PASTE = "paste"            # Latency-critical paste injection
+    UI = "ui"                  # UI support work (toasts, icon extraction, clipboard recopy)
+    BACKGROUND = "background"  # Persistence and indexing (below normal thread priority)
+    
+    DEFAULT_LANES = {
+        PASTE: LaneConfig(workers=2, max_queue=32),
+        UI: LaneConfig(workers=2, max_queue=128),
+        BACKGROUND: LaneConfig(workers=2, max_queue=256, low_priority=True),
+    }
+    
+    # Sentinel telling a worker to exit
+    _STOP = object()
+    
+    def __init__(self, lanes: Optional[Dict[str, LaneConfig]] = None,
+                 metrics: Optional[MetricsService] = None):
+        """
+        Initialize TaskExecutor (workers start on first use)
+        
+        Args:
+            lanes: Lane name -> LaneConfig
+            metrics: Metrics sink for queue wait, run time and rejections
+        """
+        self.lanes = dict(lanes or self.DEFAULT_LANES)
+        self.metrics = metrics or metrics_service
+        self._lock = threading.Lock()
+        self._queues: Dict[str, queue.Queue] = {
+            name: queue.Queue(maxsize=config.max_queue) for name, config in self.lanes.items()
+        }
+        self._workers: Dict[str, List[threading.Thread]] = {name: [] for name in self.lanes}
+        self._shutdown = False
+    
+    def submit(self, lane: str, func: Callable, *args, **kwargs) -> bool:
+        """
+        Queue a task on a lane
+        
+        Args:
+            lane: Lane name (PASTE, UI or BACKGROUND)
+            func: Callable to run on a lane worker
+            *args, **kwargs: Arguments for func
+        
+        Returns:
+            False if the lane queue is full or the executor is shut down
+        """
+        if self._shutdown:
+            self.metrics.increment(f"executor.{lane}.rejected")
+            return False
+        
+        self._ensure_workers(lane)
+        try:
+            self._queues[lane].put_nowait((time.perf_counter(), func, args, kwargs))
+        except queue.Full:
+            self.metrics.increment(f"executor.{lane}.rejected")
+            print(f"⚠️ {lane} lane queue full - task rejected")
+            return False
+        
+        self.metrics.increment(f"executor.{lane}.submitted")
+        return True
+    
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """
+        Stop accepting tasks, drop queued ones and wait briefly for running tasks
+        
+        Args:
+            timeout: Total seconds to wait for workers to finish
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            workers = {name: list(threads) for name, threads in self._workers.items()}
+        
+        for name, threads in workers.items():
+            lane_queue = self._queues[name]
+            # Drop work that has not started
+            while True:
+                try:
+                    lane_queue.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in threads:
+                lane_queue.put(self._STOP)
+        
+        deadline = time.perf_counter() + timeout
+        for threads in workers.values():
+            for thread in threads:
+                thread.join(max(0.0, deadline - time.perf_counter()))
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get lane status for diagnostics
+        
+        Returns:
+            Lane name -> workers, queued task count and queue bound
+        """
+        return {
+            name: {
+                "workers": len(self._workers[name]),
+                "queued": self._queues[name].qsize(),
+                "max_queue": config.max_queue
+            }
+            for name, config in self.lanes.items()
+        }
+    
+    def _ensure_workers(self, lane: str) -> None:
+        """Start a lane's workers on its first task"""
+        if self._workers[lane]:
+            return
+        with self._lock:
+            if self._workers[lane] or self._shutdown:
+                return
+            config = self.lanes[lane]
+            for index in range(config.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(lane, config.low_priority),
+                    name=f"{lane}-worker-{index}",
+                    daemon=True
+                )
+                thread.start()
+                self._workers[lane].append(thread)
+    
+    def _worker(self, lane: str, low_priority: bool) -> None:
+        """Lane worker loop"""
+        if low_priority:
+            self._lower_thread_priority()
+        lane_queue = self._queues[lane]
+        
+        while True:
+            task = lane_queue.get()
+            if task is self._STOP:
+                return
+            
+            queued_at, func, args, kwargs = task
+            started = time.perf_counter()
+            self.metrics.record_latency(f"executor.{lane}.queue_wait", started - queued_at)
+            try:
+                func(*args, **kwargs)
+                self.metrics.increment(f"executor.{lane}.completed")
+            except Exception as e:
+                self.metrics.increment(f"executor.{lane}.failed")
+                print(f"Task error ({lane}): {e}")
+            finally:
+                self.metrics.record_latency(f"executor.{lane}.run_time", time.perf_counter() - started)
+    
+    @staticmethod
+    def _lower_thread_priority() -> None:
+        """Run background workers below normal priority so they never compete with the UI"""
+        try:
+            import win32api
+            import win32process
+            win32process.SetThreadPriority(win32api.GetCurrentThread(), win32process.THREAD_PRIORITY_LOWEST)
+        except Exception:
+            pass
+
+
+# Global instance
+task_executor = TaskExecutor()
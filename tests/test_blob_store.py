@@ -0,0 +1,69 @@
+"""
+Blob store tests (small PIL images, temporary spill directory)
+"""
+from PIL import Image
+
+from services.blob_store import BlobStore, image_nbytes
+from services.history_record import HistoryRecord
+
+
+class InlineExecutor:
+    """Runs lane tasks immediately on the submitting thread"""
+    
+    def submit(self, lane, func, *args, **kwargs):
+        func(*args, **kwargs)
+        return True
+
+
+def make_image(shade):
+    return Image.new("L", (16, 16), shade)
+
+
+def make_store(tmp_path, images=3):
+    # Room for every image; set_budget() later forces a spill
+    store = BlobStore(max_bytes=images * image_nbytes(make_image(0)), spill_dir=tmp_path / "blobs",
+                      executor=InlineExecutor())
+    handles = [store.put(make_image(shade)) for shade in range(images)]
+    return store, handles
+
+
+def spilled(tmp_path, handles):
+    """Handles whose image was written to the spill directory"""
+    return [handle for handle in handles if (tmp_path / "blobs" / f"{int(handle)}.png").exists()]
+
+
+def test_view_refreshes_recency(tmp_path):
+    store, (first, second, third) = make_store(tmp_path)
+    
+    store.get(first)
+    store.set_budget(2 * image_nbytes(make_image(0)))
+    
+    # The least recently viewed image spills first
+    assert spilled(tmp_path, [first, second, third]) == [second]
+    assert store.get(second).getpixel((0, 0)) == 1
+
+
+def test_save_read_keeps_eviction_order(tmp_path):
+    store, (first, second, third) = make_store(tmp_path)
+    
+    store.get(first, cache=False)
+    store.set_budget(2 * image_nbytes(make_image(0)))
+    
+    assert spilled(tmp_path, [first, second, third]) == [first]
+
+
+def test_record_save_keeps_eviction_order(tmp_path, monkeypatch):
+    store = BlobStore(max_bytes=6 * image_nbytes(make_image(0)), spill_dir=tmp_path / "blobs",
+                      executor=InlineExecutor())
+    monkeypatch.setattr(HistoryRecord, "blobs", store)
+    old = HistoryRecord.from_capture("image", "app.exe", make_image(0), make_image(0), make_image(0))
+    new = HistoryRecord.from_capture("image", "app.exe", make_image(1), make_image(1), make_image(1))
+    
+    old.to_dict()
+    store.set_budget(3 * image_nbytes(make_image(0)))
+    
+    # Saving read the old record's images, but they are still the first to spill
+    assert store.stats()["on_disk"] == 3
+    assert new.content.getpixel((0, 0)) == 1
+    assert new.preview.getpixel((0, 0)) == 1
+    assert store.stats()["reloads"] == 0
@@ -0,0 +1,75 @@
+"""
+Executable index tests (temporary directory tree)
+"""
+import os
+
+from services.executable_index import ExecutableIndex
+
+
+def make_tree(tmp_path):
+    """root/app/app.exe, root/tools/bin/tool.exe, root/readme.txt"""
+    root = tmp_path / "root"
+    (root / "app").mkdir(parents=True)
+    (root / "tools" / "bin").mkdir(parents=True)
+    (root / "app" / "App.exe").write_bytes(b"MZ")
+    (root / "tools" / "bin" / "tool.exe").write_bytes(b"MZ")
+    (root / "readme.txt").write_text("not indexed")
+    return root
+
+
+def make_index(tmp_path, root):
+    return ExecutableIndex(roots=[str(root)], index_file=tmp_path / "executable_index.json")
+
+
+def test_resolves_names_case_insensitively(tmp_path):
+    root = make_tree(tmp_path)
+    index = make_index(tmp_path, root)
+    
+    assert index.refresh() == 4
+    
+    assert index.resolve("app.exe") == os.path.join(str(root), "app", "App.exe")
+    assert index.resolve("TOOL.EXE") == os.path.join(str(root), "tools", "bin", "tool.exe")
+    assert index.resolve("readme.txt") is None
+    assert len(index) == 2
+
+
+def test_refresh_rereads_only_changed_directories(tmp_path):
+    root = make_tree(tmp_path)
+    index = make_index(tmp_path, root)
+    index.refresh()
+    
+    bin_dir = root / "tools" / "bin"
+    (bin_dir / "new.exe").write_bytes(b"MZ")
+    # Make the change visible on file systems with coarse mtimes
+    stat = os.stat(bin_dir)
+    os.utime(bin_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    index.refresh()
+    
+    assert index.last_scanned == 1
+    assert index.resolve("new.exe") == os.path.join(str(bin_dir), "new.exe")
+
+
+def test_index_survives_save_and_load(tmp_path):
+    root = make_tree(tmp_path)
+    index = make_index(tmp_path, root)
+    index.refresh()
+    index.save()
+    
+    restored = make_index(tmp_path, root)
+    assert restored.load()
+    
+    assert restored.resolve("app.exe") == index.resolve("app.exe")
+    assert len(restored) == len(index)
+    # Nothing changed on disk, so the restored table needs no scandir calls
+    assert restored.refresh() == 0
+
+
+def test_load_rejects_index_for_other_roots(tmp_path):
+    root = make_tree(tmp_path)
+    index = make_index(tmp_path, root)
+    index.refresh()
+    index.save()
+    
+    other = ExecutableIndex(roots=[str(tmp_path / "elsewhere")], index_file=tmp_path / "executable_index.json")
+    assert not other.load()
@@ -0,0 +1,133 @@
+"""
+Icon cache tests (fake extractor, temporary cache directory)
+"""
+import os
+import threading
+
+from PIL import Image
+
+from services.icon_cache import IconCache, IconExtractor
+
+
+class FakeExtractor(IconExtractor):
+    """Returns a solid square and counts calls"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def extract(self, exe_path, size):
+        self.calls.append((exe_path, size))
+        return Image.new("RGBA", (size, size), (255, 0, 0, 255))
+
+
+class DeferredExecutor:
+    """Holds lane tasks until run() so tests control when loads happen"""
+    
+    def __init__(self):
+        self.tasks = []
+    
+    def submit(self, lane, func, *args, **kwargs):
+        self.tasks.append((func, args, kwargs))
+        return True
+    
+    def run(self):
+        tasks, self.tasks = self.tasks, []
+        for func, args, kwargs in tasks:
+            func(*args, **kwargs)
+
+
+def make_exe(tmp_path, name="app.exe"):
+    path = tmp_path / name
+    path.write_bytes(b"MZ")
+    return str(path)
+
+
+def make_cache(tmp_path, paths, extractor=None, ready=None, **kwargs):
+    if ready is None:
+        ready = threading.Event()
+        ready.set()
+    executor = DeferredExecutor()
+    cache = IconCache(extractor=extractor or FakeExtractor(), cache_dir=tmp_path / "icons",
+                      resolver=paths.get, executor=executor, resolver_ready=ready, **kwargs)
+    return cache, executor
+
+
+def request(cache, executor, name, size=24):
+    results = []
+    cache.request(name, size, results.append)
+    executor.run()
+    return results
+
+
+def test_parallel_requests_share_one_extraction(tmp_path):
+    paths = {"app.exe": make_exe(tmp_path)}
+    cache, executor = make_cache(tmp_path, paths)
+    results = []
+    
+    cache.request("app.exe", 24, results.append)
+    cache.request("APP.EXE", 24, results.append)
+    executor.run()
+    
+    assert len(cache.extractor.calls) == 1
+    assert len(results) == 2 and results[0] is results[1]
+    assert results[0].size == (24, 24)
+
+
+def test_second_instance_reads_icon_from_disk(tmp_path):
+    paths = {"app.exe": make_exe(tmp_path)}
+    first, first_executor = make_cache(tmp_path, paths)
+    request(first, first_executor, "app.exe")
+    
+    second, second_executor = make_cache(tmp_path, paths)
+    results = request(second, second_executor, "app.exe")
+    
+    assert second.extractor.calls == []
+    assert results[0].size == (24, 24)
+
+
+def test_changed_executable_is_extracted_again(tmp_path):
+    exe_path = make_exe(tmp_path)
+    paths = {"app.exe": exe_path}
+    first, first_executor = make_cache(tmp_path, paths)
+    request(first, first_executor, "app.exe")
+    
+    stat = os.stat(exe_path)
+    os.utime(exe_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second, second_executor = make_cache(tmp_path, paths)
+    request(second, second_executor, "app.exe")
+    
+    assert second.extractor.calls == [(exe_path, 24)]
+
+
+def test_miss_not_cached_until_resolver_ready(tmp_path):
+    paths = {}
+    ready = threading.Event()
+    cache, executor = make_cache(tmp_path, paths, ready=ready)
+    
+    assert request(cache, executor, "late.exe") == [None]
+    assert cache.get_cached("late.exe", 24) is None
+    
+    # The index finds the executable later
+    paths["late.exe"] = make_exe(tmp_path, "late.exe")
+    results = request(cache, executor, "late.exe")
+    assert results[0] is not None
+    
+    # Once the index is complete, a miss is remembered
+    ready.set()
+    assert request(cache, executor, "gone.exe") == [None]
+    results = []
+    cache.request("gone.exe", 24, results.append)
+    assert results == [None]
+    assert executor.tasks == []
+
+
+def test_memory_is_bounded(tmp_path):
+    paths = {name: make_exe(tmp_path, name) for name in ("a.exe", "b.exe", "c.exe")}
+    cache, executor = make_cache(tmp_path, paths, max_entries=2)
+    
+    for name in paths:
+        request(cache, executor, name)
+    
+    assert cache.get_cached("a.exe", 24) is None
+    assert cache.get_cached("b.exe", 24) is not None
+    assert cache.get_cached("c.exe", 24) is not None
@@ -0,0 +1,224 @@
+"""
+Paste pipeline tests (caller-driven event loop on a virtual clock, inline lanes)
+"""
+import asyncio
+import json
+import os
+import selectors
+
+import pytest
+
+from config.config_manager import ConfigManager
+from core.app import PasteGuardianApp
+from core.pipeline import PastePipeline, StageTimeouts, TkBridge
+from services.grant_service import GrantService
+from services.task_executor import TaskExecutor
+
+
+class InlineExecutor:
+    """Runs lane tasks immediately on the submitting thread"""
+    
+    def submit(self, lane, func, *args, **kwargs):
+        func(*args, **kwargs)
+        return True
+
+
+class VirtualClockSelector(selectors.DefaultSelector):
+    """Selector that never sleeps: with nothing ready it jumps the loop clock to the next timer"""
+    
+    def __init__(self):
+        super().__init__()
+        self.loop = None
+    
+    def select(self, timeout=None):
+        events = super().select(0)
+        if not events and timeout:
+            self.loop.now += timeout
+        return events
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Event loop whose time() only moves when every task is waiting on a timer"""
+    
+    def __init__(self):
+        selector = VirtualClockSelector()
+        super().__init__(selector)
+        selector.loop = self
+        self.now = 0.0
+    
+    def time(self):
+        return self.now
+
+
+class FrontEnd:
+    """Records pipeline callbacks instead of showing popups and sending keys"""
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.prompts = []  # (clipboard_data, resolve)
+        self.dismissed = []
+        self.rejected = []
+        self.pasted = []  # (clipboard_data, allowed by policy at paste time)
+    
+    def present(self, clipboard_data, process_name, resolve):
+        self.prompts.append((clipboard_data, resolve))
+    
+    def dismiss(self, clipboard_data):
+        self.dismissed.append(clipboard_data)
+    
+    def paste(self, clipboard_data, requested_at, answer):
+        self.pasted.append((clipboard_data, self.engine.evaluate(clipboard_data, "app.exe").allowed))
+    
+    def reject(self, clipboard_data):
+        self.rejected.append(clipboard_data)
+
+
+@pytest.fixture
+def loop():
+    loop = VirtualClockLoop()
+    loop.pipelines = []
+    yield loop
+    for pipeline in loop.pipelines:
+        pipeline.stop()
+    loop.close()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return PasteGuardianApp(
+        config=ConfigManager(str(tmp_path / "config.json"), str(tmp_path / "history.json")),
+        grants=GrantService(grants_file=tmp_path / "session_grants.json"),
+        persist_history=False
+    )
+
+
+def make_pipeline(loop, engine, front, executor=None, **kwargs):
+    pipeline = PastePipeline(
+        engine, TkBridge(lambda callback: callback()),
+        present=front.present, dismiss=front.dismiss, paste=front.paste, reject=front.reject,
+        executor=executor or InlineExecutor(), loop=loop, **kwargs
+    )
+    pipeline.start()
+    loop.pipelines.append(pipeline)
+    return pipeline
+
+
+def run_until(loop, condition, timeout=2.0):
+    """Drive the caller-owned loop until condition() holds (timeout in virtual seconds)"""
+    async def wait():
+        while not condition():
+            await asyncio.sleep(0.001)
+    loop.run_until_complete(asyncio.wait_for(wait(), timeout))
+
+
+def advance(loop, seconds):
+    """Let virtual time pass, running everything that becomes due"""
+    loop.run_until_complete(asyncio.sleep(seconds))
+
+
+class PersistOnRun(InlineExecutor):
+    """Runs paste-lane tasks inline and holds background-lane tasks until run()"""
+    
+    def __init__(self):
+        self.background = []
+    
+    def submit(self, lane, func, *args, **kwargs):
+        if lane == TaskExecutor.BACKGROUND:
+            self.background.append((func, args, kwargs))
+            return True
+        return super().submit(lane, func, *args, **kwargs)
+    
+    def run(self):
+        tasks, self.background = self.background, []
+        for func, args, kwargs in tasks:
+            func(*args, **kwargs)
+
+
+def test_always_allow_whitelists_before_paste(loop, engine):
+    front = FrontEnd(engine)
+    pipeline = make_pipeline(loop, engine, front)
+    data = {"type": "text", "content": "hello"}
+    
+    pipeline.submit(data, "app.exe")
+    run_until(loop, lambda: front.prompts)
+    front.prompts[0][1]("always_allow")
+    run_until(loop, lambda: front.pasted)
+    
+    assert front.pasted == [(data, True)]
+    assert engine.history.count() == 1
+
+
+def test_always_allow_writes_config_on_background_lane(loop, engine):
+    front = FrontEnd(engine)
+    executor = PersistOnRun()
+    pipeline = make_pipeline(loop, engine, front, executor=executor)
+    saved = []
+    engine.config.add_listener(saved.append)
+    data = {"type": "text", "content": "hello"}
+    
+    pipeline.submit(data, "app.exe")
+    run_until(loop, lambda: front.prompts)
+    front.prompts[0][1]("always_allow")
+    run_until(loop, lambda: front.pasted)
+    
+    # Whitelisted in memory for the paste, file untouched so far
+    assert front.pasted == [(data, True)]
+    assert not os.path.exists(engine.config.config_file)
+    assert saved == []
+    
+    executor.run()
+    
+    with open(engine.config.config_file, encoding="utf-8") as f:
+        assert json.load(f)["whitelist"] == ["app.exe"]
+    assert saved == ["whitelist"]
+
+
+def test_cancel_rejects_without_paste(loop, engine):
+    front = FrontEnd(engine)
+    pipeline = make_pipeline(loop, engine, front)
+    data = {"type": "text", "content": "hello"}
+    
+    pipeline.submit(data, "app.exe")
+    run_until(loop, lambda: front.prompts)
+    front.prompts[0][1]("cancel")
+    run_until(loop, lambda: front.rejected)
+    
+    assert front.rejected == [data]
+    assert front.pasted == []
+
+
+def test_unanswered_prompt_times_out_and_is_denied(loop, engine):
+    front = FrontEnd(engine)
+    pipeline = make_pipeline(loop, engine, front, timeouts=StageTimeouts(confirm=30.0))
+    data = {"type": "text", "content": "hello"}
+    
+    pipeline.submit(data, "app.exe")
+    run_until(loop, lambda: front.prompts)
+    shown_at = loop.time()
+    
+    advance(loop, 29.9)
+    assert front.rejected == []
+    
+    advance(loop, 0.2)
+    assert front.rejected == [data]
+    assert front.dismissed == [data]
+    assert front.pasted == []
+    assert loop.time() - shown_at >= 30.0
+
+
+def test_new_prompt_replaces_open_one(loop, engine):
+    front = FrontEnd(engine)
+    pipeline = make_pipeline(loop, engine, front)
+    first = {"type": "text", "content": "first"}
+    second = {"type": "text", "content": "second"}
+    
+    pipeline.submit(first, "app.exe")
+    run_until(loop, lambda: front.prompts)
+    pipeline.submit(second, "app.exe")
+    run_until(loop, lambda: len(front.prompts) == 2)
+    front.prompts[1][1]("confirm")
+    run_until(loop, lambda: front.pasted)
+    
+    assert front.dismissed == [first]
+    assert front.rejected == [first]
+    assert front.pasted == [(second, False)]
@@ -0,0 +1,46 @@
+"""
+Batch scanner tests
+"""
+import json
+
+from core import scan_cli
+
+
+def write_crossing_file(tmp_path):
+    """File whose only email starts 2 bytes before the first 4096-byte chunk boundary"""
+    path = tmp_path / "crossing.txt"
+    path.write_bytes(b" " * 4094 + b"a.b@example.com" + b" " * 100)
+    return path
+
+
+def run_scan(path, chunk_bytes, capsys):
+    """Run the CLI on one file and return its findings"""
+    chunk_mb = chunk_bytes / (1024 * 1024)
+    status = scan_cli.main([str(path), "--workers", "1", "--chunk-mb", str(chunk_mb), "--show-match"])
+    lines = capsys.readouterr().out.splitlines()
+    return status, [json.loads(line) for line in lines]
+
+
+def test_match_crossing_chunk_boundary_reported_once(tmp_path, capsys):
+    path = write_crossing_file(tmp_path)
+    
+    status, findings = run_scan(path, scan_cli.CHUNK_OVERLAP, capsys)
+    
+    assert status == 1
+    assert [(f["offset"], f["length"], f["match"]) for f in findings] == [(4094, 15, "a.b@example.com")]
+
+
+def test_findings_do_not_depend_on_chunk_size(tmp_path, capsys):
+    path = write_crossing_file(tmp_path)
+    
+    _, small_chunks = run_scan(path, scan_cli.CHUNK_OVERLAP, capsys)
+    _, one_chunk = run_scan(path, 1024 * 1024, capsys)
+    
+    assert small_chunks == one_chunk
+
+
+def test_scan_range_skips_match_started_in_previous_chunk():
+    data = b" " * 4094 + b"a.b@example.com" + b" " * 100
+    
+    assert scan_cli.scan_range(data, 4096, len(data), show_match=False) == []
+    assert len(scan_cli.scan_range(data, 0, 4096, show_match=False)) == 1
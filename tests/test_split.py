@@ -0,0 +1,228 @@
+"""
+Split-UI tests (IPC round trips, hook host with fake backends)
+"""
+import pytest
+from PIL import Image
+
+from config.config_manager import ConfigManager
+from core.app import PasteGuardianApp
+from core.ipc import MessageType, RemoteImage, decode_message, decode_prompt, encode_message, encode_prompt
+from core.split import FakeInjector, FakeMonitor, HookHost
+from services.grant_service import GrantService
+from services.scan_service import SensitiveSpan
+
+
+class InlineExecutor:
+    """Runs lane tasks immediately on the submitting thread"""
+    
+    def submit(self, lane, func, *args, **kwargs):
+        func(*args, **kwargs)
+        return True
+    
+    def shutdown(self):
+        pass
+
+
+class DeferredExecutor(InlineExecutor):
+    """Holds lane tasks until run() so tests see what the hook thread did"""
+    
+    def __init__(self):
+        self.tasks = []
+    
+    def submit(self, lane, func, *args, **kwargs):
+        self.tasks.append((func, args, kwargs))
+        return True
+    
+    def run(self):
+        tasks, self.tasks = self.tasks, []
+        for func, args, kwargs in tasks:
+            func(*args, **kwargs)
+
+
+class FakeChannel:
+    """Records sent messages and replays queued incoming ones"""
+    
+    def __init__(self, connected=True):
+        self.connected = connected
+        self.sent = []  # decoded messages
+        self.incoming = []
+        self.closed = False
+    
+    def send(self, message_type, request_id=0, payload=None, blob=b""):
+        if not self.connected:
+            return False
+        self.sent.append(decode_message(encode_message(message_type, request_id, payload, blob)))
+        return True
+    
+    def recv(self, timeout=None):
+        if not self.incoming:
+            raise EOFError("IPC channel closed")
+        return self.incoming.pop(0)
+    
+    def close(self):
+        self.closed = True
+    
+    def prompts(self):
+        return [message for message in self.sent if message.type == MessageType.PROMPT]
+
+
+class RecordingCoalescer:
+    """Records burst resolutions"""
+    
+    def __init__(self):
+        self.resolved = []
+    
+    def resolve(self, key, approved):
+        self.resolved.append((key, approved))
+        return 0
+
+
+def decision(request_id, action="confirm"):
+    return decode_message(encode_message(MessageType.DECISION, request_id, {"action": action}))
+
+
+def shutdown():
+    return decode_message(encode_message(MessageType.SHUTDOWN))
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return PasteGuardianApp(
+        config=ConfigManager(str(tmp_path / "config.json"), str(tmp_path / "history.json")),
+        grants=GrantService(grants_file=tmp_path / "session_grants.json"),
+        persist_history=False
+    )
+
+
+def make_host(engine, channel, executor=None):
+    host = HookHost(channel, engine=engine, monitor_factory=FakeMonitor,
+                    injector_factory=FakeInjector, executor=executor or InlineExecutor())
+    host.monitor.coalescer = RecordingCoalescer()
+    return host
+
+
+def paste(host, content, burst_key):
+    host.monitor.trigger({"type": "text", "content": content, "burst_key": burst_key}, "app.exe")
+
+
+def test_message_round_trip():
+    payload = {"action": "allow_for", "minutes": 15, "note": "ünïcode"}
+    
+    message = decode_message(encode_message(MessageType.DECISION, 7, payload, b"\x00\x01blob"))
+    
+    assert message.type == MessageType.DECISION
+    assert message.request_id == 7
+    assert message.payload == payload
+    assert message.blob == b"\x00\x01blob"
+    
+    empty = decode_message(encode_message(MessageType.SHUTDOWN))
+    assert (empty.type, empty.request_id, empty.payload, empty.blob) == (MessageType.SHUTDOWN, 0, {}, b"")
+
+
+def test_text_prompt_round_trip():
+    content = "key sk-" + "x" * 300
+    clipboard_data = {
+        "type": "text",
+        "content": content,
+        "is_sensitive": True,
+        "sensitive_spans": [SensitiveSpan(4, 303, "api_key")]
+    }
+    payload, blob = encode_prompt(clipboard_data, "app.exe")
+    
+    data, process_name = decode_prompt(decode_message(encode_message(MessageType.PROMPT, 3, payload, blob)))
+    
+    assert process_name == "app.exe"
+    assert data["content"] == content
+    assert data["preview"] == content[:200] + "..."
+    assert data["sensitive_spans"] == [SensitiveSpan(4, 303, "api_key")]
+    assert data["is_sensitive"] and data["request_id"] == 3
+
+
+def test_image_prompt_sends_preview_only():
+    content = Image.new("RGB", (1920, 1080), (0, 128, 255))
+    preview = Image.new("RGB", (150, 84), (0, 128, 255))
+    payload, blob = encode_prompt({"type": "image", "content": content, "preview": preview}, "paint.exe")
+    
+    data, process_name = decode_prompt(decode_message(encode_message(MessageType.PROMPT, 1, payload, blob)))
+    
+    assert process_name == "paint.exe"
+    assert data["content"] == RemoteImage(1920, 1080)
+    assert data["preview"].size == (150, 84)
+    assert data["preview"].getpixel((0, 0)) == (0, 128, 255)
+
+
+def test_hook_callback_only_queues_the_request(engine):
+    channel = FakeChannel()
+    executor = DeferredExecutor()
+    host = make_host(engine, channel, executor)
+    
+    paste(host, "hello", "a")
+    
+    assert channel.sent == []
+    assert len(executor.tasks) == 1
+    
+    executor.run()
+    assert [message.request_id for message in channel.prompts()] == [1]
+
+
+def test_replaced_prompt_is_denied(engine):
+    channel = FakeChannel()
+    host = make_host(engine, channel)
+    
+    paste(host, "first", "a")
+    paste(host, "second", "b")
+    channel.incoming = [decision(1), decision(2), shutdown()]
+    host.run()
+    
+    assert [message.request_id for message in channel.prompts()] == [1, 2]
+    assert host.monitor.coalescer.resolved == [("a", False)]
+    assert [data["content"] for data in host.injector.injected] == ["second"]
+
+
+def test_stale_decision_is_ignored(engine):
+    channel = FakeChannel()
+    host = make_host(engine, channel)
+    
+    paste(host, "hello", "a")
+    channel.incoming = [decision(1), decision(1, "cancel"), decision(99), shutdown()]
+    host.run()
+    
+    assert [data["content"] for data in host.injector.injected] == ["hello"]
+    assert host.monitor.coalescer.resolved == []
+
+
+def test_send_failure_fails_closed(engine):
+    channel = FakeChannel(connected=False)
+    host = make_host(engine, channel)
+    
+    paste(host, "hello", "a")
+    
+    assert host.injector.injected == []
+    assert host.monitor.coalescer.resolved == [("a", False)]
+    
+    # A late answer to the failed prompt does not paste
+    channel.incoming = [decision(1), shutdown()]
+    host.run()
+    assert host.injector.injected == []
+
+
+def test_sync_history_adds_only_new_items(tmp_path, engine):
+    hook_engine = PasteGuardianApp(
+        config=ConfigManager(str(tmp_path / "config.json"), str(tmp_path / "history.json")),
+        grants=GrantService(grants_file=tmp_path / "hook_grants.json"),
+        persist_history=False
+    )
+    hook_engine.record_history({"type": "text", "content": "first"}, "app.exe")
+    hook_engine.save_history()
+    
+    assert engine.sync_history() == 1
+    first = engine.get_history()[0]
+    
+    hook_engine.record_history({"type": "text", "content": "second"}, "app.exe")
+    hook_engine.save_history()
+    
+    assert engine.sync_history() == 1
+    assert [item.content for item in engine.get_history()] == ["second", "first"]
+    # Items already held are kept as they are, not rebuilt from the file
+    assert engine.get_history()[1] is first
+    assert engine.sync_history() == 0
@@ -1,5 +1,17 @@
 """UI module"""
-from .confirmation_popup import ConfirmationPopup
-from .settings_window import SettingsWindow
+import importlib
+
+# Heavy UI modules are imported on first attribute access (keeps startup fast)
+_LAZY_EXPORTS = {
+    'ConfirmationPopup': '.confirmation_popup',
+    'SettingsWindow': '.settings_window',
+}
 
 __all__ = ['ConfirmationPopup', 'SettingsWindow']
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
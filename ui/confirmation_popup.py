@@ -6,133 +6,131 @@ import customtkinter as ctk
 from PIL import Image, ImageTk
 from typing import Callable, Optional
 import tkinter as tk
-import re
+import threading
+import time
+from bisect import bisect_right
+from services.metrics_service import metrics_service
+from ui.image_cache import image_cache
+from utils.image_utils import PREVIEW_SIZE
 
 class ConfirmationPopup:
-    """Paste confirmation popup window"""
+    """Paste confirmation popup window (built once, re-populated per request)"""
     
-    def __init__(self, clipboard_data: dict, process_name: str, 
-                 on_confirm: Callable, on_always_allow: Callable, on_cancel: Callable, opacity: float = 0.95):
-        self.clipboard_data = clipboard_data
-        self.process_name = process_name
-        self.on_confirm = on_confirm
-        self.on_always_allow = on_always_allow
-        self.on_cancel = on_cancel
+    # Full-content viewer: characters held in the textbox at once
+    VIEWER_PAGE_CHARS = 20000
+    
+    # Characters the viewer window slides by when scrolling past its edge
+    VIEWER_SHIFT_CHARS = 10000
+    
+    # Character drawn over masked sensitive matches
+    MASK_CHAR = "•"
+    
+    def __init__(self, parent=None, opacity: float = 0.95, grant_minutes: int = 10,
+                 mask_sensitive: bool = False):
+        self.parent = parent
         self.opacity = opacity
+        self.grant_minutes = grant_minutes
+        self.mask_sensitive = mask_sensitive
         self.window = None
         self.result = None
-        # Detect sensitive information (get directly from clipboard data)
-        self.is_security_risk = clipboard_data.get("is_sensitive", False) or self._check_security_risk()
-    
-    def _check_security_risk(self) -> bool:
-        """Detect security risk patterns"""
-        if self.clipboard_data.get("type") != "text":
-            return False
         
-        content = self.clipboard_data.get("content", "")
-        
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        # Card number pattern (16 digits, hyphens allowed)
-        card_pattern = r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b'
-        
-        if re.search(email_pattern, content) or re.search(card_pattern, content):
-            return True
-        
-        return False
+        # Current request
+        self.clipboard_data = {}
+        self.process_name = ""
+        self.on_confirm = None
+        self.on_always_allow = None
+        self.on_cancel = None
+        self.on_allow_for = None  # Time-boxed session approval (optional)
+        self.is_security_risk = False
+        self.sensitive_spans = []  # (offset, length, category) from the capture-time scan
+        self.span_offsets = []  # Span start offsets for bisect
+        
+        # Set once the window is hidden (paste injection waits on this)
+        self.closed = threading.Event()
+        self.closed.set()
+    
+    def is_built(self) -> bool:
+        """Check whether the pooled window exists"""
+        return self.window is not None and self.window.winfo_exists()
+    
+    def prepare(self):
+        """Build the popup window once and keep it withdrawn (call while idle)"""
+        if self.is_built():
+            return
         
-    def show(self):
-        """Show popup window"""
-        self.window = ctk.CTkToplevel()
+        self.window = ctk.CTkToplevel(self.parent)
+        self.window.withdraw()
         self.window.title("Paste Confirmation")
         
         # Window settings
         self.window.attributes('-topmost', True)
-        self.window.attributes('-alpha', 0.0)  # Initially transparent
         self.window.overrideredirect(True)  # Remove title bar
         
         # Background color
         self.window.configure(fg_color="#1E1E1E")
         
-        # Get mouse position
-        x, y = self.window.winfo_pointerx(), self.window.winfo_pointery()
-        
-        # Red border when security risk detected
-        border_color = "#DC2626" if self.is_security_risk else "#3B82F6"
-        
         # Main frame
-        main_frame = ctk.CTkFrame(
+        self.main_frame = ctk.CTkFrame(
             self.window,
             fg_color="#1E1E1E",
             corner_radius=10,
             border_width=2,
-            border_color=border_color
+            border_color="#3B82F6"
         )
-        main_frame.pack(padx=0, pady=0, fill="both", expand=True)
+        self.main_frame.pack(padx=0, pady=0, fill="both", expand=True)
         
         # Header
-        header_frame = ctk.CTkFrame(
-            main_frame,
+        self.header_frame = ctk.CTkFrame(
+            self.main_frame,
             fg_color="#2D2D2D",
             corner_radius=10,
             height=50
         )
-        header_frame.pack(padx=15, pady=(15, 10), fill="x")
-        header_frame.pack_propagate(False)
+        self.header_frame.pack(padx=15, pady=(15, 10), fill="x")
+        self.header_frame.pack_propagate(False)
         
         # Icon and title (warning shown on security risk)
-        if self.is_security_risk:
-            title_text = "⚠️ Sensitive Data Detected!"
-            title_color = "#DC2626"
-        else:
-            title_text = "🔒 Paste Request"
-            title_color = "#3B82F6"
-        
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text=title_text,
+        self.title_label = ctk.CTkLabel(
+            self.header_frame,
+            text="🔒 Paste Request",
             font=("Segoe UI", 16, "bold"),
-            text_color=title_color
+            text_color="#3B82F6"
         )
-        title_label.pack(side="left", padx=15, pady=10)
-        
-        # Additional security warning message
-        if self.is_security_risk:
-            warning_label = ctk.CTkLabel(
-                main_frame,
-                text="⚠️ This content may contain sensitive information (email, phone, card number)",
-                font=("Segoe UI", 10),
-                text_color="#EF4444",
-                wraplength=400
-            )
-            warning_label.pack(padx=15, pady=(5, 0), anchor="w")
+        self.title_label.pack(side="left", padx=15, pady=10)
         
         # Process information (large on top right)
-        process_label = ctk.CTkLabel(
-            header_frame,
-            text=f"Target: {self.process_name}",
+        self.process_label = ctk.CTkLabel(
+            self.header_frame,
+            text="",
             font=("Segoe UI", 13, "bold"),
             text_color="#10B981"
         )
-        process_label.pack(side="right", padx=15, pady=10)
+        self.process_label.pack(side="right", padx=15, pady=10)
+        
+        # Additional security warning message (packed only on security risk)
+        self.warning_label = ctk.CTkLabel(
+            self.main_frame,
+            text="⚠️ This content may contain sensitive information (email, phone, card number)",
+            font=("Segoe UI", 10),
+            text_color="#EF4444",
+            wraplength=400
+        )
         
         # Content frame
-        content_frame = ctk.CTkFrame(
-            main_frame,
+        self.content_frame = ctk.CTkFrame(
+            self.main_frame,
             fg_color="#252525",
             corner_radius=10
         )
-        content_frame.pack(padx=15, pady=10, fill="both", expand=True)
+        self.content_frame.pack(padx=15, pady=10, fill="both", expand=True)
         
-        # Preview based on content type
-        if self.clipboard_data["type"] == "text":
-            self._create_text_preview(content_frame)
-        elif self.clipboard_data["type"] == "image":
-            self._create_image_preview(content_frame)
+        # Preview widgets for both content types (only one is packed at a time)
+        self._create_text_preview(self.content_frame)
+        self._create_image_preview(self.content_frame)
         
         # Button frame (perfectly balanced layout)
         button_frame = ctk.CTkFrame(
-            main_frame,
+            self.main_frame,
             fg_color="transparent"
         )
         button_frame.pack(padx=20, pady=(10, 20), fill="x")
@@ -181,6 +179,110 @@ class ConfirmationPopup:
         )
         confirm_btn.grid(row=0, column=2, padx=(5, 0), sticky="ew")
         
+        # Allow for N minutes (session grant for this app and content type)
+        self.allow_for_btn = ctk.CTkButton(
+            button_frame,
+            text="",
+            command=self._on_allow_for_click,
+            fg_color="transparent",
+            hover_color="#2D2D2D",
+            border_width=1,
+            border_color="#3B82F6",
+            corner_radius=10,
+            height=32,
+            font=("Segoe UI", 11)
+        )
+        
+        # Cancel with ESC key
+        self.window.bind("<Escape>", lambda e: self._on_cancel_click())
+        
+        # Cancel when clicking outside window (optional)
+        # self.window.bind("<FocusOut>", lambda e: self._on_cancel_click())
+        
+        # Lay out once so the first show does not pay for it
+        self.window.update_idletasks()
+    
+    def present(self, clipboard_data: dict, process_name: str,
+                on_confirm: Callable, on_always_allow: Callable, on_cancel: Callable,
+                on_allow_for: Optional[Callable] = None, opacity: Optional[float] = None,
+                grant_minutes: Optional[int] = None, mask_sensitive: Optional[bool] = None):
+        """Re-populate the pooled window with a new request and show it"""
+        started_at = time.perf_counter()
+        cold = not self.is_built()
+        
+        self.clipboard_data = clipboard_data
+        self.process_name = process_name
+        self.on_confirm = on_confirm
+        self.on_always_allow = on_always_allow
+        self.on_cancel = on_cancel
+        self.on_allow_for = on_allow_for
+        if opacity is not None:
+            self.opacity = opacity
+        if grant_minutes is not None:
+            self.grant_minutes = grant_minutes
+        if mask_sensitive is not None:
+            self.mask_sensitive = mask_sensitive
+        self.result = None
+        self.closed = threading.Event()
+        
+        # Sensitive spans were found by the monitor's scan - no regex work on the Tk thread
+        self.sensitive_spans = clipboard_data.get("sensitive_spans") or []
+        self.span_offsets = [span.offset for span in self.sensitive_spans]
+        self.is_security_risk = clipboard_data.get("is_sensitive", False)
+        
+        self.prepare()
+        self._populate()
+        self.show()
+        
+        # Time-to-visible (cold = window built for this request)
+        elapsed = time.perf_counter() - started_at
+        metrics_service.record_latency(
+            "popup.time_to_visible_cold" if cold else "popup.time_to_visible_warm", elapsed
+        )
+        print(f"Popup visible in {elapsed * 1000:.1f} ms ({'cold' if cold else 'warm'})")
+    
+    def _populate(self):
+        """Update widgets in place for the current request"""
+        # Red border when security risk detected
+        border_color = "#DC2626" if self.is_security_risk else "#3B82F6"
+        self.main_frame.configure(border_color=border_color)
+        
+        if self.is_security_risk:
+            self.title_label.configure(text="⚠️ Sensitive Data Detected!", text_color="#DC2626")
+            categories = sorted({span.category for span in self.sensitive_spans})
+            self.warning_label.configure(
+                text=f"⚠️ This content may contain sensitive information ({', '.join(categories) or 'email, phone, card number'})"
+            )
+            self.warning_label.pack(padx=15, pady=(5, 0), anchor="w", after=self.header_frame)
+        else:
+            self.title_label.configure(text="🔒 Paste Request", text_color="#3B82F6")
+            self.warning_label.pack_forget()
+        
+        self.process_label.configure(text=f"Target: {self.process_name}")
+        
+        # Preview based on content type
+        if self.clipboard_data["type"] == "text":
+            self.image_preview_frame.pack_forget()
+            self.text_preview_frame.pack(fill="both", expand=True)
+            self._populate_text_preview()
+        elif self.clipboard_data["type"] == "image":
+            self.text_preview_frame.pack_forget()
+            self.image_preview_frame.pack(fill="both", expand=True)
+            self._populate_image_preview()
+        
+        if self.on_allow_for:
+            self.allow_for_btn.configure(
+                text=f"⏱ Allow {self.clipboard_data['type']} for {self.grant_minutes} min"
+            )
+            self.allow_for_btn.grid(row=1, column=0, columnspan=3, pady=(10, 0), sticky="ew")
+        else:
+            self.allow_for_btn.grid_remove()
+    
+    def show(self):
+        """Show popup window near the mouse cursor"""
+        # Get mouse position
+        x, y = self.window.winfo_pointerx(), self.window.winfo_pointery()
+        
         # Adjust window size and position
         self.window.update_idletasks()
         width = 450
@@ -195,22 +297,21 @@ class ConfirmationPopup:
         
         self.window.geometry(f"{width}x{height}+{x}+{y}")
         
-        # Cancel with ESC key
-        self.window.bind("<Escape>", lambda e: self._on_cancel_click())
-        
-        # Cancel when clicking outside window (optional)
-        # self.window.bind("<FocusOut>", lambda e: self._on_cancel_click())
+        # Show instantly (no fade - window is already built)
+        self.window.attributes('-alpha', self.opacity)
+        self.window.deiconify()
+        self.window.lift()
         
         # Set focus
         self.window.focus_force()
-        
-        # Fade-in animation
-        self._animate_show()
-        
+        self.window.update_idletasks()
+    
     def _create_text_preview(self, parent):
         """Generate text preview"""
+        self.text_preview_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        
         label = ctk.CTkLabel(
-            parent,
+            self.text_preview_frame,
             text="📄 Text Content:",
             font=("Segoe UI", 12, "bold"),
             text_color="#FFFFFF",
@@ -219,8 +320,8 @@ class ConfirmationPopup:
         label.pack(padx=15, pady=(15, 5), anchor="w")
         
         # Text box
-        textbox = ctk.CTkTextbox(
-            parent,
+        self.textbox = ctk.CTkTextbox(
+            self.text_preview_frame,
             fg_color="#1E1E1E",
             corner_radius=8,
             height=120,
@@ -228,25 +329,258 @@ class ConfirmationPopup:
             wrap="word",
             activate_scrollbars=True
         )
-        textbox.pack(padx=15, pady=(0, 15), fill="both", expand=True)
-        textbox.insert("1.0", self.clipboard_data["preview"])
-        textbox.configure(state="disabled")
+        self.textbox.pack(padx=15, pady=(0, 15), fill="both", expand=True)
+        self.textbox.configure(state="disabled")
+        self.textbox.tag_config("sensitive", background="#3F1D1D", foreground="#FCA5A5", underline=True)
+        self.textbox.tag_config("current_match", background="#B45309", foreground="#FFFFFF")
+        self.textbox.tag_raise("current_match")
+        
+        # Slide the viewer window when scrolling near its edges
+        self.textbox.bind("<MouseWheel>", self._on_viewer_scroll, add="+")
+        self.textbox.bind("<KeyRelease>", self._on_viewer_scroll, add="+")
+        
+        # Length information (packed only for long content)
+        self.length_label = ctk.CTkLabel(
+            self.text_preview_frame,
+            text="",
+            font=("Segoe UI", 10),
+            text_color="#888888"
+        )
+        
+        # Expand/collapse full-content viewer (packed only when there is more to see)
+        self.view_full_btn = ctk.CTkButton(
+            self.text_preview_frame,
+            text="🔍 View full content",
+            command=self._toggle_full_viewer,
+            fg_color="transparent",
+            hover_color="#2D2D2D",
+            border_width=1,
+            border_color="#3B82F6",
+            corner_radius=8,
+            height=28,
+            font=("Segoe UI", 10)
+        )
+        
+        # Viewer navigation (packed only while the viewer is open)
+        self.viewer_nav = ctk.CTkFrame(self.text_preview_frame, fg_color="transparent")
+        
+        nav_buttons = [
+            ("◀", lambda: self._page_viewer(-1)),
+            ("▶", lambda: self._page_viewer(1)),
+            ("⚠ ◀", lambda: self._jump_to_match(-1)),
+            ("⚠ ▶", lambda: self._jump_to_match(1)),
+        ]
+        for text, command in nav_buttons:
+            ctk.CTkButton(
+                self.viewer_nav,
+                text=text,
+                command=command,
+                width=44,
+                height=26,
+                corner_radius=6,
+                fg_color="#2D2D2D",
+                hover_color="#3B82F6",
+                font=("Segoe UI", 10, "bold")
+            ).pack(side="left", padx=(0, 4))
+        
+        self.viewer_pos_label = ctk.CTkLabel(
+            self.viewer_nav,
+            text="",
+            font=("Segoe UI", 10),
+            text_color="#888888"
+        )
+        self.viewer_pos_label.pack(side="left", padx=(6, 0))
+        
+        self.viewer_active = False
+        self.viewer_start = 0
+        self.match_index = -1
+    
+    def _populate_text_preview(self):
+        """Fill text preview for the current request"""
+        # Always start collapsed
+        self.viewer_active = False
+        self.match_index = -1
+        self.viewer_nav.pack_forget()
+        self.textbox.configure(height=120)
+        self.textbox.tag_remove("current_match", "1.0", "end")
+        
+        # Preview is the first 200 characters (plus "...") of the content
+        preview = self.clipboard_data["preview"]
+        self._set_text_with_spans(0, min(len(preview), 200), suffix=preview[200:])
         
         # Length information
         full_length = len(self.clipboard_data["content"])
         if full_length > 200:
-            info_label = ctk.CTkLabel(
-                parent,
-                text=f"Total length: {full_length} characters",
-                font=("Segoe UI", 10),
-                text_color="#888888"
+            self.length_label.configure(text=f"Total length: {full_length} characters")
+            self.length_label.pack(padx=15, pady=(0, 10))
+        else:
+            self.length_label.pack_forget()
+        
+        if full_length > 200 or self.sensitive_spans:
+            self.view_full_btn.configure(text="🔍 View full content")
+            self.view_full_btn.pack(padx=15, pady=(0, 10), fill="x")
+        else:
+            self.view_full_btn.pack_forget()
+    
+    def _toggle_full_viewer(self):
+        """Expand the paged full-content viewer or collapse back to the preview"""
+        if self.viewer_active:
+            self._populate_text_preview()
+        else:
+            self.viewer_active = True
+            self.textbox.configure(height=300)
+            self.viewer_nav.pack(padx=15, pady=(0, 10), fill="x", before=self.view_full_btn)
+            self.view_full_btn.configure(text="▲ Collapse")
+            self._render_viewer_window(0)
+        self._fit_window()
+    
+    def _render_viewer_window(self, start: int, anchor_offset: Optional[int] = None):
+        """Load one window of the full content into the textbox"""
+        content = self.clipboard_data["content"]
+        start = max(0, min(start, len(content) - self.VIEWER_PAGE_CHARS))
+        end = min(len(content), start + self.VIEWER_PAGE_CHARS)
+        self.viewer_start = start
+        
+        # Never more than VIEWER_PAGE_CHARS in Tk at once
+        self._set_text_with_spans(start, end)
+        
+        self._highlight_current_match()
+        self._update_viewer_label()
+        self.textbox.see(self._viewer_index(start if anchor_offset is None else anchor_offset))
+    
+    def _spans_in_range(self, start: int, end: int):
+        """Sensitive spans overlapping [start, end), clipped to it"""
+        # Spans are sorted and non-overlapping; start from the last one beginning before start
+        first = max(0, bisect_right(self.span_offsets, start) - 1)
+        for span in self.sensitive_spans[first:]:
+            if span.offset >= end:
+                break
+            span_start = max(span.offset, start)
+            span_end = min(span.offset + span.length, end)
+            if span_start < span_end:
+                yield span_start, span_end
+    
+    def _set_text_with_spans(self, start: int, end: int, suffix: str = ""):
+        """Show content[start:end] with sensitive spans tagged (and masked if enabled)"""
+        content = self.clipboard_data["content"]
+        ranges = list(self._spans_in_range(start, end))
+        
+        if self.mask_sensitive and ranges:
+            # Replace matched characters, keeping offsets (and newlines) intact
+            pieces = []
+            position = start
+            for span_start, span_end in ranges:
+                pieces.append(content[position:span_start])
+                pieces.append("".join(
+                    ch if ch in "\r\n" else self.MASK_CHAR for ch in content[span_start:span_end]
+                ))
+                position = span_end
+            pieces.append(content[position:end])
+            text = "".join(pieces)
+        else:
+            text = content[start:end]
+        
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", text + suffix)
+        for span_start, span_end in ranges:
+            self.textbox.tag_add(
+                "sensitive",
+                f"1.0 + {span_start - start} chars",
+                f"1.0 + {span_end - start} chars"
             )
-            info_label.pack(padx=15, pady=(0, 10))
+        self.textbox.configure(state="disabled")
+    
+    def _viewer_index(self, offset: int) -> str:
+        """Textbox index for an absolute content offset inside the current window"""
+        return f"1.0 + {max(0, offset - self.viewer_start)} chars"
+    
+    def _viewer_end(self) -> int:
+        """Absolute offset where the current window ends"""
+        return min(len(self.clipboard_data["content"]), self.viewer_start + self.VIEWER_PAGE_CHARS)
+    
+    def _on_viewer_scroll(self, event=None):
+        """Check the window edges after Tk has applied the scroll"""
+        if self.viewer_active:
+            self.textbox.after_idle(self._slide_viewer_window)
+    
+    def _slide_viewer_window(self):
+        """Move the window when the scroll position reaches its edge, keeping the view in place"""
+        if not self.viewer_active:
+            return
+        top, bottom = self.textbox.yview()
+        content_length = len(self.clipboard_data["content"])
+        
+        if bottom >= 0.98 and self._viewer_end() < content_length:
+            shift = self.VIEWER_SHIFT_CHARS
+        elif top <= 0.02 and self.viewer_start > 0:
+            shift = -self.VIEWER_SHIFT_CHARS
+        else:
+            return
+        
+        # Absolute offset of the first visible character
+        top_offset = self.viewer_start + len(self.textbox.get("1.0", self.textbox.index("@0,0")))
+        self._render_viewer_window(self.viewer_start + shift, anchor_offset=top_offset)
+    
+    def _page_viewer(self, direction: int):
+        """Show the previous/next page of the full content"""
+        self._render_viewer_window(self.viewer_start + direction * self.VIEWER_PAGE_CHARS)
+    
+    def _jump_to_match(self, direction: int):
+        """Move to the previous/next sensitive span from the scan result"""
+        spans = self.sensitive_spans
+        if not spans:
+            return
+        
+        self.match_index = (self.match_index + direction) % len(spans)
+        span = spans[self.match_index]
+        
+        if span.offset < self.viewer_start or span.offset + span.length > self._viewer_end():
+            # Center the window on the match
+            self._render_viewer_window(span.offset - self.VIEWER_PAGE_CHARS // 2, anchor_offset=span.offset)
+        else:
+            self._highlight_current_match()
+            self._update_viewer_label()
+            self.textbox.see(self._viewer_index(span.offset))
+    
+    def _highlight_current_match(self):
+        """Mark the selected sensitive span if it is inside the window"""
+        self.textbox.tag_remove("current_match", "1.0", "end")
+        spans = self.sensitive_spans
+        if 0 <= self.match_index < len(spans):
+            span = spans[self.match_index]
+            if self.viewer_start <= span.offset and span.offset + span.length <= self._viewer_end():
+                start = self._viewer_index(span.offset)
+                self.textbox.tag_add("current_match", start, f"{start} + {span.length} chars")
+    
+    def _update_viewer_label(self):
+        """Show window position and current match"""
+        text = f"{self.viewer_start + 1:,}–{self._viewer_end():,} of {len(self.clipboard_data['content']):,}"
+        spans = self.sensitive_spans
+        if spans:
+            if 0 <= self.match_index < len(spans):
+                text += f"  ·  match {self.match_index + 1}/{len(spans)} ({spans[self.match_index].category})"
+            else:
+                text += f"  ·  {len(spans)} matches"
+        self.viewer_pos_label.configure(text=text)
+    
+    def _fit_window(self):
+        """Resize the visible popup to its content, keeping it on screen"""
+        if not self.window.winfo_viewable():
+            return
+        self.window.update_idletasks()
+        width = 450
+        height = self.window.winfo_reqheight()
+        x = self.window.winfo_x()
+        y = min(self.window.winfo_y(), self.window.winfo_screenheight() - height - 20)
+        self.window.geometry(f"{width}x{height}+{x}+{max(0, y)}")
     
     def _create_image_preview(self, parent):
         """Generate image preview"""
+        self.image_preview_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        
         label = ctk.CTkLabel(
-            parent,
+            self.image_preview_frame,
             text="🖼️ Image Content:",
             font=("Segoe UI", 12, "bold"),
             text_color="#FFFFFF",
@@ -256,84 +590,101 @@ class ConfirmationPopup:
         
         # Image frame
         image_frame = ctk.CTkFrame(
-            parent,
+            self.image_preview_frame,
             fg_color="#1E1E1E",
             corner_radius=8
         )
         image_frame.pack(padx=15, pady=(0, 15), fill="both", expand=True)
         
+        # Image label (also shows errors)
+        self.image_label = ctk.CTkLabel(
+            image_frame,
+            text="",
+            font=("Segoe UI", 11),
+            text_color="#DC2626"
+        )
+        self.image_label.pack(padx=20, pady=20)
+        
+        # Image size information
+        self.size_label = ctk.CTkLabel(
+            self.image_preview_frame,
+            text="",
+            font=("Segoe UI", 10),
+            text_color="#888888"
+        )
+        self.size_label.pack(padx=15, pady=(0, 10))
+    
+    def _populate_image_preview(self):
+        """Fill image preview for the current request"""
         try:
-            # Convert PIL image to CTkImage
+            # Shared cache - re-showing the same image reuses the CTkImage
             preview_img = self.clipboard_data["preview"]
-            
-            # Create CTkImage
-            ctk_image = ctk.CTkImage(
-                light_image=preview_img,
-                dark_image=preview_img,
-                size=(150, 150)
-            )
-            
-            # Image label
-            img_label = ctk.CTkLabel(
-                image_frame,
-                image=ctk_image,
-                text=""
-            )
-            img_label.pack(padx=20, pady=20)
+            ctk_image = image_cache.get_ctk_image(preview_img, PREVIEW_SIZE)
+            self.image_label.configure(image=ctk_image, text="")
             
             # Image size information
             original_img = self.clipboard_data["content"]
-            size_label = ctk.CTkLabel(
-                parent,
-                text=f"Size: {original_img.width} × {original_img.height} pixels",
-                font=("Segoe UI", 10),
-                text_color="#888888"
-            )
-            size_label.pack(padx=15, pady=(0, 10))
-            
+            self.size_label.configure(text=f"Size: {original_img.width} × {original_img.height} pixels")
+        
         except Exception as e:
-            error_label = ctk.CTkLabel(
-                image_frame,
-                text=f"Failed to display image: {str(e)}",
-                font=("Segoe UI", 11),
-                text_color="#DC2626"
-            )
-            error_label.pack(padx=20, pady=20)
+            self.image_label.configure(image=None, text=f"Failed to display image: {str(e)}")
+            self.size_label.configure(text="")
     
     def _on_confirm_click(self):
         """Confirm button clicked"""
+        if self.closed.is_set():
+            return
         self.result = "confirm"
         self.on_confirm(self.clipboard_data)
         self.close()
     
     def _on_always_allow_click(self):
         """Always Allow button clicked"""
+        if self.closed.is_set():
+            return
         self.result = "always_allow"
         self.on_always_allow(self.clipboard_data)
         self.close()
     
+    def _on_allow_for_click(self):
+        """Allow for N minutes button clicked"""
+        if self.closed.is_set():
+            return
+        self.result = "allow_for"
+        self.on_allow_for(self.clipboard_data)
+        self.close()
+    
     def _on_cancel_click(self):
         """Cancel button clicked"""
+        if self.closed.is_set():
+            return
         self.result = "cancel"
         self.on_cancel()
         self.close()
     
-    def _animate_show(self):
-        """Popup fade-in animation (0.15 seconds)"""
-        steps = 15
-        delay = 10  # ms (total 150ms = 0.15 seconds)
-        increment = self.opacity / steps
-        
-        def fade_step(current_alpha, step):
-            if step < steps and self.window and self.window.winfo_exists():
-                new_alpha = min(current_alpha + increment, self.opacity)
-                self.window.attributes('-alpha', new_alpha)
-                self.window.after(delay, lambda: fade_step(new_alpha, step + 1))
-        
-        fade_step(0.0, 0)
+    def release_content(self):
+        """Drop the last request's data and preview while hidden (idle trim; the window stays built)"""
+        if not self.closed.is_set():
+            return
+        self.clipboard_data = {}
+        self.sensitive_spans = []
+        self.span_offsets = []
+        self.on_confirm = self.on_always_allow = self.on_cancel = self.on_allow_for = None
+        if self.is_built():
+            self.image_label.configure(image=None, text="")
+            self.textbox.configure(state="normal")
+            self.textbox.delete("1.0", "end")
+            self.textbox.configure(state="disabled")
     
     def close(self):
-        """Close popup window"""
+        """Hide popup window (kept alive for the next request)"""
+        if self.is_built():
+            self.window.withdraw()
+        self.closed.set()
+    
+    def destroy(self):
+        """Destroy the pooled window"""
         if self.window:
             self.window.destroy()
             self.window = None
+        self.closed.set()
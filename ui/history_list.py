@@ -0,0 +1,329 @@
+"""
+Virtualized history list UI
+Materializes only visible history rows and recycles them while scrolling
+"""
+import customtkinter as ctk
+import time
+from typing import Callable, List, Optional
+from services.history_record import HistoryRecord
+from ui.image_cache import image_cache
+from utils.image_utils import HISTORY_THUMBNAIL_SIZE
+
+
+class HistoryRow:
+    """Reusable history row widget - identical structure for text and image"""
+    
+    # Row height including vertical padding
+    HEIGHT = 90
+    
+    def __init__(self, parent, on_copy: Callable):
+        self.item = None
+        self.on_copy = on_copy
+        
+        # Main item frame
+        self.frame = ctk.CTkFrame(
+            parent,
+            fg_color="#2D2D2D",
+            corner_radius=10,
+            height=80
+        )
+        self.frame.grid_propagate(False)
+        
+        # Grid settings - unified content start point with fixed width
+        self.frame.grid_columnconfigure(0, weight=0, minsize=50)
+        self.frame.grid_columnconfigure(1, weight=0, minsize=180)
+        self.frame.grid_columnconfigure(2, weight=1)
+        self.frame.grid_columnconfigure(3, weight=0, minsize=100)
+        self.frame.grid_rowconfigure(0, weight=1)
+        
+        # Icon
+        self.icon_label = ctk.CTkLabel(
+            self.frame,
+            text="📦",
+            font=("Segoe UI", 20),
+            text_color="#3B82F6"
+        )
+        self.icon_label.grid(row=0, column=0, padx=(10, 0), pady=12, sticky="w")
+        
+        # App info frame
+        info_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        info_frame.grid(row=0, column=1, padx=(5, 0), pady=12, sticky="w")
+        
+        self.type_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=("Segoe UI", 11, "bold"),
+            text_color="#FFFFFF",
+            anchor="w"
+        )
+        self.type_label.pack(anchor="w", pady=(0, 2))
+        
+        self.target_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=("Segoe UI", 10, "normal"),
+            text_color="#3B82F6",
+            anchor="w"
+        )
+        self.target_label.pack(anchor="w", pady=(0, 2))
+        
+        meta_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
+        meta_frame.pack(anchor="w", fill="x")
+        
+        self.time_label = ctk.CTkLabel(
+            meta_frame,
+            text="",
+            font=("Segoe UI", 9),
+            text_color="#666666"
+        )
+        self.time_label.pack(side="left")
+        
+        self.auto_label = ctk.CTkLabel(
+            meta_frame,
+            text="  👍 Auto",
+            font=("Segoe UI", 9, "bold"),
+            text_color="#10B981"
+        )
+        
+        self.sensitive_label = ctk.CTkLabel(
+            meta_frame,
+            text="  ⚠️ Sensitive",
+            font=("Segoe UI", 9, "bold"),
+            text_color="#EF4444"
+        )
+        
+        # Content frame (identical for text and image)
+        content_container = ctk.CTkFrame(self.frame, fg_color="transparent")
+        content_container.grid(row=0, column=2, padx=(0, 5), pady=12, sticky="w")
+        
+        self.content_label = ctk.CTkLabel(
+            content_container,
+            text="",
+            font=("Segoe UI", 10),
+            text_color="#CCCCCC",
+            anchor="w",
+            wraplength=240,
+            justify="left"
+        )
+        self.content_label.pack(side="left", anchor="w", padx=0, pady=0)
+        
+        # Button
+        copy_btn = ctk.CTkButton(
+            self.frame,
+            text="📋 Copy",
+            width=75,
+            height=32,
+            corner_radius=6,
+            fg_color="#3B82F6",
+            hover_color="#2563EB",
+            font=("Segoe UI", 9, "bold"),
+            command=lambda: self.item is not None and self.on_copy(self.item)
+        )
+        copy_btn.grid(row=0, column=3, padx=(5, 10), pady=12, sticky="w")
+    
+    def bind_item(self, history_item: HistoryRecord, force: bool = False):
+        """Show a history item in this row (no-op if already shown unless forced)"""
+        if history_item is self.item and not force:
+            return
+        self.item = history_item
+        
+        is_sensitive = history_item.is_sensitive
+        self.icon_label.configure(text_color="#EF4444" if is_sensitive else "#3B82F6")
+        
+        timestamp = history_item.timestamp
+        time_str = time.strftime("%H:%M:%S", time.localtime(timestamp))
+        target_app = history_item.process or "Unknown"
+        is_auto_approved = history_item.auto_approved
+        
+        # Type display (Text or Image)
+        self.type_label.configure(text="Text" if history_item.type == "text" else "Image")
+        
+        target_text = f"→ Target: {target_app}"
+        if is_auto_approved:
+            target_text += " ✓"
+        self.target_label.configure(
+            text=target_text,
+            font=("Segoe UI", 10, "bold" if is_auto_approved else "normal"),
+            text_color="#10B981" if is_auto_approved else "#3B82F6"
+        )
+        
+        self.time_label.configure(text=f"🕒 {time_str}")
+        
+        self.auto_label.pack_forget()
+        self.sensitive_label.pack_forget()
+        if is_auto_approved:
+            self.auto_label.pack(side="left")
+        if is_sensitive:
+            self.sensitive_label.pack(side="left")
+        
+        if history_item.type == "text":
+            # Decrypted once per bind for sensitive items
+            preview = history_item.preview
+            preview_text = preview[:85]
+            if len(preview) > 85:
+                preview_text += "..."
+            self.content_label.configure(image=None, text=preview_text, font=("Segoe UI", 10),
+                                         text_color="#CCCCCC")
+        else:  # image
+            try:
+                thumbnail = history_item.thumbnail or history_item.preview
+                if not thumbnail:
+                    raise Exception("No image")
+                
+                ctk_image = image_cache.get_ctk_image(thumbnail, HISTORY_THUMBNAIL_SIZE)
+                self.content_label.configure(image=ctk_image, text="")
+            except:
+                self.content_label.configure(image=None, text="Image preview unavailable",
+                                             font=("Segoe UI", 9), text_color="#666666")
+
+
+class VirtualHistoryList(ctk.CTkFrame):
+    """Scrollable history list that only builds widgets for visible rows"""
+    
+    def __init__(self, parent, store, on_copy: Callable,
+                 empty_text: str = "No clipboard history yet", **kwargs):
+        super().__init__(parent, **kwargs)
+        self.store = store  # HistoryStore
+        self.on_copy = on_copy
+        
+        self.total = 0
+        self.generation = 0  # Last store generation applied
+        self.offset = 0  # Scroll position in pixels
+        self.rows: List[HistoryRow] = []
+        self._stale_ids = set()  # Updated items whose rows must be rebound
+        
+        # Viewport holds the recycled rows; scrollbar is driven manually
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=10)
+        
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=10)
+        
+        self.empty_label = ctk.CTkLabel(
+            self.viewport,
+            text=empty_text,
+            font=("Segoe UI", 12),
+            text_color="#666666"
+        )
+        
+        self.viewport.bind("<Configure>", lambda e: self._render())
+        
+        # Wheel handler lives on a bind tag of this list, given to the viewport and every row widget
+        self._wheel_tag = f"HistoryListWheel{id(self)}"
+        self.bind_class(self._wheel_tag, "<MouseWheel>", self._on_mousewheel)
+        self._add_wheel_tag(self.viewport)
+    
+    def destroy(self):
+        """Drop the wheel binding together with the widgets"""
+        self.unbind_class(self._wheel_tag, "<MouseWheel>")
+        super().destroy()
+    
+    def refresh(self):
+        """Re-read the whole store and redraw visible rows"""
+        self.generation, self.total = self.store.get_state()
+        for row in self.rows:
+            row.item = None
+        self._render()
+    
+    def sync(self):
+        """Apply store changes since the last sync (full refresh if the feed was truncated)"""
+        changes = self.store.changes_since(self.generation)
+        if changes is None:
+            self.refresh()
+            return
+        if changes["generation"] == self.generation:
+            return
+        
+        self.generation = changes["generation"]
+        self.total = changes["count"]
+        self._stale_ids.update(changes["updated"])
+        
+        # Keep the rows the user is looking at in place when scrolled down
+        if self.offset > 0:
+            self.offset += len(changes["inserted"]) * HistoryRow.HEIGHT
+        self._render()
+    
+    def scroll_to_top(self):
+        """Scroll back to the newest item"""
+        self.offset = 0
+        self._render()
+    
+    def _visible_row_count(self) -> int:
+        """Number of rows needed to fill the viewport (plus one partial row)"""
+        height = max(self.viewport.winfo_height(), HistoryRow.HEIGHT)
+        return height // HistoryRow.HEIGHT + 2
+    
+    def _ensure_rows(self, count: int):
+        """Grow the row pool to the given size"""
+        while len(self.rows) < count:
+            row = HistoryRow(self.viewport, self.on_copy)
+            self._add_wheel_tag(row.frame)
+            self.rows.append(row)
+    
+    def _add_wheel_tag(self, widget):
+        """Route mouse wheel events over a widget and its descendants to this list"""
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            widget.bindtags((self._wheel_tag,) + tags)
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+    
+    def _render(self):
+        """Place recycled rows for the current scroll position"""
+        viewport_height = max(self.viewport.winfo_height(), 1)
+        max_offset = max(0, self.total * HistoryRow.HEIGHT - viewport_height)
+        self.offset = min(max(self.offset, 0), max_offset)
+        
+        if self.total == 0:
+            for row in self.rows:
+                row.frame.place_forget()
+            self.empty_label.place(relx=0.5, y=20, anchor="n")
+            self.scrollbar.set(0.0, 1.0)
+            return
+        self.empty_label.place_forget()
+        
+        first_index = self.offset // HistoryRow.HEIGHT
+        shift = self.offset % HistoryRow.HEIGHT
+        visible = self._visible_row_count()
+        self._ensure_rows(visible)
+        
+        items = self.store.page(first_index, visible)
+        
+        # Rows follow their item, so an insert only rebinds the one free row
+        wanted = {item.id for item in items}
+        bound = {row.item.id: row for row in self.rows
+                 if row.item is not None and row.item.id in wanted}
+        free = [row for row in self.rows if row.item is None or row.item.id not in wanted]
+        
+        for i, item in enumerate(items):
+            row = bound.get(item.id) or free.pop()
+            row.bind_item(item, force=item.id in self._stale_ids)
+            row.frame.place(x=0, y=i * HistoryRow.HEIGHT - shift + 5, relwidth=1.0)
+        for row in free:
+            row.item = None
+            row.frame.place_forget()
+        self._stale_ids.clear()
+        
+        # Scrollbar reflects position within the full list
+        content_height = self.total * HistoryRow.HEIGHT
+        first = self.offset / content_height
+        last = min(1.0, (self.offset + viewport_height) / content_height)
+        self.scrollbar.set(first, last)
+    
+    def _scroll_by(self, pixels: int):
+        """Scroll by a pixel amount"""
+        self.offset += pixels
+        self._render()
+    
+    def _on_scrollbar(self, action, value, unit: Optional[str] = None):
+        """Handle scrollbar drag and arrow commands"""
+        if action == "moveto":
+            self.offset = int(float(value) * self.total * HistoryRow.HEIGHT)
+            self._render()
+        elif action == "scroll":
+            step = self.viewport.winfo_height() if unit == "pages" else HistoryRow.HEIGHT
+            self._scroll_by(int(value) * step)
+    
+    def _on_mousewheel(self, event):
+        """Scroll with the mouse wheel (one row per notch) over the list"""
+        self._scroll_by(-int(event.delta / 120) * HistoryRow.HEIGHT)
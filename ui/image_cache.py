@@ -0,0 +1,123 @@
+"""
+Shared UI image cache
+Keeps ready-to-display scaled PIL images and CTkImage objects in a bounded LRU
+"""
+import customtkinter as ctk
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Tuple
+from utils.image_utils import create_thumbnails, fit_size
+
+
+class ImageCache:
+    """LRU of scaled images keyed by source digest and display size"""
+    
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # Guards the LRU and the digest memo; reentrant because weakref callbacks
+        # can run during a garbage collection triggered inside a locked section
+        self._lock = threading.RLock()
+        # (digest, bounds) -> (scaled PIL image, CTkImage, size in bytes)
+        self._entries: "OrderedDict[Tuple[str, Tuple[int, int]], tuple]" = OrderedDict()
+        # id(source image) -> (weakref, digest); avoids rehashing the same image
+        self._digests: Dict[int, Tuple[weakref.ref, str]] = {}
+    
+    def get_image(self, image, bounds: Tuple[int, int]):
+        """Get a PIL copy of image scaled to fit bounds (cached)"""
+        return self._get_entry(image, bounds)[0]
+    
+    def get_ctk_image(self, image, bounds: Tuple[int, int]) -> ctk.CTkImage:
+        """Get a CTkImage of image scaled to fit bounds (cached; call from UI thread)"""
+        return self._get_entry(image, bounds)[1]
+    
+    def digest(self, image) -> str:
+        """Content digest of a PIL image (memoized per image object)"""
+        key = id(image)
+        with self._lock:
+            cached = self._digests.get(key)
+        if cached is not None and cached[0]() is image:
+            return cached[1]
+        
+        # Hash outside the lock (full pixel pass)
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{image.mode}:{image.size}".encode())
+        hasher.update(image.tobytes())
+        digest = hasher.hexdigest()
+        
+        try:
+            ref = weakref.ref(image, lambda ref, key=key: self._forget_digest(key, ref))
+        except TypeError:
+            return digest
+        with self._lock:
+            self._digests[key] = (ref, digest)
+        return digest
+    
+    def _forget_digest(self, key: int, ref: weakref.ref):
+        """Drop a memoized digest once its image is gone (unless the id was reused)"""
+        with self._lock:
+            cached = self._digests.get(key)
+            if cached is not None and cached[0] is ref:
+                del self._digests[key]
+    
+    def clear(self):
+        """Drop all cached images"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """Cache statistics for diagnostics"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+    
+    def _get_entry(self, image, bounds: Tuple[int, int]) -> tuple:
+        """Look up or build the cache entry for image at bounds"""
+        key = (self.digest(image), tuple(bounds))
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        
+        # Scale once; CTkImage then only rescales for DPI changes
+        if image.size == fit_size(image.size, bounds):
+            scaled = image
+        else:
+            scaled = create_thumbnails(image, (tuple(bounds),))[tuple(bounds)]
+        ctk_image = ctk.CTkImage(light_image=scaled, dark_image=scaled, size=scaled.size)
+        
+        # PIL pixels plus the Tk photo image built from them
+        size_bytes = 2 * scaled.width * scaled.height * len(scaled.getbands())
+        entry = (scaled, ctk_image, size_bytes)
+        
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = entry
+                self.total_bytes += size_bytes
+                self._evict()
+            return self._entries.get(key, entry)
+    
+    def _evict(self):
+        """Drop least recently used entries beyond limits; caller holds the lock"""
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self.total_bytes > self.max_bytes):
+            _, (_, _, size_bytes) = self._entries.popitem(last=False)
+            self.total_bytes -= size_bytes
+
+
+# Global instance shared by the settings window and confirmation popup
+image_cache = ImageCache()
@@ -3,27 +3,35 @@ Settings window UI
 SaaS dashboard style settings interface
 """
 import customtkinter as ctk
+import os
+import psutil
+import time
 from config.config_manager import ConfigManager
 from typing import Callable
-import os
-import win32api
-import win32con
-import win32ui
-import win32gui
-from PIL import Image
-import io
-from utils.icon_utils import get_icon_path
+from services.blob_store import blob_store
+from services.icon_cache import icon_cache
+from services.task_executor import task_executor
+from utils.icon_utils import apply_window_icon
+from ui.history_list import VirtualHistoryList
+from ui.image_cache import image_cache
 
 class SettingsWindow:
     """Settings window class"""
     
+    # Memory card refresh interval while the window is open
+    MEMORY_REFRESH_MS = 2000
+    
     def __init__(self, config_manager: ConfigManager, parent=None, app=None, on_close: Callable = None):
         self.config = config_manager
         self.parent = parent
         self.app = app  # Reference to main application
         self.on_close = on_close
         self.window = None
-        self.whitelist_items = []
+        self.whitelist_items = {}  # Process name -> row frame
+        self.current_tab = None
+        self.tabs = {}  # Tab name -> frame (built on first visit, then kept)
+        self.tab_generations = {}  # Tab name -> config generation it reflects
+        self.toggle_switches = {}  # Config key -> switch
         
     def show(self):
         """Show settings window"""
@@ -32,9 +40,9 @@ class SettingsWindow:
             self.window.lift()
             self.window.attributes('-topmost', True)
             self.window.attributes('-topmost', False)
-            # Refresh history if existing window
-            if hasattr(self, 'current_tab') and self.current_tab == 'history':
-                self.show_history_settings()
+            # Refresh data-bound parts of the visible tab
+            if self.current_tab:
+                self._refresh_tab(self.current_tab)
             return
             
         # Use Toplevel if parent exists, otherwise CTk
@@ -46,8 +54,8 @@ class SettingsWindow:
         self.window.title("Paste Guardian - Settings")
         self.window.geometry("900x600")
         
-        # Set window icon with delayed application for Windows 11 stability
-        self.window.after(200, lambda: self._apply_window_icon(self.window))
+        # Set window icon before customtkinter installs its default one
+        self._apply_window_icon(self.window)
         
         # Theme settings
         ctk.set_appearance_mode("dark")
@@ -56,6 +64,13 @@ class SettingsWindow:
         # Window background
         self.window.configure(fg_color="#1E1E1E")
         
+        # Fresh window - previously cached tabs were destroyed with the old one
+        self.tabs = {}
+        self.tab_generations = {}
+        self.toggle_switches = {}
+        self.whitelist_items = {}
+        self.current_tab = None
+        
         # Main container
         main_container = ctk.CTkFrame(self.window, fg_color="transparent")
         main_container.pack(fill="both", expand=True, padx=20, pady=20)
@@ -146,19 +161,57 @@ class SettingsWindow:
         btn.pack(padx=15, pady=5, fill="x")
         return btn
     
-    def _clear_content(self):
-        """Clear content area"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def _show_tab(self, name, builder):
+        """Show a tab, building it on first visit and reusing it afterwards"""
+        if self.current_tab in self.tabs and self.current_tab != name:
+            self.tabs[self.current_tab].pack_forget()
+        
+        frame = self.tabs.get(name)
+        if frame is None:
+            frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+            self.tabs[name] = frame
+            builder(frame)
+            self.tab_generations[name] = self.config.generation
+        else:
+            self._refresh_tab(name)
+        
+        self.current_tab = name
+        frame.pack(fill="both", expand=True)
+    
+    def _refresh_tab(self, name):
+        """Update only the data-bound widgets of a cached tab"""
+        if name == 'history':
+            # History has its own change feed (no-op if nothing changed)
+            self.sync_history()
+        elif name == 'general':
+            # Live figures, not config-bound
+            self.memory_label.configure(text=self._memory_usage_text())
+        
+        if self.tab_generations.get(name) == self.config.generation:
+            return
+        self.tab_generations[name] = self.config.generation
+        
+        if name == 'monitoring':
+            for config_key, switch in self.toggle_switches.items():
+                self._set_toggle(switch, self.config.get(config_key))
+        elif name == 'whitelist':
+            self._refresh_whitelist()
+        elif name == 'history':
+            self.history_subtitle.configure(text=self._history_subtitle_text())
+        elif name == 'appearance':
+            current_opacity = self.config.get("popup_opacity", 0.95)
+            self.opacity_slider.set(current_opacity)
+            self.opacity_value_label.configure(text=f"{int(current_opacity * 100)}%")
     
     def show_general_settings(self):
         """General settings tab"""
-        self._clear_content()
-        self.current_tab = 'general'
-        
+        self._show_tab('general', self._build_general_tab)
+    
+    def _build_general_tab(self, parent):
+        """Build general settings tab"""
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="General Settings",
             font=("Segoe UI", 24, "bold"),
             text_color="#FFFFFF",
@@ -167,7 +220,7 @@ class SettingsWindow:
         header.pack(padx=30, pady=(30, 10), anchor="w")
         
         subtitle = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Configure general application behavior",
             font=("Segoe UI", 12),
             text_color="#888888",
@@ -177,26 +230,34 @@ class SettingsWindow:
         
         # Settings section
         self._create_setting_card(
-            self.content_frame,
+            parent,
             "Application Status",
             "Monitor clipboard and intercept paste operations",
             self._create_status_content
         )
         
         self._create_setting_card(
-            self.content_frame,
+            parent,
             "Startup Options",
             "Launch application when Windows starts",
             self._create_startup_content
         )
+        
+        self._create_setting_card(
+            parent,
+            "Memory Usage",
+            "Process memory and history image cache (images beyond the budget are kept on disk)",
+            self._create_memory_content
+        )
     
     def show_monitoring_settings(self):
         """Monitoring settings tab"""
-        self._clear_content()
-        self.current_tab = 'monitoring'
-        
+        self._show_tab('monitoring', self._build_monitoring_tab)
+    
+    def _build_monitoring_tab(self, parent):
+        """Build monitoring settings tab"""
         header = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Monitoring Settings",
             font=("Segoe UI", 24, "bold"),
             text_color="#FFFFFF",
@@ -205,7 +266,7 @@ class SettingsWindow:
         header.pack(padx=30, pady=(30, 10), anchor="w")
         
         subtitle = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Choose what content types to monitor",
             font=("Segoe UI", 12),
             text_color="#888888",
@@ -215,7 +276,7 @@ class SettingsWindow:
         
         # Text monitoring
         self._create_setting_card(
-            self.content_frame,
+            parent,
             "Text Content",
             "Monitor and confirm text paste operations",
             lambda p: self._create_toggle(p, "monitor_text", self.config.get("monitor_text"))
@@ -223,19 +284,28 @@ class SettingsWindow:
         
         # Image monitoring
         self._create_setting_card(
-            self.content_frame,
+            parent,
             "Image Content",
             "Monitor and confirm image paste operations",
             lambda p: self._create_toggle(p, "monitor_image", self.config.get("monitor_image"))
         )
+        
+        # Sensitive data masking in the confirmation popup
+        self._create_setting_card(
+            parent,
+            "Mask Sensitive Data",
+            "Hide detected emails, phone and card numbers in the confirmation popup",
+            lambda p: self._create_toggle(p, "mask_sensitive_data", self.config.get("mask_sensitive_data"))
+        )
     
     def show_whitelist_settings(self):
         """Whitelist settings tab"""
-        self._clear_content()
-        self.current_tab = 'whitelist'
-        
+        self._show_tab('whitelist', self._build_whitelist_tab)
+    
+    def _build_whitelist_tab(self, parent):
+        """Build whitelist settings tab"""
         header = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Whitelist Management",
             font=("Segoe UI", 24, "bold"),
             text_color="#FFFFFF",
@@ -244,7 +314,7 @@ class SettingsWindow:
         header.pack(padx=30, pady=(30, 10), anchor="w")
         
         subtitle = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Applications that can paste without confirmation",
             font=("Segoe UI", 12),
             text_color="#888888",
@@ -254,7 +324,7 @@ class SettingsWindow:
         
         # Whitelist card
         card = ctk.CTkFrame(
-            self.content_frame,
+            parent,
             fg_color="#2D2D2D",
             corner_radius=10
         )
@@ -296,15 +366,22 @@ class SettingsWindow:
         list_frame.pack(padx=20, pady=(0, 20), fill="both", expand=True)
         
         self.whitelist_container = list_frame
+        self.whitelist_empty_label = ctk.CTkLabel(
+            list_frame,
+            text="No whitelisted applications",
+            font=("Segoe UI", 12),
+            text_color="#666666"
+        )
         self._refresh_whitelist()
     
     def show_history_settings(self):
         """History settings tab"""
-        self._clear_content()
-        self.current_tab = 'history'  # Mark current tab
-        
+        self._show_tab('history', self._build_history_tab)
+    
+    def _build_history_tab(self, parent):
+        """Build history settings tab"""
         header = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Clipboard History",
             font=("Segoe UI", 24, "bold"),
             text_color="#FFFFFF",
@@ -312,47 +389,39 @@ class SettingsWindow:
         )
         header.pack(padx=30, pady=(30, 10), anchor="w")
         
-        subtitle = ctk.CTkLabel(
-            self.content_frame,
-            text="Recent clipboard activities (latest 10 items)",
+        self.history_subtitle = ctk.CTkLabel(
+            parent,
+            text=self._history_subtitle_text(),
             font=("Segoe UI", 12),
             text_color="#888888",
             anchor="w"
         )
-        subtitle.pack(padx=30, pady=(0, 20), anchor="w")
+        self.history_subtitle.pack(padx=30, pady=(0, 20), anchor="w")
         
         # History card
         card = ctk.CTkFrame(
-            self.content_frame,
+            parent,
             fg_color="#2D2D2D",
             corner_radius=10
         )
         card.pack(padx=30, pady=10, fill="both", expand=True)
         
-        # History list
-        list_frame = ctk.CTkScrollableFrame(
-            card,
-            fg_color="#1E1E1E",
-            corner_radius=10,
-            height=400
-        )
-        list_frame.pack(padx=20, pady=20, fill="both", expand=True)
-        
-        # Get history data
+        # History list (virtualized - only visible rows are built)
         if self.app:
-            history = self.app.get_clipboard_history()
-            if not history:
-                empty_label = ctk.CTkLabel(
-                    list_frame,
-                    text="No clipboard history yet",
-                    font=("Segoe UI", 12),
-                    text_color="#666666"
-                )
-                empty_label.pack(pady=20)
-            else:
-                for item in history:
-                    self._create_history_item(list_frame, item)
+            self.history_list = VirtualHistoryList(
+                card,
+                store=self.app.history,
+                on_copy=self._copy_history_item,
+                fg_color="#1E1E1E",
+                corner_radius=10,
+                height=400
+            )
+            self.history_list.pack(padx=20, pady=20, fill="both", expand=True)
+            self.history_list.refresh()
         else:
+            list_frame = ctk.CTkFrame(card, fg_color="#1E1E1E", corner_radius=10, height=400)
+            list_frame.pack(padx=20, pady=20, fill="both", expand=True)
+            
             error_label = ctk.CTkLabel(
                 list_frame,
                 text="History data unavailable",
@@ -361,191 +430,39 @@ class SettingsWindow:
             )
             error_label.pack(pady=20)
     
-    def _create_history_item(self, parent, history_item):
-        """Create history item - identical structure for text and image"""
-        import time
+    def _history_subtitle_text(self):
+        """History tab subtitle (depends on history_limit)"""
+        return f"Recent clipboard activities (latest {self.config.get('history_limit', 10)} items)"
+    
+    def sync_history(self):
+        """Apply history changes to the history tab"""
+        history_list = getattr(self, 'history_list', None)
+        if history_list is not None and history_list.winfo_exists():
+            history_list.sync()
+    
+    def _copy_history_item(self, history_item):
+        """Copy a history item back to the clipboard"""
         import pyperclip
-        from PIL import ImageTk
-        
-        # Main item frame
-        item_frame = ctk.CTkFrame(
-            parent,
-            fg_color="#2D2D2D",
-            corner_radius=10,
-            height=80
-        )
-        item_frame.pack(fill="x", expand=False, padx=5, pady=5)
-        item_frame.pack_propagate(False)
-        
-        # Grid settings - unified content start point with fixed width
-        item_frame.grid_columnconfigure(0, weight=0, minsize=50)
-        item_frame.grid_columnconfigure(1, weight=0, minsize=180)
-        item_frame.grid_columnconfigure(2, weight=1)
-        item_frame.grid_columnconfigure(3, weight=0, minsize=100)
-        item_frame.grid_rowconfigure(0, weight=1)
-        
-        # Icon
-        type_icon = "📦" if history_item["type"] == "text" else "📦"
-        is_sensitive = history_item.get("is_sensitive", False)
-        
-        icon_label = ctk.CTkLabel(
-            item_frame,
-            text=type_icon,
-            font=("Segoe UI", 20),
-            text_color="#EF4444" if is_sensitive else "#3B82F6"
-        )
-        icon_label.grid(row=0, column=0, padx=(10, 0), pady=12, sticky="w")
-        
-        # App info frame
-        info_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        info_frame.grid(row=0, column=1, padx=(5, 0), pady=12, sticky="w")
-        
-        app_name = history_item.get("app_name", history_item.get("process", "Unknown"))
-        timestamp = history_item.get("timestamp", 0)
-        time_str = time.strftime("%H:%M:%S", time.localtime(timestamp))
-        target_app = history_item.get("target_app", history_item.get("process", "Unknown"))
-        is_auto_approved = history_item.get("auto_approved", False)
-        
-        # Type display (Text or Image)
-        type_text = "Text" if history_item["type"] == "text" else "Image"
-        
-        app_label = ctk.CTkLabel(
-            info_frame,
-            text=f"{type_text}",
-            font=("Segoe UI", 11, "bold"),
-            text_color="#FFFFFF",
-            anchor="w"
-        )
-        app_label.pack(anchor="w", pady=(0, 2))
         
-        target_text = f"→ Target: {target_app}"
-        if is_auto_approved:
-            target_text += " ✓"
+        content = history_item.content
+        content_type = history_item.type
         
-        target_label = ctk.CTkLabel(
-            info_frame,
-            text=target_text,
-            font=("Segoe UI", 10, "bold" if is_auto_approved else "normal"),
-            text_color="#10B981" if is_auto_approved else "#3B82F6",
-            anchor="w"
-        )
-        target_label.pack(anchor="w", pady=(0, 2))
-        
-        meta_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-        meta_frame.pack(anchor="w", fill="x")
-        
-        time_label = ctk.CTkLabel(
-            meta_frame,
-            text=f"🕒 {time_str}",
-            font=("Segoe UI", 9),
-            text_color="#666666"
-        )
-        time_label.pack(side="left")
-        
-        if is_auto_approved:
-            auto_label = ctk.CTkLabel(
-                meta_frame,
-                text="  👍 Auto",
-                font=("Segoe UI", 9, "bold"),
-                text_color="#10B981"
-            )
-            auto_label.pack(side="left")
-        
-        if is_sensitive:
-            warning_label = ctk.CTkLabel(
-                meta_frame,
-                text="  ⚠️ Sensitive",
-                font=("Segoe UI", 9, "bold"),
-                text_color="#EF4444"
-            )
-            warning_label.pack(side="left")
-        
-        # Content frame (identical for text and image)
-        content_container = ctk.CTkFrame(item_frame, fg_color="transparent")
-        content_container.grid(row=0, column=2, padx=(0, 5), pady=12, sticky="w")
-        
-        if history_item["type"] == "text":
-            preview_text = history_item.get("preview", "")[:85]
-            if len(history_item.get("preview", "")) > 85:
-                preview_text += "..."
-            
-            text_label = ctk.CTkLabel(
-                content_container,
-                text=preview_text,
-                font=("Segoe UI", 10),
-                text_color="#CCCCCC",
-                anchor="w",
-                wraplength=240,
-                justify="left"
-            )
-            text_label.pack(side="left", anchor="w", padx=0, pady=0)
-            
-        else:  # image
-            try:
-                thumbnail = history_item.get("full_content") or history_item.get("preview")
-                if thumbnail:
-                    ctk_image = ctk.CTkImage(
-                        light_image=thumbnail,
-                        dark_image=thumbnail,
-                        size=(40, 40)
-                    )
-                    
-                    image_label = ctk.CTkLabel(
-                        content_container,
-                        image=ctk_image,
-                        text=""
-                    )
-                    image_label.pack(side="left", anchor="w", padx=0, pady=0)
-                else:
-                    raise Exception("No image")
-            except:
-                error_label = ctk.CTkLabel(
-                    content_container,
-                    text="Image preview unavailable",
-                    font=("Segoe UI", 9),
-                    text_color="#666666",
-                    anchor="w"
-                )
-                error_label.pack(side="left", anchor="w", padx=0, pady=0)
-        
-        # Button
-        def recopy():
-            content = history_item.get("content")
-            content_type = history_item.get("type")
-            
-            if content_type == "text" and content:
-                pyperclip.copy(content)
-                print(f"✓ Text copied to clipboard")
-            elif content_type == "image" and content:
-                if self.app and hasattr(self.app.monitor, '_set_clipboard_image'):
-                    import threading
-                    threading.Thread(
-                        target=self.app.monitor._set_clipboard_image,
-                        args=(content,),
-                        daemon=True
-                    ).start()
-                    print(f"✓ Image copied to clipboard")
-        
-        copy_btn = ctk.CTkButton(
-            item_frame,
-            text="📋 Copy",
-            width=75,
-            height=32,
-            corner_radius=6,
-            fg_color="#3B82F6",
-            hover_color="#2563EB",
-            font=("Segoe UI", 9, "bold"),
-            command=recopy
-        )
-        copy_btn.grid(row=0, column=3, padx=(5, 10), pady=12, sticky="w")
+        if content_type == "text" and content:
+            pyperclip.copy(content)
+            print(f"✓ Text copied to clipboard")
+        elif content_type == "image" and content:
+            if self.app and hasattr(self.app.monitor, '_set_clipboard_image'):
+                task_executor.submit(task_executor.UI, self.app.monitor._set_clipboard_image, content)
+                print(f"✓ Image copied to clipboard")
     
     def show_appearance_settings(self):
         """Appearance settings tab"""
-        self._clear_content()
-        self.current_tab = 'appearance'
-        
+        self._show_tab('appearance', self._build_appearance_tab)
+    
+    def _build_appearance_tab(self, parent):
+        """Build appearance settings tab"""
         header = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Appearance Settings",
             font=("Segoe UI", 24, "bold"),
             text_color="#FFFFFF",
@@ -554,7 +471,7 @@ class SettingsWindow:
         header.pack(padx=30, pady=(30, 10), anchor="w")
         
         subtitle = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Customize the look and feel of confirmation popups",
             font=("Segoe UI", 12),
             text_color="#888888",
@@ -564,7 +481,7 @@ class SettingsWindow:
         
         # Opacity settings
         self._create_setting_card(
-            self.content_frame,
+            parent,
             "Popup Opacity",
             "Adjust the transparency of confirmation popups",
             self._create_opacity_slider
@@ -623,8 +540,17 @@ class SettingsWindow:
         if current_value:
             switch.select()
         
+        self.toggle_switches[config_key] = switch
         return switch
     
+    def _set_toggle(self, switch, value):
+        """Sync a toggle switch with a config value"""
+        if value:
+            switch.select()
+        else:
+            switch.deselect()
+        switch.configure(text="Enabled" if value else "Disabled")
+    
     def _toggle_setting(self, config_key, switch):
         """Toggle setting"""
         new_value = switch.get() == 1
@@ -653,11 +579,55 @@ class SettingsWindow:
         )
         switch.pack(anchor="w")
     
+    def _create_memory_content(self, parent):
+        """Create memory usage content (diagnostics)"""
+        self.memory_label = ctk.CTkLabel(
+            parent,
+            text=self._memory_usage_text(),
+            font=("Segoe UI", 12),
+            text_color="#CCCCCC",
+            justify="left",
+            anchor="w"
+        )
+        self.memory_label.pack(anchor="w")
+        self.window.after(self.MEMORY_REFRESH_MS, self._refresh_memory_usage)
+    
+    def _memory_usage_text(self):
+        """Memory figures for the diagnostics card"""
+        mb = 1024 * 1024
+        lines = []
+        try:
+            lines.append(f"Process: {psutil.Process(os.getpid()).memory_info().rss / mb:.1f} MB resident")
+        except Exception:
+            pass
+        
+        blobs = blob_store.stats()
+        lines.append(f"History images: {blobs['bytes'] / mb:.1f} / {blobs['max_bytes'] / mb:.0f} MB in memory "
+                     f"({blobs['in_memory']} images)")
+        lines.append(f"Spilled to disk: {blobs['on_disk']} images ({blobs['disk_bytes'] / mb:.1f} MB)")
+        
+        ui_images = image_cache.stats()
+        lines.append(f"UI image cache: {ui_images['bytes'] / mb:.1f} MB ({ui_images['entries']} images)")
+        
+        last_trim = getattr(self.app, "last_idle_trim", None)
+        if last_trim:
+            lines.append(f"Last idle trim: {last_trim['rss_before'] / mb:.1f} → {last_trim['rss_after'] / mb:.1f} MB "
+                         f"at {time.strftime('%H:%M:%S', time.localtime(last_trim['timestamp']))}")
+        return "\n".join(lines)
+    
+    def _refresh_memory_usage(self):
+        """Update the memory card while the General tab is shown"""
+        if not self.window or not self.window.winfo_exists():
+            return
+        if self.current_tab == 'general':
+            self.memory_label.configure(text=self._memory_usage_text())
+        self.window.after(self.MEMORY_REFRESH_MS, self._refresh_memory_usage)
+    
     def _create_opacity_slider(self, parent):
         """Create opacity slider"""
         current_opacity = self.config.get("popup_opacity", 0.95)
         
-        value_label = ctk.CTkLabel(
+        self.opacity_value_label = value_label = ctk.CTkLabel(
             parent,
             text=f"{int(current_opacity * 100)}%",
             font=("Segoe UI", 13, "bold"),
@@ -665,7 +635,7 @@ class SettingsWindow:
         )
         value_label.pack(anchor="w", pady=(0, 10))
         
-        slider = ctk.CTkSlider(
+        self.opacity_slider = slider = ctk.CTkSlider(
             parent,
             from_=0.5,
             to=1.0,
@@ -700,25 +670,23 @@ class SettingsWindow:
             self._refresh_whitelist()
     
     def _refresh_whitelist(self):
-        """Refresh whitelist display"""
-        # Remove existing items
-        for widget in self.whitelist_container.winfo_children():
-            widget.destroy()
-        
-        # Get whitelist
+        """Refresh whitelist display (only adds/removes changed rows)"""
         whitelist = self.config.get_whitelist()
         
-        if not whitelist:
-            empty_label = ctk.CTkLabel(
-                self.whitelist_container,
-                text="No whitelisted applications",
-                font=("Segoe UI", 12),
-                text_color="#666666"
-            )
-            empty_label.pack(pady=20)
+        # Remove rows no longer whitelisted
+        for process in list(self.whitelist_items):
+            if process not in whitelist:
+                self.whitelist_items.pop(process).destroy()
+        
+        # Add rows for new entries
+        for process in whitelist:
+            if process not in self.whitelist_items:
+                self.whitelist_items[process] = self._create_whitelist_item(process)
+        
+        if whitelist:
+            self.whitelist_empty_label.pack_forget()
         else:
-            for process in whitelist:
-                self._create_whitelist_item(process)
+            self.whitelist_empty_label.pack(pady=20)
     
     def _create_whitelist_item(self, process_name):
         """Create whitelist item with async icon loading"""
@@ -764,146 +732,25 @@ class SettingsWindow:
         )
         delete_btn.pack(side="right", padx=10, pady=10)
         
-        # Try to extract icon asynchronously (optional)
-        import threading
-        def load_icon_async():
-            try:
-                icon_image = self._extract_process_icon_simple(process_name)
-                if icon_image and icon_label.winfo_exists():
-                    ctk_image = ctk.CTkImage(
-                        light_image=icon_image,
-                        dark_image=icon_image,
-                        size=(24, 24)
-                    )
+        # Load icon on the shared icon worker pool (cached on disk)
+        def apply_icon(icon_image):
+            if icon_image is None:
+                return
+            def update():
+                if icon_label.winfo_exists():
+                    ctk_image = image_cache.get_ctk_image(icon_image, (24, 24))
                     icon_label.configure(image=ctk_image, text="")
-            except:
-                pass
-        
-        # Load icon in background
-        threading.Thread(target=load_icon_async, daemon=True).start()
-    
-    def _extract_process_icon_simple(self, process_name: str) -> Image.Image:
-        """Extract high-quality icon from process executable (LANCZOS resizing)"""
-        try:
-            # Check only major paths
-            common_paths = [
-                os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'System32', process_name),
-                os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'SysWOW64', process_name),
-                os.path.join(os.environ.get('ProgramFiles', 'C:\\Program Files'), 'Common Files', process_name),
-            ]
-            
-            exe_path = None
-            for path in common_paths:
-                if os.path.exists(path):
-                    exe_path = path
-                    break
-            
-            if not exe_path:
-                return None
-            
-            # Extract high-resolution icon
-            large, small = win32gui.ExtractIconEx(exe_path, 0)
-            
-            # Use large icon (higher quality)
-            icon_handle = large[0] if large else (small[0] if small else None)
-            
-            if icon_handle:
-                # Get icon size
-                ico_x = win32api.GetSystemMetrics(win32con.SM_CXICON)
-                ico_y = win32api.GetSystemMetrics(win32con.SM_CYICON)
-                
-                # Create DC
-                hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
-                hbmp = win32ui.CreateBitmap()
-                hbmp.CreateCompatibleBitmap(hdc, ico_x, ico_y)
-                hdc_mem = hdc.CreateCompatibleDC()
-                hdc_mem.SelectObject(hbmp)
-                
-                # Set transparent background
-                hdc_mem.FillSolidRect((0, 0, ico_x, ico_y), win32api.RGB(0, 0, 0))
-                
-                # Draw icon
-                hdc_mem.DrawIcon((0, 0), icon_handle)
-                
-                # Extract bitmap data
-                bmpstr = hbmp.GetBitmapBits(True)
-                img = Image.frombuffer(
-                    'RGB',
-                    (ico_x, ico_y),
-                    bmpstr, 'raw', 'BGRX', 0, 1
-                )
-                
-                # High-quality resizing with LANCZOS filter
-                img_resized = img.resize((32, 32), Image.Resampling.LANCZOS)
-                
-                # Release resources
-                if large:
-                    for icon in large:
-                        win32gui.DestroyIcon(icon)
-                if small:
-                    for icon in small:
-                        win32gui.DestroyIcon(icon)
-                
-                return img_resized
-            
-        except Exception as e:
-            # Handle failure silently
-            pass
+            self._post_to_ui(update)
         
-        return None
+        icon_cache.request(process_name, 32, apply_icon)
+        return item_frame
     
-    def _extract_process_icon(self, process_name: str) -> Image.Image:
-        """Extract icon from process executable"""
-        try:
-            # Common program paths
-            search_paths = [
-                os.path.join(os.environ.get('ProgramFiles', 'C:\\Program Files'), '**', process_name),
-                os.path.join(os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)'), '**', process_name),
-                os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), '**', process_name),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Programs', '**', process_name),
-            ]
-            
-            # Find executable file
-            import glob
-            exe_path = None
-            for path_pattern in search_paths:
-                matches = glob.glob(path_pattern, recursive=True)
-                if matches:
-                    exe_path = matches[0]
-                    break
-            
-            if not exe_path:
-                return None
-            
-            # Extract icon
-            ico_x = win32api.GetSystemMetrics(win32con.SM_CXICON)
-            ico_y = win32api.GetSystemMetrics(win32con.SM_CYICON)
-            
-            large, small = win32gui.ExtractIconEx(exe_path, 0)
-            if large:
-                win32gui.DestroyIcon(large[0])
-            if small:
-                hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
-                hbmp = win32ui.CreateBitmap()
-                hbmp.CreateCompatibleBitmap(hdc, ico_x, ico_y)
-                hdc = hdc.CreateCompatibleDC()
-                hdc.SelectObject(hbmp)
-                hdc.DrawIcon((0, 0), small[0])
-                
-                bmpstr = hbmp.GetBitmapBits(True)
-                img = Image.frombuffer(
-                    'RGB',
-                    (ico_x, ico_y),
-                    bmpstr, 'raw', 'BGRX', 0, 1
-                )
-                
-                win32gui.DestroyIcon(small[0])
-                return img
-            
-        except Exception as e:
-            print(f"Icon extraction failed ({process_name}): {e}")
-        
-        return None
+    def _post_to_ui(self, callback):
+        """Run callback on the Tk thread"""
+        if self.app:
+            self.app.post_to_ui(callback)
+        elif self.window:
+            self.window.after(0, callback)
     
     def _remove_whitelist_item(self, process_name):
         """Remove whitelist item"""
@@ -911,36 +758,9 @@ class SettingsWindow:
         self._refresh_whitelist()
     
     def _apply_window_icon(self, window):
-        """Apply icon to window with error handling (Windows 11 compatible)"""
-        try:
-            # Get icon path from embedded data
-            icon_path = get_icon_path()
-            
-            if not icon_path:
-                print("[Settings Icon] ✗ Failed to get icon path")
-                return
-            
-            # Verify file existence
-            if not os.path.exists(icon_path):
-                print(f"[Settings Icon] ✗ Temporary icon file not found: {icon_path}")
-                return
-            
-            # Check file size
-            file_size = os.path.getsize(icon_path)
-            if file_size == 0:
-                print(f"[Settings Icon] ✗ Empty icon file: {icon_path}")
-                return
-            
-            print(f"[Settings Icon] ✓ Icon file verified ({file_size} bytes)")
-            
-            # Apply icon to window
-            window.iconbitmap(icon_path)
+        """Apply icon to window (cached icon file, no delay needed)"""
+        if apply_window_icon(window, "Settings Icon"):
             print(f"[Settings Icon] ✓ Successfully applied to settings window")
-            
-        except Exception as e:
-            print(f"[Settings Icon] ✗ Failed to apply icon: {e}")
-            import traceback
-            traceback.print_exc()
     
     def _on_window_close(self):
         """Window close event"""
@@ -1,86 +1,138 @@
 """
 Icon utilities for embedded icon handling
-Creates temporary icon file from Base64 data
+Decodes the embedded icon once and caches the .ico file and pre-rendered sizes
 """
 import base64
+import hashlib
 import os
 import tempfile
-import atexit
+import threading
+from functools import lru_cache
 from utils.icon_data import ICON_DATA
 
-# Global variable to store temp icon path
-_temp_icon_path = None
+# Sizes pre-rendered on first use (window/taskbar icons and the tray)
+ICON_SIZES = (16, 32, 64)
+TRAY_ICON_SIZE = 64
+
+_lock = threading.Lock()
+_icon_path = None
+_base_image = None
+_rendered = {}  # size -> PIL image
+
+
+@lru_cache(maxsize=1)
+def _icon_bytes() -> bytes:
+    """Embedded icon decoded from Base64 (once per process)"""
+    return base64.b64decode(ICON_DATA)
 
 
 def get_icon_path() -> str:
     """
     Get path to icon file.
-    Creates temporary .ico file from embedded Base64 data.
-    File is automatically cleaned up on program exit.
+    Uses one .ico file named after the icon's content hash, so the same file
+    is reused across runs and only rewritten when the icon changes.
     
     Returns:
-        str: Path to temporary icon file
+        str: Path to icon file
     """
-    global _temp_icon_path
+    global _icon_path
     
-    # Return existing path if already created
-    if _temp_icon_path and os.path.exists(_temp_icon_path):
-        return _temp_icon_path
+    if _icon_path:
+        return _icon_path
     
-    try:
-        # Decode Base64 data
-        icon_bytes = base64.b64decode(ICON_DATA)
-        
-        # Create temporary file
-        fd, _temp_icon_path = tempfile.mkstemp(suffix='.ico', prefix='paste_guardian_')
+    with _lock:
+        if _icon_path:
+            return _icon_path
         
-        # Write icon data
-        with os.fdopen(fd, 'wb') as f:
-            f.write(icon_bytes)
-        
-        # Register cleanup on exit
-        atexit.register(_cleanup_temp_icon)
-        
-        print(f"[Icon] Temporary icon created: {_temp_icon_path}")
-        return _temp_icon_path
-        
-    except Exception as e:
-        print(f"[Icon] Failed to create temporary icon: {e}")
-        return None
-
-
-def _cleanup_temp_icon():
-    """Clean up temporary icon file on program exit"""
-    global _temp_icon_path
-    
-    if _temp_icon_path and os.path.exists(_temp_icon_path):
         try:
-            os.remove(_temp_icon_path)
-            print(f"[Icon] Temporary icon cleaned up: {_temp_icon_path}")
-        except:
-            pass
+            icon_bytes = _icon_bytes()
+            digest = hashlib.sha256(icon_bytes).hexdigest()[:16]
+            path = os.path.join(tempfile.gettempdir(), f"paste_guardian_{digest}.ico")
+            
+            # Reuse the file from a previous run if it is intact
+            if not os.path.exists(path) or os.path.getsize(path) != len(icon_bytes):
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(icon_bytes)
+                os.replace(tmp_path, path)
+                print(f"[Icon] Icon file created: {path}")
+            
+            _icon_path = path
+            return _icon_path
+        
+        except Exception as e:
+            print(f"[Icon] Failed to create icon file: {e}")
+            return None
 
 
-def get_icon_image():
+def get_icon_image(size: int = None):
     """
     Get PIL Image object from embedded icon data.
     Useful for pystray and other libraries requiring Image objects.
+    Images are shared - do not modify them in place.
+    
+    Args:
+        size: Edge length in pixels (None = original image)
     
     Returns:
         PIL.Image: Icon as PIL Image object
     """
+    global _base_image
+    
     try:
-        from PIL import Image
-        import io
-        
-        # Decode Base64 data
-        icon_bytes = base64.b64decode(ICON_DATA)
-        
-        # Create Image from bytes
-        img = Image.open(io.BytesIO(icon_bytes))
-        
-        return img
-        
+        with _lock:
+            if _base_image is None:
+                from PIL import Image
+                import io
+                
+                # Decode once and render every standard size in one go
+                image = Image.open(io.BytesIO(_icon_bytes()))
+                image.load()
+                _base_image = image
+                for edge in ICON_SIZES + (TRAY_ICON_SIZE,):
+                    _rendered[edge] = _render(image, edge)
+            
+            if size is None:
+                return _base_image
+            if size not in _rendered:
+                _rendered[size] = _render(_base_image, size)
+            return _rendered[size]
+    
     except Exception as e:
         print(f"[Icon] Failed to create PIL Image: {e}")
         return None
+
+
+def _render(image, size: int):
+    """High-quality square resize (LANCZOS)"""
+    from PIL import Image
+    
+    if image.size == (size, size):
+        return image
+    return image.resize((size, size), Image.Resampling.LANCZOS)
+
+
+def apply_window_icon(window, label: str = "Icon") -> bool:
+    """
+    Apply the application icon to a Tk/CTk window.
+    Call right after creating the window: customtkinter only installs its
+    default icon if iconbitmap() has not been called yet, so no delay is needed.
+    
+    Args:
+        window: Tk or CTk window
+        label: Prefix for log messages
+    
+    Returns:
+        bool: True if the icon was applied
+    """
+    icon_path = get_icon_path()
+    if not icon_path:
+        print(f"[{label}] ✗ Failed to get icon path")
+        return False
+    
+    try:
+        window.iconbitmap(icon_path)
+        return True
+    except Exception as e:
+        print(f"[{label}] ✗ Failed to apply icon: {e}")
+        return False
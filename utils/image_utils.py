@@ -0,0 +1,100 @@
+"""
+Image utilities for preview generation
+Builds popup previews and history thumbnails without full-size copies
+"""
+from typing import Dict, Iterable, Tuple
+
+# Preview sizes used by the UI
+PREVIEW_SIZE = (150, 150)
+HISTORY_THUMBNAIL_SIZE = (40, 40)
+
+
+def fit_size(size: Tuple[int, int], bounds: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Scale size down to fit within bounds, keeping the aspect ratio.
+    
+    Args:
+        size: Original (width, height)
+        bounds: Maximum (width, height)
+    
+    Returns:
+        Scaled (width, height), never larger than the original
+    """
+    width, height = size
+    max_width, max_height = bounds
+    scale = min(max_width / width, max_height / height, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def create_thumbnails(image, sizes: Iterable[Tuple[int, int]] = (PREVIEW_SIZE, HISTORY_THUMBNAIL_SIZE)) -> Dict[Tuple[int, int], object]:
+    """
+    Create downscaled copies of an image for every requested size in one pass.
+    
+    The largest size is produced straight from the source with reduce()-based
+    downsampling, so the full-resolution image is never copied. Smaller sizes
+    are derived from the previous result. The input image is left untouched
+    (it is usually the paste content).
+    
+    Clipboard images arrive already decoded (DIB), so they are always resized
+    from the full frame. Draft-mode decoding only applies to file-backed JPEG
+    sources, which are re-opened separately for it.
+    
+    Args:
+        image: Source PIL image (may still be lazily decoded)
+        sizes: Bounding boxes to produce
+    
+    Returns:
+        Dictionary mapping each requested bounding box to a PIL image
+    """
+    from PIL import Image
+    
+    ordered = sorted(set(sizes), key=lambda s: s[0] * s[1], reverse=True)
+    if not ordered:
+        return {}
+    
+    draft = _open_draft(image, ordered[0])
+    results = {}
+    source = draft or image
+    try:
+        for bounds in ordered:
+            target = fit_size(source.size, bounds)
+            if target == source.size and source is not image:
+                # The draft handle is closed below - keep a loaded copy
+                resized = source.copy() if source is draft else source
+            else:
+                # reducing_gap box-reduces by an integer factor before LANCZOS
+                resized = source.resize(target, Image.Resampling.LANCZOS, reducing_gap=2.0)
+            results[bounds] = resized
+            source = resized
+    finally:
+        if draft is not None:
+            draft.close()
+    
+    return results
+
+
+def _open_draft(image, bounds: Tuple[int, int]):
+    """
+    Open a second handle on a file-backed image, decoding at reduced scale.
+    
+    Args:
+        image: Source PIL image
+        bounds: Largest bounding box that will be produced
+    
+    Returns:
+        Draft-mode PIL image, or None if the source has no file or its
+        decoder has no draft mode (only JPEG does)
+    """
+    filename = getattr(image, "filename", "")
+    if not filename or getattr(image, "format", None) != "JPEG":
+        return None
+    
+    from PIL import Image
+    try:
+        draft = Image.open(filename)
+        if draft.draft("RGB", bounds) is None:
+            draft.close()
+            return None
+        return draft
+    except Exception:
+        return None